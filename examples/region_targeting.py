@@ -6,9 +6,13 @@ This script demonstrates how to design guides for specific
 genomic coordinates rather than gene names.
 """
 
-import os
+import pathlib
 from crispex import design_guides
 
+# Output directory for generated files, created once at import
+OUTPUT_DIR = pathlib.Path(__file__).parent / 'output'
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 def main():
     print("Crispex - Region Targeting Example")
     print("=" * 50)
@@ -22,16 +26,14 @@ def main():
         print(f"Region size: 1,000 bp")
         print()
 
-        # Create output directory
-        output_dir = 'output'
-        os.makedirs(output_dir, exist_ok=True)
-        output_file = os.path.join(output_dir, 'region_guides.csv')
+        output_file = OUTPUT_DIR / 'region_guides.csv'
 
         guides = design_guides(
             region=region,
             species="human",
             top_n=10,
-            output=output_file
+            output=output_file,
+            columns=['guide_sequence', 'start', 'end', 'strand', 'efficiency_score']
         )
 
         print(f"\nFound {len(guides)} guides in region")
@@ -42,8 +44,9 @@ def main():
                                 'efficiency_score']].to_string())
 
             # Analyze strand distribution
-            plus_strand = (guides['strand'] == '+').sum()
-            minus_strand = (guides['strand'] == '-').sum()
+            strand_counts = guides['strand'].value_counts()
+            plus_strand = strand_counts.get('+', 0)
+            minus_strand = strand_counts.get('-', 0)
 
             print(f"\nStrand distribution:")
             print(f"  Plus strand (+): {plus_strand}")
@@ -18,10 +18,16 @@ Prerequisites:
 - Crispex installed: pip install crispex
 """
 
-import os
+import argparse
+import pathlib
 from crispex import design_guides
+from crispex.utils.export import write_csv
 import pandas as pd
 
+# Output directory for generated files, created once at import
+OUTPUT_DIR = pathlib.Path(__file__).parent / 'output'
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 
 def step1_simple_design():
     """Step 1: Design your first guide"""
@@ -33,17 +39,19 @@ def step1_simple_design():
     print()
 
     # Design guides - this is the simplest way to use Crispex
+    # We ask for 20 guides once and reuse this result in the later steps
     guides = design_guides(
         gene="TP53",           # Gene symbol
         species="human",       # Species (human or mouse)
-        top_n=5               # Number of top guides to return
+        top_n=20,              # Number of top guides to return
+        use_cache=True         # Reuse results on rerun (~/.cache/crispex, 1 week)
     )
 
     print(f"✓ Found {len(guides)} guides for TP53")
     print()
 
     # Let's look at what we got
-    print("Here's what the results look like:")
+    print("Here's what the top 5 results look like:")
     print()
     print(guides[['rank', 'guide_sequence', 'efficiency_score']].head())
     print()
@@ -119,7 +127,7 @@ def step3_compare_guides(guides):
     print()
 
     # Find guide with best specificity
-    best_specific = guides.loc[guides['off_targets_1mm'].idxmin()]
+    best_specific = guides.nsmallest(1, 'off_targets_1mm').iloc[0]
     print(f"Most specific guide (fewest 1MM off-targets):")
     print(f"  Rank #{best_specific['rank']}: {best_specific['guide_sequence']}")
     print(f"  Off-targets (1MM): {best_specific['off_targets_1mm']}")
@@ -133,13 +141,9 @@ def step4_save_results(guides):
     print("=" * 70)
     print()
 
-    # Create output directory
-    output_dir = 'output'
-    os.makedirs(output_dir, exist_ok=True)
-
     # Save to CSV
-    output_file = os.path.join(output_dir, 'tutorial_tp53_guides.csv')
-    guides.to_csv(output_file, index=False)
+    output_file = OUTPUT_DIR / 'tutorial_tp53_guides.csv'
+    write_csv(guides, output_file)
 
     print(f"✓ Saved {len(guides)} guides to: {output_file}")
     print()
@@ -162,17 +166,15 @@ def step5_design_workflow():
     print("automatic file saving:")
     print()
 
-    # Create output directory
-    output_dir = 'output'
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, 'brca1_guides.csv')
+    output_file = OUTPUT_DIR / 'brca1_guides.csv'
 
     # Design with output parameter
     guides = design_guides(
         gene="BRCA1",
         species="human",
         top_n=10,
-        output=output_file    # Automatically saves to this file
+        output=output_file,   # Automatically saves to this file
+        use_cache=True
     )
 
     print(f"✓ Designed {len(guides)} guides for BRCA1")
@@ -187,7 +189,7 @@ def step5_design_workflow():
     print()
 
 
-def main():
+def main(interactive: bool = True):
     """Run the complete beginner tutorial"""
     print()
     print("╔" + "=" * 68 + "╗")
@@ -197,24 +199,29 @@ def main():
     print()
 
     try:
-        # Step 1: Simple design
-        guides = step1_simple_design()
-        input("Press Enter to continue to Step 2...")
+        # Step 1: Simple design (single request, smaller views reused below)
+        tp53_guides = step1_simple_design()
+        guides = tp53_guides.head(5)
+        if interactive:
+            input("Press Enter to continue to Step 2...")
         print()
 
         # Step 2: Understand results
         step2_understand_results(guides)
-        input("Press Enter to continue to Step 3...")
+        if interactive:
+            input("Press Enter to continue to Step 3...")
         print()
 
         # Step 3: Compare guides
         step3_compare_guides(guides)
-        input("Press Enter to continue to Step 4...")
+        if interactive:
+            input("Press Enter to continue to Step 4...")
         print()
 
         # Step 4: Save results
-        step4_save_results(guides)
-        input("Press Enter to continue to Step 5...")
+        step4_save_results(tp53_guides)
+        if interactive:
+            input("Press Enter to continue to Step 5...")
         print()
 
         # Step 5: Complete workflow
@@ -241,5 +248,17 @@ def main():
         print()
 
 
+def parse_args():
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Crispex beginner tutorial")
+    parser.add_argument(
+        '--interactive',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Pause between steps (use --no-interactive for unattended runs)"
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    main(interactive=parse_args().interactive)
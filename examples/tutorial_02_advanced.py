@@ -17,10 +17,17 @@ Prerequisites:
 - Understanding of basic genomics concepts
 """
 
-import os
-from crispex import design_guides
+import argparse
+import pathlib
+from crispex import design_guides, design_guides_batch
+from crispex.utils.export import write_csv
+import numpy as np
 import pandas as pd
 
+# Output directory for generated files, created once at import
+OUTPUT_DIR = pathlib.Path(__file__).parent / 'output'
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 
 def example1_region_targeting():
     """Example 1: Target specific genomic regions"""
@@ -46,7 +53,8 @@ def example1_region_targeting():
     guides = design_guides(
         region=region,
         species="human",
-        top_n=10
+        top_n=10,
+        use_cache=True  # Reuse results on rerun (~/.cache/crispex, 1 week)
     )
 
     print(f"✓ Found {len(guides)} guides in this 500bp region")
@@ -60,8 +68,9 @@ def example1_region_targeting():
     print()
 
     # Strand distribution
-    plus_guides = (guides['strand'] == '+').sum()
-    minus_guides = (guides['strand'] == '-').sum()
+    strand_counts = guides['strand'].value_counts()
+    plus_guides = strand_counts.get('+', 0)
+    minus_guides = strand_counts.get('-', 0)
     print("Strand distribution:")
     print(f"  Plus strand (+):  {plus_guides} guides")
     print(f"  Minus strand (-): {minus_guides} guides")
@@ -84,7 +93,8 @@ def example2_custom_filtering():
     guides = design_guides(
         gene="KRAS",
         species="human",
-        top_n=20
+        top_n=20,
+        use_cache=True
     )
 
     print(f"Starting with {len(guides)} guides for KRAS")
@@ -106,8 +116,7 @@ def example2_custom_filtering():
     balanced_guides = guides[
         (guides['efficiency_score'] >= 70) &
         (guides['off_targets_1mm'] <= 2) &
-        (guides['gc_content'] >= 40) &
-        (guides['gc_content'] <= 60)
+        guides['gc_content'].between(40, 60)
     ]
     print(f"  Found {len(balanced_guides)} balanced guides")
     if len(balanced_guides) > 0:
@@ -118,8 +127,11 @@ def example2_custom_filtering():
     print("Filter 3: Maximum efficiency (for hard targets)")
     high_efficiency = guides.nlargest(5, 'efficiency_score')
     print(f"  Top 5 by efficiency:")
-    for idx, guide in high_efficiency.iterrows():
-        print(f"    {guide['guide_sequence']}: {guide['efficiency_score']:.1f}")
+    high_rows = high_efficiency[['guide_sequence', 'efficiency_score']].itertuples(
+        index=False, name=None
+    )
+    for seq, eff in high_rows:
+        print(f"    {seq}: {eff:.1f}")
     print()
 
 
@@ -134,36 +146,47 @@ def example3_batch_comparison():
     print()
 
     genes = ["TP53", "BRCA1", "BRCA2"]
-    results = {}
 
-    for gene in genes:
-        print(f"Designing guides for {gene}...", end=" ")
-        guides = design_guides(gene=gene, species="human", top_n=5)
-        results[gene] = guides
-        print(f"✓ {len(guides)} guides")
+    # Design all genes in one batch (concurrent fetch, single scoring pass)
+    print(f"Designing guides for {', '.join(genes)}...")
+    results = design_guides_batch(genes, species="human", top_n=5)
+
+    for gene, guides in results.items():
+        print(f"  {gene}: ✓ {len(guides)} guides")
 
     print()
     print("Comparison across genes:")
     print()
 
-    # Create comparison table
-    comparison_data = []
-    for gene, guides in results.items():
-        comparison_data.append({
-            'Gene': gene,
-            'Num Guides': len(guides),
-            'Mean Efficiency': guides['efficiency_score'].mean(),
-            'Max Efficiency': guides['efficiency_score'].max(),
-            'Mean Off-targets': guides['off_targets_1mm'].mean(),
-            'Best GC%': guides.iloc[0]['gc_content']
-        })
-
-    comparison_df = pd.DataFrame(comparison_data)
+    # Create comparison table column-wise from preallocated arrays
+    n = len(results)
+    num_guides = np.empty(n, dtype=np.int64)
+    mean_eff = np.empty(n, dtype=np.float64)
+    max_eff = np.empty(n, dtype=np.float64)
+    mean_ot = np.empty(n, dtype=np.float64)
+    best_gc = np.empty(n, dtype=np.float64)
+
+    for i, guides in enumerate(results.values()):
+        efficiency = guides['efficiency_score'].to_numpy()
+        num_guides[i] = len(guides)
+        mean_eff[i] = efficiency.mean()
+        max_eff[i] = efficiency.max()
+        mean_ot[i] = guides['off_targets_1mm'].to_numpy().mean()
+        best_gc[i] = guides['gc_content'].iat[0]
+
+    comparison_df = pd.DataFrame({
+        'Gene': list(results),
+        'Num Guides': num_guides,
+        'Mean Efficiency': mean_eff,
+        'Max Efficiency': max_eff,
+        'Mean Off-targets': mean_ot,
+        'Best GC%': best_gc,
+    })
     print(comparison_df.to_string(index=False))
     print()
 
     # Find easiest gene to target
-    best_gene = comparison_df.loc[comparison_df['Mean Efficiency'].idxmax(), 'Gene']
+    best_gene = comparison_df.nlargest(1, 'Mean Efficiency')['Gene'].iat[0]
     print(f"Easiest to target (highest mean efficiency): {best_gene}")
     print()
 
@@ -175,31 +198,31 @@ def example4_quality_control():
     print("=" * 70)
     print()
 
-    guides = design_guides(gene="MYC", species="human", top_n=15)
+    guides = design_guides(gene="MYC", species="human", top_n=15, use_cache=True)
 
     print(f"Performing QC on {len(guides)} MYC guides...")
     print()
 
     # Check 1: GC content distribution
     print("Check 1: GC Content Distribution")
-    optimal_gc = guides[
-        (guides['gc_content'] >= 40) &
-        (guides['gc_content'] <= 60)
-    ]
-    print(f"  Optimal GC% (40-60%): {len(optimal_gc)}/{len(guides)} guides")
-    print(f"  Mean GC%: {guides['gc_content'].mean():.1f}%")
-    print(f"  Range: {guides['gc_content'].min():.1f}% - {guides['gc_content'].max():.1f}%")
+    optimal_gc = guides['gc_content'].between(40, 60).sum()
+    gc_stats = guides['gc_content'].agg(['mean', 'min', 'max'])
+    print(f"  Optimal GC% (40-60%): {optimal_gc}/{len(guides)} guides")
+    print(f"  Mean GC%: {gc_stats['mean']:.1f}%")
+    print(f"  Range: {gc_stats['min']:.1f}% - {gc_stats['max']:.1f}%")
     print()
 
-    # Check 2: Efficiency distribution
+    # Check 2: Efficiency distribution (bin once instead of three masks)
     print("Check 2: Efficiency Distribution")
-    high_eff = (guides['efficiency_score'] >= 70).sum()
-    medium_eff = ((guides['efficiency_score'] >= 60) &
-                  (guides['efficiency_score'] < 70)).sum()
-    low_eff = (guides['efficiency_score'] < 60).sum()
-    print(f"  High (≥70):   {high_eff} guides")
-    print(f"  Medium (60-69): {medium_eff} guides")
-    print(f"  Low (<60):    {low_eff} guides")
+    eff_bins = pd.cut(
+        guides['efficiency_score'],
+        bins=[float('-inf'), 60, 70, float('inf')],
+        labels=['low', 'medium', 'high'],
+        right=False
+    ).value_counts()
+    print(f"  High (≥70):   {eff_bins['high']} guides")
+    print(f"  Medium (60-69): {eff_bins['medium']} guides")
+    print(f"  Low (<60):    {eff_bins['low']} guides")
     print()
 
     # Check 3: Off-target burden
@@ -213,12 +236,21 @@ def example4_quality_control():
 
     # Check 4: Identify potential issues
     print("Check 4: Flag Potential Issues")
-    issues = []
-    for idx, guide in guides.iterrows():
-        if guide['gc_content'] < 30 or guide['gc_content'] > 70:
-            issues.append(f"  Guide #{guide['rank']}: Extreme GC% ({guide['gc_content']:.0f}%)")
-        if guide['off_targets_1mm'] > 5:
-            issues.append(f"  Guide #{guide['rank']}: High off-targets ({guide['off_targets_1mm']})")
+    # Flag whole columns at once instead of looping over rows
+    bad_gc = (guides['gc_content'] < 30) | (guides['gc_content'] > 70)
+    bad_ot = guides['off_targets_1mm'] > 5
+
+    gc_issues = (
+        "  Guide #" + guides.loc[bad_gc, 'rank'].astype(str) +
+        ": Extreme GC% (" +
+        guides.loc[bad_gc, 'gc_content'].round().astype(int).astype(str) + "%)"
+    )
+    ot_issues = (
+        "  Guide #" + guides.loc[bad_ot, 'rank'].astype(str) +
+        ": High off-targets (" +
+        guides.loc[bad_ot, 'off_targets_1mm'].astype(str) + ")"
+    )
+    issues = gc_issues.tolist() + ot_issues.tolist()
 
     if issues:
         print(f"  Found {len(issues)} potential issues:")
@@ -236,40 +268,46 @@ def example5_experimental_design():
     print("=" * 70)
     print()
 
-    guides = design_guides(gene="EGFR", species="human", top_n=20)
+    guides = design_guides(gene="EGFR", species="human", top_n=20, use_cache=True)
 
     print("Scenario 1: Knockout experiment (need high efficiency)")
     print("-" * 70)
     knockout_guides = guides.nlargest(3, 'efficiency_score')
     print("Top 3 guides for knockout:")
-    for i, (idx, guide) in enumerate(knockout_guides.iterrows(), 1):
-        print(f"  {i}. {guide['guide_sequence']}")
-        print(f"     Efficiency: {guide['efficiency_score']:.1f}, "
-              f"Off-targets: {guide['off_targets_1mm']}")
+    knockout_rows = knockout_guides[
+        ['guide_sequence', 'efficiency_score', 'off_targets_1mm']
+    ].itertuples(index=False, name=None)
+    for i, (seq, eff, ot) in enumerate(knockout_rows, 1):
+        print(f"  {i}. {seq}")
+        print(f"     Efficiency: {eff:.1f}, Off-targets: {ot}")
     print()
 
     print("Scenario 2: Clinical application (need ultra-specificity)")
     print("-" * 70)
     clinical_guides = guides[guides['off_targets_1mm'] == 0].head(3)
     print(f"Top {len(clinical_guides)} ultra-specific guides:")
-    for i, (idx, guide) in enumerate(clinical_guides.iterrows(), 1):
-        print(f"  {i}. {guide['guide_sequence']}")
-        print(f"     Efficiency: {guide['efficiency_score']:.1f}, "
-              f"1MM off-targets: {guide['off_targets_1mm']}")
+    clinical_rows = clinical_guides[
+        ['guide_sequence', 'efficiency_score', 'off_targets_1mm']
+    ].itertuples(index=False, name=None)
+    for i, (seq, eff, ot) in enumerate(clinical_rows, 1):
+        print(f"  {i}. {seq}")
+        print(f"     Efficiency: {eff:.1f}, 1MM off-targets: {ot}")
     print()
 
     print("Scenario 3: Multiplexing (need diverse positions)")
     print("-" * 70)
     # Select guides spread across the gene
-    sorted_by_position = guides.sort_values('start')
-    multiplex_guides = [
-        sorted_by_position.iloc[0],
-        sorted_by_position.iloc[len(sorted_by_position)//2],
-        sorted_by_position.iloc[-1]
-    ]
+    # Only the first, middle and last positions are needed, so partition
+    # around them instead of sorting the whole frame
+    starts = guides['start'].to_numpy()
+    picks = [0, len(starts) // 2, len(starts) - 1]
+    multiplex_guides = guides.iloc[np.argpartition(starts, picks)[picks]]
     print("3 guides spanning the gene:")
-    for i, guide in enumerate(multiplex_guides, 1):
-        print(f"  {i}. Position {guide['start']:,}: {guide['guide_sequence']}")
+    multiplex_rows = multiplex_guides[['start', 'guide_sequence']].itertuples(
+        index=False, name=None
+    )
+    for i, (start, seq) in enumerate(multiplex_rows, 1):
+        print(f"  {i}. Position {start:,}: {seq}")
     print()
 
 
@@ -280,42 +318,38 @@ def example6_export_formats():
     print("=" * 70)
     print()
 
-    guides = design_guides(gene="PTEN", species="human", top_n=5)
-
-    # Create output directory
-    output_dir = 'output'
-    os.makedirs(output_dir, exist_ok=True)
+    guides = design_guides(gene="PTEN", species="human", top_n=5, use_cache=True)
 
     # Export 1: Full CSV with all columns
-    full_csv = os.path.join(output_dir, 'pten_guides_full.csv')
-    guides.to_csv(full_csv, index=False)
+    full_csv = OUTPUT_DIR / 'pten_guides_full.csv'
+    write_csv(guides, full_csv)
     print(f"✓ Full data: {full_csv}")
 
     # Export 2: Minimal CSV for ordering
-    minimal_csv = os.path.join(output_dir, 'pten_guides_order.csv')
-    guides[['rank', 'guide_sequence', 'full_sequence']].to_csv(
-        minimal_csv, index=False
-    )
+    minimal_csv = OUTPUT_DIR / 'pten_guides_order.csv'
+    write_csv(guides[['rank', 'guide_sequence', 'full_sequence']], minimal_csv)
     print(f"✓ Ordering sheet: {minimal_csv}")
 
     # Export 3: Summary report
-    report_file = os.path.join(output_dir, 'pten_guides_report.txt')
-    with open(report_file, 'w') as f:
-        f.write("CRISPEX GUIDE DESIGN REPORT\n")
-        f.write("=" * 50 + "\n\n")
-        f.write(f"Gene: PTEN\n")
-        f.write(f"Species: Human\n")
-        f.write(f"Number of guides: {len(guides)}\n\n")
-        f.write("TOP GUIDE:\n")
-        top = guides.iloc[0]
-        f.write(f"  Sequence: {top['guide_sequence']}\n")
-        f.write(f"  Efficiency: {top['efficiency_score']:.1f}\n")
-        f.write(f"  Off-targets: {top['off_targets_1mm']} (1MM)\n")
+    report_file = OUTPUT_DIR / 'pten_guides_report.txt'
+    top = guides.iloc[0]
+    report = (
+        "CRISPEX GUIDE DESIGN REPORT\n"
+        f"{'=' * 50}\n\n"
+        "Gene: PTEN\n"
+        "Species: Human\n"
+        f"Number of guides: {len(guides)}\n\n"
+        "TOP GUIDE:\n"
+        f"  Sequence: {top['guide_sequence']}\n"
+        f"  Efficiency: {top['efficiency_score']:.1f}\n"
+        f"  Off-targets: {top['off_targets_1mm']} (1MM)\n"
+    )
+    report_file.write_text(report)
     print(f"✓ Summary report: {report_file}")
     print()
 
 
-def main():
+def main(interactive: bool = True):
     """Run the advanced tutorial"""
     print()
     print("╔" + "=" * 68 + "╗")
@@ -326,23 +360,28 @@ def main():
 
     try:
         example1_region_targeting()
-        input("Press Enter for next example...")
+        if interactive:
+            input("Press Enter for next example...")
         print()
 
         example2_custom_filtering()
-        input("Press Enter for next example...")
+        if interactive:
+            input("Press Enter for next example...")
         print()
 
         example3_batch_comparison()
-        input("Press Enter for next example...")
+        if interactive:
+            input("Press Enter for next example...")
         print()
 
         example4_quality_control()
-        input("Press Enter for next example...")
+        if interactive:
+            input("Press Enter for next example...")
         print()
 
         example5_experimental_design()
-        input("Press Enter for next example...")
+        if interactive:
+            input("Press Enter for next example...")
         print()
 
         example6_export_formats()
@@ -369,5 +408,17 @@ def main():
         print()
 
 
+def parse_args():
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Crispex advanced tutorial")
+    parser.add_argument(
+        '--interactive',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Pause between steps (use --no-interactive for unattended runs)"
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    main(interactive=parse_args().interactive)
@@ -4,13 +4,39 @@ Crispex - AI-powered CRISPR sgRNA design
 Main module providing the public API for guide design.
 """
 
-from crispex.api import design_guides
+from typing import Any
+
 from crispex.utils.errors import CrispexError, GeneNotFoundError, GenomeNotInstalledError
 
 __version__ = "0.1.0"
+
 __all__ = [
     "design_guides",
+    "design_guides_batch",
+    "update_gene_cache",
+    "clear_gene_cache",
     "CrispexError",
     "GeneNotFoundError",
     "GenomeNotInstalledError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the pipeline on first use so `import crispex` stays fast"""
+    if name == "design_guides":
+        from crispex.api import design_guides as _design_guides
+        from crispex.utils.cache import disk_cached
+
+        # Public entry point memoizes results on disk (see crispex.utils.cache)
+        value = disk_cached(_design_guides)
+    elif name == "design_guides_batch":
+        from crispex.api import design_guides_batch as value
+    elif name == "update_gene_cache":
+        from crispex.core.fetch import update_gene_cache as value
+    elif name == "clear_gene_cache":
+        from crispex.core.fetch import clear_gene_cache as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
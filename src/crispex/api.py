@@ -1,22 +1,38 @@
 """Main API for Crispex guide design"""
 
 import pandas as pd
-from typing import Optional
-from crispex.utils.validate import validate_design_inputs
-from crispex.utils.export import guides_to_dataframe, save_to_csv, format_output_filename
-from crispex.core.fetch import fetch_gene_sequence
+from typing import Dict, List, Optional
+from crispex.utils.validate import validate_design_inputs, validate_gene_design_inputs
+from crispex.utils.export import (
+    guides_to_dataframe, save_to_csv, format_output_filename, resolve_columns
+)
+from crispex.core.fetch import fetch_gene_sequence, fetch_gene_sequences
 from crispex.core.extract import extract_guides
 from crispex.core.predict import predict_efficiency_scores
 from crispex.core.offtarget import search_off_targets
 from crispex.core.rank import rank_guides, select_top_guides
 
 
+# Low-cardinality columns returned as pandas categoricals
+CATEGORICAL_COLUMNS = {
+    'chromosome': 'category',
+    'strand': 'category',
+    'gene_name': 'category',
+}
+
+
+def _as_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the low-cardinality columns present in df to categoricals"""
+    return df.astype({c: t for c, t in CATEGORICAL_COLUMNS.items() if c in df.columns})
+
+
 def design_guides(
     gene: Optional[str] = None,
     region: Optional[str] = None,
     species: str = "human",
     top_n: int = 5,
     output: Optional[str] = None,
+    columns: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """Design sgRNA guides for a gene or genomic region
 
@@ -35,9 +51,12 @@ def design_guides(
         species: Species name ("human" or "mouse")
         top_n: Number of top guides to return (1-100)
         output: Output CSV file path (optional, auto-generated if not provided)
+        columns: Columns to include in the returned DataFrame (default: all).
+            The CSV export always contains every column.
 
     Returns:
-        pandas DataFrame with ranked guides
+        pandas DataFrame with ranked guides (chromosome, strand and gene_name
+        are categorical columns)
 
     Raises:
         InvalidInputError: If inputs are invalid
@@ -57,8 +76,12 @@ def design_guides(
         ...     top_n=10,
         ...     output="my_guides.csv"
         ... )
+
+        >>> # Only materialize the columns you need
+        >>> guides = design_guides(gene="TP53", columns=["guide_sequence", "efficiency_score"])
     """
     # Step 1: Validate inputs
+    columns = resolve_columns(columns)
     validated = validate_design_inputs(
         gene=gene,
         region=region,
@@ -108,12 +131,13 @@ def design_guides(
         gene_name=gene_name,
         pam_type='SpCas9',
         guide_length=20,
-        apply_filters=True
+        apply_filters=True,
+        assume_upper=True  # Ensembl sequences are uppercased on fetch
     )
 
     if not guides:
         # Return empty DataFrame if no guides found
-        return guides_to_dataframe([])
+        return _as_categoricals(guides_to_dataframe([], columns=columns))
 
     # Step 4: Predict on-target efficiency
     guides = predict_efficiency_scores(guides)
@@ -128,7 +152,7 @@ def design_guides(
     top_guides = select_top_guides(guides, top_n=top_n)
 
     # Step 8: Convert to DataFrame
-    df = guides_to_dataframe(top_guides)
+    df = _as_categoricals(guides_to_dataframe(top_guides, columns=columns))
 
     # Step 9: Save to CSV if output path specified
     if output:
@@ -139,3 +163,78 @@ def design_guides(
         save_to_csv(top_guides, auto_filename)
 
     return df
+
+
+def design_guides_batch(
+    genes: List[str],
+    species: str = "human",
+    top_n: int = 5,
+) -> Dict[str, pd.DataFrame]:
+    """Design sgRNA guides for several genes in one batch
+
+    Gene sequences are fetched with batched Ensembl requests, and candidate guides
+    from all genes are scored and off-target searched together in a single
+    pass before being ranked per gene. Unlike design_guides, no CSV files are
+    written.
+
+    Args:
+        genes: Gene symbols (e.g., ["TP53", "BRCA1", "BRCA2"])
+        species: Species name ("human" or "mouse")
+        top_n: Number of top guides to return per gene (1-100)
+
+    Returns:
+        Dictionary mapping normalized gene symbol to a DataFrame of ranked guides
+
+    Raises:
+        InvalidInputError: If inputs are invalid
+        GeneNotFoundError: If any gene is not found
+        APIError: If Ensembl API fails
+
+    Examples:
+        >>> results = design_guides_batch(["TP53", "BRCA1"], species="human", top_n=5)
+        >>> print(results["TP53"].head())
+    """
+    # Step 1: Validate inputs
+    validated = [
+        validate_gene_design_inputs(gene, species, top_n)
+        for gene in genes
+    ]
+
+    if not validated:
+        return {}
+
+    species = validated[0]['species']
+    top_n = validated[0]['top_n']
+    symbols = [v['gene'] for v in validated]
+
+    # Step 2: Fetch all gene sequences with batched requests
+    gene_data = fetch_gene_sequences(symbols, species)
+
+    # Step 3: Extract candidate guides per gene
+    guides_per_gene = [
+        extract_guides(
+            sequence=data['sequence'],
+            chromosome=data['chromosome'],
+            start_position=data['start'],
+            gene_name=data['gene_symbol'],
+            pam_type='SpCas9',
+            guide_length=20,
+            apply_filters=True,
+            assume_upper=True  # Ensembl sequences are uppercased on fetch
+        )
+        for data in gene_data
+    ]
+
+    # Steps 4-5: Score and search off-targets for all genes in one pass
+    all_guides = [guide for guides in guides_per_gene for guide in guides]
+    if all_guides:
+        predict_efficiency_scores(all_guides)
+        search_off_targets(all_guides, species=species)
+
+    # Steps 6-8: Rank, select and convert per gene
+    return {
+        symbol: _as_categoricals(guides_to_dataframe(
+            select_top_guides(rank_guides(guides), top_n=top_n)
+        ))
+        for symbol, guides in zip(symbols, guides_per_gene)
+    }
@@ -2,9 +2,6 @@
 
 import click
 import sys
-from crispex.api import design_guides
-from crispex.utils.errors import CrispexError, GeneNotFoundError, GenomeNotInstalledError
-from crispex.utils.export import format_output_filename, print_guide_summary, print_summary_table
 from crispex import __version__
 
 
@@ -56,6 +53,10 @@ def design(gene, region, species, output, top_n):
       • Gene symbols are case-insensitive
       • Coordinates use 1-based indexing (same as genome browsers)
     """
+    from crispex.api import design_guides
+    from crispex.utils.errors import CrispexError, GeneNotFoundError, GenomeNotInstalledError
+    from crispex.utils.export import format_output_filename
+
     # Print header
     click.echo()
     click.echo("╔" + "═" * 70 + "╗")
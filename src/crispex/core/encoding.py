@@ -0,0 +1,241 @@
+"""Integer encodings of DNA sequences for vectorized operations
+
+Nucleotides are encoded as A=0, C=1, G=2, T=3 and any other character as 4.
+Sequences of up to 32bp can be packed into a single uint64 with 2 bits per
+base, base i occupying bits 2i and 2i+1. The same layout is used for single
+sequences packed into Python ints.
+"""
+
+import functools
+from typing import List, Optional
+
+import numpy as np
+
+
+# Lookup table mapping ASCII byte -> nucleotide code
+BASE_CODES = np.full(256, 4, dtype=np.uint8)
+BASE_CODES[[ord('A'), ord('C'), ord('G'), ord('T')]] = [0, 1, 2, 3]
+
+# Nucleotide code -> ASCII byte
+CODE_BASES = np.frombuffer(b'ACGTN', dtype=np.uint8)
+
+# str.translate table mapping bases to base-4 digit characters
+_DIGIT_TABLE = str.maketrans('ACGT', '0123')
+
+# Low bit of every 2-bit lane in a packed uint64
+LANE_LOW_BITS = np.uint64(0x5555555555555555)
+
+# Number of set bits for every byte value
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def encode_sequence(sequence: str) -> np.ndarray:
+    """Encode a DNA sequence as nucleotide codes
+
+    Args:
+        sequence: Uppercase DNA sequence
+
+    Returns:
+        uint8 array of codes (A=0, C=1, G=2, T=3, other=4)
+    """
+    return BASE_CODES[np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)]
+
+
+def encode_sequences(sequences: List[str]) -> np.ndarray:
+    """Encode equal-length DNA sequences as a code matrix
+
+    Args:
+        sequences: Uppercase DNA sequences, all of the same length
+
+    Returns:
+        uint8 array of shape (len(sequences), length)
+    """
+    if not sequences:
+        return np.empty((0, 0), dtype=np.uint8)
+
+    length = len(sequences[0])
+    raw = np.frombuffer(''.join(sequences).encode('ascii'), dtype=np.uint8)
+    return BASE_CODES[raw].reshape(len(sequences), length)
+
+
+def decode_sequences(codes: np.ndarray) -> List[str]:
+    """Decode a code matrix back to DNA sequences
+
+    Args:
+        codes: uint8 array of shape (N, L); codes >= 4 decode to 'N'
+
+    Returns:
+        List of N sequences of length L
+    """
+    n, length = codes.shape
+    if n == 0 or length == 0:
+        return [''] * n
+
+    joined = CODE_BASES[np.minimum(codes, 4)].tobytes().decode('ascii')
+    return [joined[i:i + length] for i in range(0, len(joined), length)]
+
+
+def pack_sequence(sequence: str) -> int:
+    """Pack a DNA sequence into an integer, 2 bits per base
+
+    Args:
+        sequence: Uppercase DNA sequence containing only A, C, G and T
+
+    Returns:
+        Packed sequence (base i in bits 2i and 2i+1)
+
+    Raises:
+        ValueError: If the sequence is empty or contains other characters
+    """
+    # int() would also accept signs, underscores and whitespace
+    if not sequence or sequence.strip('ACGT'):
+        raise ValueError(f"Cannot pack non-ACGT sequence: {sequence!r}")
+
+    # Reversed so that base 0 becomes the least significant base-4 digit
+    return int(sequence[::-1].translate(_DIGIT_TABLE), 4)
+
+
+@functools.lru_cache(maxsize=None)
+def _lane_mask(length: int) -> int:
+    """Integer with the low bit of each of the first length 2-bit lanes set"""
+    return int('01' * length, 2)
+
+
+def packed_gc_count(packed: int, length: int) -> int:
+    """Count G and C bases in a packed sequence
+
+    C (01) and G (10) are the only codes whose two bits differ.
+
+    Args:
+        packed: Sequence packed with pack_sequence
+        length: Sequence length in bp
+
+    Returns:
+        Number of G and C bases
+    """
+    return bin((packed ^ (packed >> 1)) & _lane_mask(length)).count('1')
+
+
+def packed_has_run(
+    packed: np.ndarray,
+    length: int,
+    run_length: int,
+    base: Optional[int] = None
+) -> np.ndarray:
+    """Detect homopolymer runs in packed sequences with bitwise operations
+
+    Each lane is compared with the next one (or with the requested base) in
+    a single XOR, and a run of k bases is found by ANDing shifted copies of
+    the per-lane equality bits, with no per-base loop.
+
+    Args:
+        packed: uint64 sequences packed with pack_2bit (only A, C, G, T)
+        length: Sequence length in bp (at most 32)
+        run_length: Run length to detect
+        base: Only detect runs of this nucleotide code (default: any)
+
+    Returns:
+        Boolean array, True where a run of run_length identical bases occurs
+    """
+    packed = np.asarray(packed, dtype=np.uint64)
+    if run_length <= 0 or (run_length == 1 and base is None):
+        return np.full(packed.shape, length >= max(run_length, 0), dtype=bool)
+    if length < run_length:
+        return np.zeros(packed.shape, dtype=bool)
+
+    one = np.uint64(1)
+    if base is None:
+        # Low bit of lane i set where base i equals base i + 1
+        diff = packed ^ (packed >> np.uint64(2))
+        flags = ~(diff | (diff >> one)) & np.uint64(_lane_mask(length - 1))
+        span = run_length - 1
+    else:
+        # Low bit of lane i set where base i equals base
+        diff = packed ^ np.uint64(_lane_mask(length) * base)
+        flags = ~(diff | (diff >> one)) & np.uint64(_lane_mask(length))
+        span = run_length
+
+    runs = flags
+    for offset in range(1, span):
+        runs = runs & (flags >> np.uint64(2 * offset))
+    return runs != 0
+
+
+def distinct_kmer_counts(codes: np.ndarray, k: int = 4, chunk_size: int = 1 << 16) -> np.ndarray:
+    """Count distinct k-mers in each row of a code matrix
+
+    Each k-mer is hashed to its 2k-bit value with a rolling 2-bit shift,
+    and presence is marked in a 4**k entry bitmap per row.
+
+    Args:
+        codes: Code matrix of shape (N, L) with codes < 4 and L >= k
+        k: k-mer length (4**k bitmap entries per row)
+        chunk_size: Rows per bitmap, bounding memory to chunk_size * 4**k bytes
+
+    Returns:
+        int64 array of shape (N,)
+    """
+    n, length = codes.shape
+    n_kmers = length - k + 1
+
+    kmer_ids = np.zeros((n, n_kmers), dtype=np.int64)
+    for offset in range(k):
+        kmer_ids = (kmer_ids << 2) | codes[:, offset:offset + n_kmers]
+
+    counts = np.empty(n, dtype=np.int64)
+    for start in range(0, n, chunk_size):
+        ids = kmer_ids[start:start + chunk_size]
+        seen = np.zeros((len(ids), 4 ** k), dtype=bool)
+        seen[np.arange(len(ids))[:, None], ids] = True
+        counts[start:start + len(ids)] = seen.sum(axis=1)
+    return counts
+
+
+def pack_2bit(codes: np.ndarray) -> np.ndarray:
+    """Pack rows of nucleotide codes into uint64, 2 bits per base
+
+    Args:
+        codes: Code matrix of shape (N, L) with L <= 32 and codes < 4
+
+    Returns:
+        uint64 array of shape (N,)
+    """
+    codes = np.atleast_2d(codes)
+    if codes.shape[1] > 32:
+        raise ValueError(f"Cannot pack sequences longer than 32bp, got {codes.shape[1]}")
+
+    shifts = (2 * np.arange(codes.shape[1])).astype(np.uint64)
+    return np.bitwise_or.reduce(codes.astype(np.uint64) << shifts, axis=1)
+
+
+def popcount64(values: np.ndarray) -> np.ndarray:
+    """Count set bits of each uint64 value
+
+    Args:
+        values: uint64 array
+
+    Returns:
+        Array of bit counts with the same shape as values
+    """
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return np.bitwise_count(values)
+
+    return _POPCOUNT8[values.view(np.uint8)].reshape(values.shape + (8,)).sum(axis=-1)
+
+
+def count_base_differences(packed_a: np.ndarray, packed_b: np.ndarray) -> np.ndarray:
+    """Count differing bases between packed sequences
+
+    Args:
+        packed_a: uint64 packed sequences
+        packed_b: uint64 packed sequences (broadcast against packed_a)
+
+    Returns:
+        Number of mismatching bases for each pair
+    """
+    xor = np.bitwise_xor(packed_a, packed_b)
+    # A lane differs if either of its two bits differs
+    lane_diff = (xor | (xor >> np.uint64(1))) & LANE_LOW_BITS
+    return popcount64(lane_diff)
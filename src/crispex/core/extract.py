@@ -1,9 +1,13 @@
 """Guide extraction and filtering logic"""
 
-import re
-from typing import List, Optional
-from Bio.Seq import Seq
-from crispex.core.guide import Guide
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from crispex.core.encoding import BASE_CODES
+from crispex.core.guide import Guide, GuideBatch, gc_percentages, packed_quality_mask
 
 
 # PAM sequences for different Cas variants
@@ -12,30 +16,125 @@ PAM_SEQUENCES = {
     'SaCas9': 'GRRT',  # NNGRRT pattern
 }
 
+# Full PAM length (including N positions) for each Cas variant
+PAM_LENGTHS = {
+    'SpCas9': 3,
+    'SaCas9': 6,
+}
+
+# Sequences longer than this are scanned in blocks on a thread pool
+PARALLEL_SCAN_THRESHOLD = 200_000
+_SCAN_BLOCK_SIZE = 1 << 16
+
+_A, _C, _G, _T = ord('A'), ord('C'), ord('G'), ord('T')
+
+# str.translate table for complementing DNA
+_COMPLEMENT = str.maketrans('ACGTN', 'TGCAN')
 
-def find_pam_sites(sequence: str, pam_type: str = 'SpCas9') -> List[int]:
-    """Find all PAM sites in a sequence
+
+def _sequence_bytes(sequence: str) -> np.ndarray:
+    """View an uppercase DNA sequence as a uint8 array
+
+    Non-ASCII characters become '?' so positions are preserved.
+    """
+    return np.frombuffer(sequence.encode('ascii', errors='replace'), dtype=np.uint8)
+
+
+def _pair_mask(buf: np.ndarray, pair: bytes) -> np.ndarray:
+    """Mark every position where a two-base motif starts
+
+    Adjacent bytes are compared as a single uint16, so each comparison
+    tests two bases. Even and odd offsets are handled by two views.
 
     Args:
-        sequence: DNA sequence to search
+        buf: Sequence as uint8 array
+        pair: Two-byte motif (e.g. b'GG')
+
+    Returns:
+        Boolean array of length len(buf) - 1
+    """
+    n = len(buf)
+    mask = np.zeros(max(n - 1, 0), dtype=bool)
+    if n < 2:
+        return mask
+
+    target = np.frombuffer(pair, dtype='<u2')[0]
+    mask[0::2] = buf[:n & ~1].view('<u2') == target
+    mask[1::2] = buf[1:1 + ((n - 1) & ~1)].view('<u2') == target
+    return mask
+
+
+def _find_pam_positions(
+    buf: np.ndarray,
+    pam_type: str = 'SpCas9',
+    strand: str = '+'
+) -> np.ndarray:
+    """Find PAM sites in a uint8 sequence buffer
+
+    Every position is tested at once with vectorized comparisons, so
+    overlapping PAMs (e.g. both NGGs in 'AGGG') are all reported. Minus
+    strand PAMs are found on the forward sequence as the reverse complement
+    motif (CCN for NGG), so no reverse complement of buf is needed.
+
+    Args:
+        buf: Uppercase sequence as uint8 array (see _sequence_bytes)
         pam_type: Cas9 variant (SpCas9, SaCas9)
+        strand: '+' or '-' strand
 
     Returns:
-        List of PAM positions (0-based, position of first PAM nucleotide)
+        Array of PAM positions in forward coordinates (0-based, lowest
+        position covered by the PAM)
     """
-    sequence = sequence.upper()
-    pam_pattern = PAM_SEQUENCES.get(pam_type, 'GG')
+    pam_length = PAM_LENGTHS.get(pam_type)
+    if pam_length is None or len(buf) < pam_length:
+        return np.empty(0, dtype=np.intp)
+
+    is_base = BASE_CODES[buf] < 4
+
+    if pam_type == 'SpCas9' and strand == '+':
+        # NGG
+        mask = is_base[:-2] & _pair_mask(buf, b'GG')[1:]
+    elif pam_type == 'SpCas9':
+        # CCN
+        mask = _pair_mask(buf, b'CC')[:-1] & is_base[2:]
+    elif strand == '+':
+        # NNGRRT (R = A or G)
+        is_g = buf == _G
+        is_r = is_g | (buf == _A)
+        mask = (
+            is_base[:-5] & is_base[1:-4] & is_g[2:-3]
+            & is_r[3:-2] & is_r[4:-1] & (buf[5:] == _T)
+        )
+    else:
+        # AYYCNN (Y = C or T)
+        is_c = buf == _C
+        is_y = is_c | (buf == _T)
+        mask = (
+            (buf[:-5] == _A) & is_y[1:-4] & is_y[2:-3]
+            & is_c[3:-2] & is_base[4:-1] & is_base[5:]
+        )
+
+    return np.flatnonzero(mask)
 
-    pam_positions = []
 
-    # For SpCas9: find NGG (N = any nucleotide)
-    if pam_type == 'SpCas9':
-        # Pattern: any nucleotide followed by GG
-        pattern = r'[ATCG]GG'
-        for match in re.finditer(pattern, sequence):
-            pam_positions.append(match.start())
+def find_pam_sites(
+    sequence: str,
+    pam_type: str = 'SpCas9',
+    assume_upper: bool = False
+) -> List[int]:
+    """Find all PAM sites in a sequence
+
+    Args:
+        sequence: DNA sequence to search
+        pam_type: Cas9 variant (SpCas9, SaCas9)
+        assume_upper: Skip uppercasing; the caller guarantees an uppercase sequence
 
-    return pam_positions
+    Returns:
+        List of PAM positions (0-based, position of first PAM nucleotide)
+    """
+    if not assume_upper:
+        sequence = sequence.upper()
+    return _find_pam_positions(_sequence_bytes(sequence), pam_type).tolist()
 
 
 def extract_guide_sequence(
@@ -55,8 +154,7 @@ def extract_guide_sequence(
     Returns:
         Guide sequence (20bp) or None if extraction fails
     """
-    sequence = sequence.upper()
-
+    # Only the guide window is uppercased, not the full sequence
     if strand == '+':
         # Guide is upstream (5') of PAM
         guide_start = pam_position - guide_length
@@ -65,7 +163,7 @@ def extract_guide_sequence(
         if guide_start < 0:
             return None  # Not enough sequence upstream
 
-        guide_seq = sequence[guide_start:guide_end]
+        guide_seq = sequence[guide_start:guide_end].upper()
 
     else:  # strand == '-'
         # For minus strand, take downstream and reverse complement
@@ -75,138 +173,228 @@ def extract_guide_sequence(
         if guide_end > len(sequence):
             return None  # Not enough sequence downstream
 
-        guide_seq = sequence[guide_start:guide_end]
+        guide_seq = sequence[guide_start:guide_end].upper()
         # Reverse complement
-        guide_seq = str(Seq(guide_seq).reverse_complement())
+        guide_seq = guide_seq[::-1].translate(_COMPLEMENT)
 
     if len(guide_seq) != guide_length:
         return None
 
-    # Check for valid nucleotides only
-    if not all(base in 'ATCG' for base in guide_seq):
+    # Check for valid nucleotides only (strip leaves any other character)
+    if guide_seq.strip('ACGT'):
         return None
 
     return guide_seq
 
 
-def extract_guides(
-    sequence: str,
-    chromosome: str = "chr1",
-    start_position: int = 1,
-    gene_name: Optional[str] = None,
-    pam_type: str = 'SpCas9',
-    guide_length: int = 20,
-    apply_filters: bool = True
-) -> List[Guide]:
-    """Extract all possible guide RNAs from a sequence
+def _window_counts(flags: np.ndarray, starts: np.ndarray, width: int) -> np.ndarray:
+    """Count set flags in each window flags[start:start + width]"""
+    csum = np.zeros(len(flags) + 1, dtype=np.int64)
+    np.cumsum(flags, out=csum[1:])
+    return csum[starts + width] - csum[starts]
+
+
+def _valid_guide_starts(codes: np.ndarray, starts: np.ndarray, guide_length: int) -> np.ndarray:
+    """Select guide windows that lie inside the sequence and contain only ACGT
 
     Args:
-        sequence: DNA sequence to extract guides from
-        chromosome: Chromosome name
-        start_position: Genomic start coordinate of sequence (1-based)
-        gene_name: Gene symbol (optional)
+        codes: Nucleotide codes of the sequence
+        starts: Candidate guide start offsets (may be out of range)
+        guide_length: Guide length in bp
+
+    Returns:
+        Start offsets of the valid windows, in input order
+    """
+    starts = starts[(starts >= 0) & (starts + guide_length <= len(codes))]
+    if len(starts) == 0:
+        return starts
+
+    return starts[_window_counts(codes > 3, starts, guide_length) == 0]
+
+
+def _find_guide_starts(
+    buf: np.ndarray,
+    codes: np.ndarray,
+    pam_type: str,
+    guide_length: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find valid guide windows next to PAM sites on both strands
+
+    Args:
+        buf: Uppercase sequence as uint8 array
+        codes: Nucleotide codes of buf
         pam_type: Cas9 variant
         guide_length: Guide length in bp
-        apply_filters: Whether to apply quality filters
 
     Returns:
-        List of Guide objects
+        Tuple of (plus, minus) strand guide window starts, as ascending
+        forward-strand offsets
     """
-    guides = []
-    sequence = sequence.upper()
+    pam_length = PAM_LENGTHS.get(pam_type, 3)
 
-    # Find PAM sites on both strands
-    # Plus strand
-    pam_positions = find_pam_sites(sequence, pam_type)
+    # Plus strand: guide directly upstream of the PAM
+    pam_positions = _find_pam_positions(buf, pam_type)
+    plus_starts = _valid_guide_starts(codes, pam_positions - guide_length, guide_length)
 
-    for pam_pos in pam_positions:
-        # Extract guide sequence
-        guide_seq = extract_guide_sequence(
-            sequence, pam_pos, guide_length, strand='+'
-        )
+    # Minus strand: reverse complement PAM directly upstream of the guide
+    pam_positions_rev = _find_pam_positions(buf, pam_type, strand='-')
+    minus_starts = _valid_guide_starts(codes, pam_positions_rev + pam_length, guide_length)
 
-        if guide_seq is None:
-            continue
+    return plus_starts, minus_starts
 
-        # Get PAM sequence
-        pam_seq = sequence[pam_pos:pam_pos+3]  # NGG
 
-        # Calculate genomic coordinates
-        guide_start = start_position + pam_pos - guide_length
-        guide_end = start_position + pam_pos - 1
+def _find_guide_starts_blocked(
+    buf: np.ndarray,
+    codes: np.ndarray,
+    pam_type: str,
+    guide_length: int,
+    block_size: int = _SCAN_BLOCK_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Blocked, multithreaded equivalent of _find_guide_starts
 
-        # Create Guide object
-        guide = Guide(
-            sequence=guide_seq,
-            pam=pam_seq,
-            chromosome=chromosome,
-            start=guide_start,
-            end=guide_end,
-            strand='+'
+    The sequence is split into blocks that overlap by one guide + PAM span,
+    and each block only reports guides whose span starts inside it. NumPy
+    releases the GIL for the scans, so blocks are processed in parallel and
+    temporary arrays stay block sized.
+    """
+    n = len(buf)
+    if n <= block_size:
+        return _find_guide_starts(buf, codes, pam_type, guide_length)
+
+    pam_length = PAM_LENGTHS.get(pam_type, 3)
+    span = guide_length + pam_length
+
+    def scan(block_start: int) -> Tuple[np.ndarray, np.ndarray]:
+        block_end = min(block_start + block_size, n)
+        stop = min(block_end + span - 1, n)
+        plus, minus = _find_guide_starts(
+            buf[block_start:stop], codes[block_start:stop], pam_type, guide_length
         )
+        limit = block_end - block_start
+        return plus[plus < limit] + block_start, minus[minus - pam_length < limit] + block_start
 
-        # Calculate GC content
-        guide.calculate_gc_content()
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(scan, range(0, n, block_size)))
 
-        # Add gene name if provided
-        if gene_name:
-            guide.gene_name = gene_name
+    return (
+        np.concatenate([plus for plus, _ in results]),
+        np.concatenate([minus for _, minus in results]),
+    )
 
-        # Apply quality filters
-        if apply_filters:
-            if guide.passes_quality_filters():
-                guides.append(guide)
-        else:
-            guides.append(guide)
 
-    # Minus strand - search reverse complement
-    rev_comp_seq = str(Seq(sequence).reverse_complement())
-    pam_positions_rev = find_pam_sites(rev_comp_seq, pam_type)
+def _gather_windows(codes: np.ndarray, starts: np.ndarray, width: int, reverse: bool) -> np.ndarray:
+    """Gather code windows codes[start:start + width] as a matrix
 
-    for pam_pos in pam_positions_rev:
-        # Position in original sequence
-        original_pam_pos = len(sequence) - pam_pos - 3
+    With reverse=True each window is reverse complemented (3 - code maps
+    A<->T and C<->G).
+    """
+    if reverse:
+        return 3 - codes[starts[:, None] + np.arange(width - 1, -1, -1)]
+    return codes[starts[:, None] + np.arange(width)]
 
-        # Extract guide sequence (from reverse complement perspective)
-        guide_seq = extract_guide_sequence(
-            rev_comp_seq, pam_pos, guide_length, strand='+'
-        )
 
-        if guide_seq is None:
-            continue
+def extract_guide_batch(
+    sequence: str,
+    chromosome: str = "chr1",
+    start_position: int = 1,
+    gene_name: Optional[str] = None,
+    pam_type: str = 'SpCas9',
+    guide_length: int = 20,
+    apply_filters: bool = True,
+    assume_upper: bool = False
+) -> GuideBatch:
+    """Extract all possible guide RNAs from a sequence as a GuideBatch
+
+    Candidate windows are gathered and quality filtered with array
+    operations; no per-guide Python objects are created.
 
-        # PAM sequence from reverse complement
-        pam_seq = rev_comp_seq[pam_pos:pam_pos+3]
+    Args:
+        sequence: DNA sequence to extract guides from
+        chromosome: Chromosome name
+        start_position: Genomic start coordinate of sequence (1-based)
+        gene_name: Gene symbol (optional)
+        pam_type: Cas9 variant
+        guide_length: Guide length in bp
+        apply_filters: Whether to apply quality filters
+        assume_upper: Skip uppercasing; the caller guarantees an uppercase sequence
 
-        # Calculate genomic coordinates (on minus strand)
-        guide_start = start_position + original_pam_pos + 4  # After PAM
-        guide_end = start_position + original_pam_pos + 3 + guide_length
+    Returns:
+        GuideBatch with plus strand guides followed by minus strand guides
+    """
+    pam_length = PAM_LENGTHS.get(pam_type, 3)
+    if not assume_upper:
+        sequence = sequence.upper()
+    buf = _sequence_bytes(sequence)
+    codes = BASE_CODES[buf]
+
+    if len(buf) > PARALLEL_SCAN_THRESHOLD:
+        plus_starts, minus_starts = _find_guide_starts_blocked(buf, codes, pam_type, guide_length)
+    else:
+        plus_starts, minus_starts = _find_guide_starts(buf, codes, pam_type, guide_length)
+
+    # Minus strand PAMs are found on the forward sequence and only the
+    # selected guides are reverse complemented. Guides are emitted in order
+    # of position on the minus strand, i.e. descending forward position.
+    minus_starts = minus_starts[::-1]
+
+    seq_codes = np.concatenate([
+        _gather_windows(codes, plus_starts, guide_length, reverse=False),
+        _gather_windows(codes, minus_starts, guide_length, reverse=True),
+    ])
+
+    batch = GuideBatch(
+        seq_codes=seq_codes,
+        pam_codes=np.concatenate([
+            _gather_windows(codes, plus_starts + guide_length, pam_length, reverse=False),
+            _gather_windows(codes, minus_starts - pam_length, pam_length, reverse=True),
+        ]),
+        starts=np.concatenate([plus_starts, minus_starts + 1]).astype(np.int64) + start_position,
+        ends=np.concatenate([plus_starts - 1, minus_starts]).astype(np.int64)
+        + (start_position + guide_length),
+        strands=np.repeat(np.array([1, -1], dtype=np.int8), [len(plus_starts), len(minus_starts)]),
+        gc_content=gc_percentages(seq_codes),
+        chromosome=chromosome,
+        gene_name=gene_name or None,
+    )
+
+    if apply_filters:
+        batch = batch.select(batch.passes_quality_filters())
+
+    return batch
 
-        # Create Guide object
-        guide = Guide(
-            sequence=guide_seq,
-            pam=pam_seq,
-            chromosome=chromosome,
-            start=guide_start,
-            end=guide_end,
-            strand='-'
-        )
 
-        # Calculate GC content
-        guide.calculate_gc_content()
+def extract_guides(
+    sequence: str,
+    chromosome: str = "chr1",
+    start_position: int = 1,
+    gene_name: Optional[str] = None,
+    pam_type: str = 'SpCas9',
+    guide_length: int = 20,
+    apply_filters: bool = True,
+    assume_upper: bool = False
+) -> List[Guide]:
+    """Extract all possible guide RNAs from a sequence
 
-        # Add gene name
-        if gene_name:
-            guide.gene_name = gene_name
+    Candidate windows are screened with array operations and Guide objects
+    are only created for guides that survive (see extract_guide_batch).
 
-        # Apply quality filters
-        if apply_filters:
-            if guide.passes_quality_filters():
-                guides.append(guide)
-        else:
-            guides.append(guide)
+    Args:
+        sequence: DNA sequence to extract guides from
+        chromosome: Chromosome name
+        start_position: Genomic start coordinate of sequence (1-based)
+        gene_name: Gene symbol (optional)
+        pam_type: Cas9 variant
+        guide_length: Guide length in bp
+        apply_filters: Whether to apply quality filters
+        assume_upper: Skip uppercasing; the caller guarantees an uppercase sequence
 
-    return guides
+    Returns:
+        List of Guide objects
+    """
+    return extract_guide_batch(
+        sequence, chromosome, start_position, gene_name, pam_type, guide_length,
+        apply_filters, assume_upper
+    ).to_guides()
 
 
 def filter_guides_by_quality(
@@ -226,7 +414,21 @@ def filter_guides_by_quality(
     Returns:
         Filtered list of guides
     """
-    return [
-        guide for guide in guides
-        if guide.passes_quality_filters(min_gc, max_gc, max_homopolymer)
-    ]
+    # Screen all guides at once on their packed sequences when possible
+    length = len(guides[0].sequence) if guides else 0
+    packed = [guide.packed for guide in guides]
+    if (not 0 < length <= 32 or None in packed
+            or any(len(guide.sequence) != length for guide in guides)):
+        return [
+            guide for guide in guides
+            if guide.passes_quality_filters(min_gc, max_gc, max_homopolymer)
+        ]
+
+    gc_content = np.fromiter(
+        (guide.gc_content for guide in guides), dtype=np.float64, count=len(guides)
+    )
+    passes = packed_quality_mask(
+        np.array(packed, dtype=np.uint64), length, gc_content,
+        min_gc, max_gc, max_homopolymer
+    )
+    return [guide for guide, ok in zip(guides, passes.tolist()) if ok]
@@ -1,11 +1,348 @@
 """Ensembl API integration for fetching gene information and sequences"""
 
+import functools
+import os
+import string
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
-from typing import Dict, Optional, List
+import pandas as pd
+from typing import Any, Dict, Optional, List
+from crispex.utils.cache import CACHE_DIR
 from crispex.utils.errors import GeneNotFoundError, APIError
 
 
+# Ensembl stable ID prefixes, stripped in the gene cache to store IDs as integers
+ENSEMBL_ID_PREFIXES = {
+    'human': 'ENSG',
+    'mouse': 'ENSMUSG',
+}
+
+GENE_CACHE_COLUMNS = ['symbol', 'chrom', 'start', 'end', 'strand', 'ensembl_id', 'description']
+
+# Gene cache format version, part of the file name; bump when the layout changes
+GENE_CACHE_VERSION = 2
+
+# Lifetime of the local gene coordinate cache (seconds)
+GENE_CACHE_EXPIRE_AFTER = 7 * 24 * 3600
+
+# Lifetime of cached Ensembl HTTP responses (seconds)
+HTTP_CACHE_EXPIRE_AFTER = 7 * 24 * 3600
+
+# Ensembl REST rate limit for anonymous clients
+ENSEMBL_REQUESTS_PER_SECOND = 15
+
+# Keep-alive connections pooled by the shared session
+ENSEMBL_MAX_CONNECTIONS = 8
+
+# Maximum number of items per Ensembl POST request
+LOOKUP_POST_LIMIT = 1000
+SEQUENCE_POST_LIMIT = 50
+
+# Byte translation table converting ASCII letters to uppercase
+_UPPERCASE_TABLE = bytes.maketrans(
+    string.ascii_lowercase.encode('ascii'), string.ascii_uppercase.encode('ascii')
+)
+
+# Chunk size for streaming sequence responses
+_STREAM_CHUNK_SIZE = 1 << 16
+
+_gene_cache_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter
+
+    Allows bursts of up to ``capacity`` calls and refills at ``rate`` tokens
+    per second. pause() blocks all callers, e.g. after an HTTP 429, so
+    concurrent workers back off together instead of retrying independently.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._updated:
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._updated - now  # Paused
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Withhold all tokens for the given number of seconds"""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = max(self._updated, time.monotonic() + seconds)
+
+
+# Shared by all fetchers so concurrent requests respect one rate limit
+_rate_limiter = TokenBucket(ENSEMBL_REQUESTS_PER_SECOND, ENSEMBL_REQUESTS_PER_SECOND)
+
+
+def _create_session(cache_dir: str) -> requests.Session:
+    """Create the HTTP session used for Ensembl requests
+
+    When requests-cache is installed (``pip install crispex[http-cache]``)
+    responses are cached in a SQLite database under cache_dir, so repeated
+    lookups and sequence fetches skip the network. Cache-Control and ETag
+    headers from the server are honoured.
+
+    Args:
+        cache_dir: Directory for the HTTP response cache
+
+    Returns:
+        requests Session (a CachedSession if requests-cache is available)
+    """
+    try:
+        from requests_cache import CachedSession
+    except ImportError:
+        session = requests.Session()
+    else:
+        session = CachedSession(
+            cache_name=os.path.join(cache_dir, "http_cache"),
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE_AFTER,
+            allowable_methods=('GET', 'POST'),
+            cache_control=True,
+        )
+
+    # Size the connection pool for concurrent fetches so workers reuse
+    # keep-alive connections instead of opening new ones
+    session.mount(
+        'https://',
+        HTTPAdapter(pool_connections=1, pool_maxsize=ENSEMBL_MAX_CONNECTIONS)
+    )
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'User-Agent': 'Crispex/0.1.0'
+    })
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session(cache_dir: str) -> requests.Session:
+    """Get the process-wide HTTP session for a cache directory"""
+    return _create_session(cache_dir)
+
+
+def gene_cache_path(species: str) -> str:
+    """Get path of the local gene coordinate cache for a species
+
+    Args:
+        species: Species name
+
+    Returns:
+        Path to gzipped TSV file
+    """
+    return str(CACHE_DIR / f"gene_cache_v{GENE_CACHE_VERSION}_{species}.tsv.gz")
+
+
+def load_gene_cache(species: str) -> pd.DataFrame:
+    """Load the local gene coordinate cache for a species
+
+    The cache is a gzipped TSV with one row per gene
+    (symbol, chrom, start, end, strand, ensembl_id, description) where
+    ensembl_id is the numeric part of the stable ID. The file is parsed once
+    per version on disk, but its age is checked on every call: a cache last
+    written more than GENE_CACHE_EXPIRE_AFTER seconds ago is ignored, and
+    replaced by the next write.
+
+    Args:
+        species: Species name
+
+    Returns:
+        DataFrame indexed by uppercase gene symbol (empty if no cache exists
+        or it has expired)
+    """
+    path = gene_cache_path(species)
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return _read_gene_cache(None)
+
+    if time.time() - stat.st_mtime > GENE_CACHE_EXPIRE_AFTER:
+        return _read_gene_cache(None)
+    return _read_gene_cache(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_gene_cache(path: Optional[str], mtime_ns: int = 0, size: int = 0) -> pd.DataFrame:
+    """Parse a gene cache file; keyed by mtime and size so rewrites are re-read"""
+    if path is None:
+        df = pd.DataFrame(columns=GENE_CACHE_COLUMNS)
+    else:
+        df = pd.read_csv(
+            path,
+            sep='\t',
+            dtype={
+                'symbol': 'str',
+                'chrom': 'category',
+                'start': 'uint32',
+                'end': 'uint32',
+                'strand': 'int8',
+                'ensembl_id': 'uint64',
+                'description': 'str',
+            },
+            keep_default_na=False
+        )
+
+    df.index = df['symbol'].str.upper()
+    return df
+
+
+def clear_gene_cache(species: Optional[str] = None) -> int:
+    """Delete the local gene coordinate cache
+
+    Removes cache files of every format version, so that the next design
+    looks genes up from Ensembl again.
+
+    Args:
+        species: Species name, or None to clear the cache of all species
+
+    Returns:
+        Number of cache files removed
+    """
+    pattern = f"gene_cache_*{species}.tsv.gz" if species else "gene_cache_*.tsv.gz"
+
+    removed = 0
+    with _gene_cache_lock:
+        for path in CACHE_DIR.glob(pattern):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+
+        _read_gene_cache.cache_clear()
+
+    return removed
+
+
+def _cached_gene_info(gene_symbol: str, species: str) -> Optional[Dict]:
+    """Build a lookup_gene-style record from the local gene cache
+
+    Args:
+        gene_symbol: Gene symbol
+        species: Species name
+
+    Returns:
+        Gene information dictionary, or None on cache miss
+    """
+    prefix = ENSEMBL_ID_PREFIXES.get(species)
+    cache = load_gene_cache(species)
+    key = gene_symbol.upper()
+
+    if prefix is None or key not in cache.index:
+        return None
+
+    row = cache.loc[key]
+    if isinstance(row, pd.DataFrame):
+        row = row.iloc[0]
+
+    return {
+        'id': f"{prefix}{int(row['ensembl_id']):011d}",
+        'display_name': row['symbol'],
+        'description': row['description'],
+        'seq_region_name': str(row['chrom']),
+        'start': int(row['start']),
+        'end': int(row['end']),
+        'strand': int(row['strand']),
+    }
+
+
+def _store_gene_info(gene_infos: List[Dict], species: str) -> None:
+    """Add gene lookup results to the local gene cache
+
+    Entries whose stable ID does not use the expected species prefix are
+    skipped. Writing is best-effort.
+
+    Args:
+        gene_infos: lookup_gene results
+        species: Species name
+    """
+    prefix = ENSEMBL_ID_PREFIXES.get(species)
+    if prefix is None:
+        return
+
+    rows = [
+        {
+            'symbol': info['display_name'],
+            'chrom': info['seq_region_name'],
+            'start': info['start'],
+            'end': info['end'],
+            'strand': info['strand'],
+            'ensembl_id': int(info['id'][len(prefix):]),
+            'description': info.get('description') or '',
+        }
+        for info in gene_infos
+        if info.get('id', '').startswith(prefix) and info['id'][len(prefix):].isdigit()
+    ]
+    if not rows:
+        return
+
+    with _gene_cache_lock:
+        existing = load_gene_cache(species)
+        new = pd.DataFrame(rows, columns=GENE_CACHE_COLUMNS)
+        merged = pd.concat([existing[GENE_CACHE_COLUMNS].astype({'chrom': 'str'}), new])
+        merged = merged[~merged['symbol'].str.upper().duplicated(keep='last')]
+
+        path = gene_cache_path(species)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            merged.to_csv(tmp_path, sep='\t', index=False, compression='gzip')
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+
+def _gene_region(gene_info: Dict) -> str:
+    """Format the Ensembl sequence region of a gene lookup result"""
+    return f"{gene_info['seq_region_name']}:{gene_info['start']}..{gene_info['end']}"
+
+
+def _gene_record(gene_info: Dict, sequence: str) -> Dict:
+    """Combine a gene lookup result and its sequence (see get_gene_sequence)"""
+    # Extract coordinates
+    chromosome = gene_info['seq_region_name']
+    if not chromosome.startswith('chr'):
+        chromosome = f"chr{chromosome}"
+
+    start = gene_info['start']
+    end = gene_info['end']
+    strand = '+' if gene_info['strand'] > 0 else '-'
+
+    return {
+        'gene_info': gene_info,
+        'sequence': sequence,
+        'chromosome': chromosome,
+        'start': start,
+        'end': end,
+        'strand': strand,
+        'gene_id': gene_info['id'],
+        'gene_symbol': gene_info['display_name'],
+        'description': gene_info.get('description', ''),
+        'length': end - start + 1
+    }
+
+
 class EnsemblFetcher:
     """Fetches gene information from Ensembl REST API"""
 
@@ -18,27 +355,28 @@ class EnsemblFetcher:
             species: Species name (human, mouse, etc.)
         """
         self.species = species
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'Crispex/0.1.0'
-        })
+        # Shared by all fetchers, so connections to Ensembl (and their TLS
+        # handshakes) are reused across design_guides calls
+        self.session = _shared_session(str(CACHE_DIR))
 
     def _make_request(
         self,
         endpoint: str,
         params: Optional[Dict] = None,
-        max_retries: int = 3
-    ) -> Dict:
+        max_retries: int = 3,
+        payload: Optional[Dict] = None
+    ) -> Any:
         """Make HTTP request to Ensembl API with retry logic
 
         Args:
             endpoint: API endpoint path
             params: Query parameters
             max_retries: Maximum number of retry attempts
+            payload: JSON body; if given, the request is sent as a POST
 
         Returns:
-            JSON response as dictionary
+            JSON response (a dictionary, or a list for batch sequence
+            requests), or None if Ensembl answers 404
 
         Raises:
             APIError: If request fails after retries
@@ -47,13 +385,17 @@ class EnsemblFetcher:
 
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, params=params, timeout=30)
+                _rate_limiter.acquire()
+                if payload is None:
+                    response = self.session.get(url, params=params, timeout=30)
+                else:
+                    response = self.session.post(url, params=params, json=payload, timeout=30)
 
                 # Handle rate limiting
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
+                    retry_after = float(response.headers.get('Retry-After', 60))
                     if attempt < max_retries - 1:
-                        time.sleep(retry_after)
+                        _rate_limiter.pause(retry_after)
                         continue
                     raise APIError(f"Rate limited by Ensembl API. Retry after {retry_after}s")
 
@@ -100,7 +442,7 @@ class EnsemblFetcher:
         endpoint = f"/lookup/symbol/{self.species}/{gene_symbol}"
         params = {'expand': 1}  # Expand to include transcripts
 
-        result = self._make_request(endpoint, params)
+        result: Optional[Dict] = self._make_request(endpoint, params)
 
         if result is None:
             raise GeneNotFoundError(
@@ -111,6 +453,60 @@ class EnsemblFetcher:
 
         return result
 
+    def lookup_genes(self, gene_symbols: List[str]) -> Dict[str, Dict]:
+        """Look up several genes by symbol with batched POST requests
+
+        Args:
+            gene_symbols: Gene symbols
+
+        Returns:
+            Dictionary mapping each found symbol (as given) to its gene
+            information (see lookup_gene). Symbols that are not found are
+            omitted.
+
+        Raises:
+            APIError: If a request fails
+        """
+        endpoint = f"/lookup/symbol/{self.species}"
+        params = {'expand': 1}
+
+        found = {}
+        for i in range(0, len(gene_symbols), LOOKUP_POST_LIMIT):
+            chunk = gene_symbols[i:i + LOOKUP_POST_LIMIT]
+            result = self._make_request(endpoint, params, payload={'symbols': chunk}) or {}
+            found.update({symbol: info for symbol, info in result.items() if info})
+
+        return found
+
+    def get_sequences(self, regions: List[str]) -> List[str]:
+        """Get genomic sequences for several regions with batched POST requests
+
+        Args:
+            regions: Genomic regions (e.g., ['17:7661779..7687550'])
+
+        Returns:
+            Uppercase DNA sequences, in the order of regions
+
+        Raises:
+            APIError: If a sequence cannot be retrieved
+        """
+        endpoint = f"/sequence/region/{self.species}"
+
+        sequences: Dict[str, str] = {}
+        for i in range(0, len(regions), SEQUENCE_POST_LIMIT):
+            chunk = regions[i:i + SEQUENCE_POST_LIMIT]
+            # The batch endpoint answers with a list of {'query', 'seq', ...} records
+            result: List[Dict] = self._make_request(endpoint, payload={'regions': chunk}) or []
+            sequences.update({item['query']: item['seq'] for item in result})
+
+        missing = [region for region in regions if region not in sequences]
+        if missing:
+            raise APIError(
+                f"Failed to fetch sequence from Ensembl for region(s): {', '.join(missing)}"
+            )
+
+        return [sequences[region].upper() for region in regions]
+
     def get_sequence(self, region: str) -> str:
         """Get genomic sequence for a region
 
@@ -118,7 +514,7 @@ class EnsemblFetcher:
             region: Genomic region (e.g., 'chr17:7661779..7687550')
 
         Returns:
-            DNA sequence string
+            Uppercase DNA sequence string
 
         Raises:
             APIError: If sequence cannot be retrieved
@@ -127,13 +523,21 @@ class EnsemblFetcher:
         params = {'content-type': 'text/plain'}
 
         try:
+            _rate_limiter.acquire()
             response = self.session.get(
                 f"{self.BASE_URL}{endpoint}",
                 params=params,
-                timeout=60
+                timeout=60,
+                stream=True
             )
             response.raise_for_status()
-            return response.text.upper()
+
+            # Collect raw bytes and uppercase them in one pass, without
+            # decoding the body to str first
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                body += chunk
+            return body.translate(_UPPERCASE_TABLE).decode('ascii', errors='replace')
 
         except requests.exceptions.RequestException as e:
             raise APIError(f"Failed to fetch sequence from Ensembl: {e}")
@@ -192,34 +596,16 @@ class EnsemblFetcher:
             GeneNotFoundError: If gene not found
             APIError: If sequence retrieval fails
         """
-        # Lookup gene
-        gene_info = self.lookup_gene(gene_symbol)
-
-        # Extract coordinates
-        chromosome = gene_info['seq_region_name']
-        if not chromosome.startswith('chr'):
-            chromosome = f"chr{chromosome}"
-
-        start = gene_info['start']
-        end = gene_info['end']
-        strand = '+' if gene_info['strand'] > 0 else '-'
+        # Lookup gene, preferring the local gene cache over the REST API
+        gene_info = _cached_gene_info(gene_symbol, self.species)
+        if gene_info is None:
+            gene_info = self.lookup_gene(gene_symbol)
+            _store_gene_info([gene_info], self.species)
 
         # Fetch sequence
-        region = f"{gene_info['seq_region_name']}:{start}..{end}"
-        sequence = self.get_sequence(region)
-
-        return {
-            'gene_info': gene_info,
-            'sequence': sequence,
-            'chromosome': chromosome,
-            'start': start,
-            'end': end,
-            'strand': strand,
-            'gene_id': gene_info['id'],
-            'gene_symbol': gene_info['display_name'],
-            'description': gene_info.get('description', ''),
-            'length': end - start + 1
-        }
+        sequence = self.get_sequence(_gene_region(gene_info))
+
+        return _gene_record(gene_info, sequence)
 
 
 def fetch_gene_sequence(gene_symbol: str, species: str = "human") -> Dict:
@@ -238,3 +624,69 @@ def fetch_gene_sequence(gene_symbol: str, species: str = "human") -> Dict:
     """
     fetcher = EnsemblFetcher(species=species)
     return fetcher.get_gene_sequence(gene_symbol)
+
+
+def fetch_gene_sequences(gene_symbols: List[str], species: str = "human") -> List[Dict]:
+    """Fetch sequences for several genes with batched Ensembl requests
+
+    Genes missing from the local gene cache are looked up with one POST
+    request per 1000 symbols, and sequences are fetched with one POST
+    request per 50 regions, instead of two GET requests per gene.
+
+    Args:
+        gene_symbols: Gene symbols (e.g., ['TP53', 'BRCA1'])
+        species: Species name
+
+    Returns:
+        List of gene information and sequence dictionaries (see
+        fetch_gene_sequence), in the order of gene_symbols
+
+    Raises:
+        GeneNotFoundError: If a gene is not found
+        APIError: If retrieval fails
+    """
+    fetcher = EnsemblFetcher(species=species)
+
+    cached = {symbol: _cached_gene_info(symbol, species) for symbol in gene_symbols}
+    gene_infos = {symbol: info for symbol, info in cached.items() if info is not None}
+    missing = [symbol for symbol, info in cached.items() if info is None]
+
+    if missing:
+        found = fetcher.lookup_genes(missing)
+        not_found = [symbol for symbol in missing if symbol not in found]
+        if not_found:
+            raise GeneNotFoundError(
+                f"Gene(s) {', '.join(repr(s) for s in not_found)} not found in Ensembl "
+                f"database ({species}, assembly: GRCh38 or GRCm39). "
+                f"Check spelling or try using Ensembl gene ID."
+            )
+        gene_infos.update(found)
+        _store_gene_info(list(found.values()), species)
+
+    infos = [gene_infos[symbol] for symbol in gene_symbols]
+    sequences = fetcher.get_sequences([_gene_region(info) for info in infos])
+
+    return [_gene_record(info, sequence) for info, sequence in zip(infos, sequences)]
+
+
+def update_gene_cache(gene_symbols: List[str], species: str = "human") -> int:
+    """Refresh local gene coordinates from Ensembl
+
+    Looks up each gene via the REST API and stores its coordinates in the
+    local gene cache, so later designs for these genes skip the lookup call.
+
+    Args:
+        gene_symbols: Gene symbols to refresh
+        species: Species name
+
+    Returns:
+        Number of genes written to the cache
+
+    Raises:
+        GeneNotFoundError: If a gene is not found
+        APIError: If the lookup fails
+    """
+    fetcher = EnsemblFetcher(species=species)
+    gene_infos = [fetcher.lookup_gene(symbol) for symbol in gene_symbols]
+    _store_gene_info(gene_infos, species)
+    return len(gene_infos)
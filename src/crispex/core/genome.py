@@ -4,13 +4,297 @@ For MVP, this module provides basic genome file handling.
 Future versions will include automatic genome downloading and indexing.
 """
 
+import mmap
 import os
+import string
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
-from pyfaidx import Fasta
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
 from crispex.utils.errors import GenomeNotInstalledError
 
 
+# bytes.translate table uppercasing ASCII letters; newlines are deleted alongside
+_UPPERCASE_TABLE = bytes.maketrans(
+    string.ascii_lowercase.encode('ascii'), string.ascii_uppercase.encode('ascii')
+)
+
+# Block size for FASTA indexing reads
+INDEX_CHUNK_SIZE = 1 << 16
+
+
+class _IndexRecord:
+    """Running byte counts for one FASTA record while it is being indexed"""
+
+    __slots__ = ('name', 'offset', 'size', 'newlines', 'line_width', 'crlf',
+                 'misaligned', 'content_end', 'tail_newlines', 'last_byte')
+
+    def __init__(self, name: str, offset: int):
+        self.name = name
+        self.offset = offset
+        self.size = 0               # Bytes after the header line
+        self.newlines = 0
+        self.line_width = 0         # Bytes of the first line, newline included
+        self.crlf = False
+        self.misaligned: Optional[int] = None   # First newline not at a multiple of line_width
+        self.content_end = 0        # size without trailing blank lines
+        self.tail_newlines = 0      # Newlines after content_end
+        self.last_byte = 0
+
+    def consume(self, block: bytes) -> None:
+        """Account for the next block of sequence bytes"""
+        if not block:
+            return
+
+        newlines = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == 10)
+        if len(newlines):
+            if not self.line_width:
+                first = int(newlines[0])
+                self.line_width = self.size + first + 1
+                self.crlf = (block[first - 1] if first else self.last_byte) == 13
+            if self.misaligned is None:
+                bad = np.flatnonzero((newlines + (self.size + 1)) % self.line_width)
+                if len(bad):
+                    self.misaligned = self.size + int(newlines[bad[0]])
+
+        content = block.rstrip(b'\r\n')
+        if content:
+            self.content_end = self.size + len(content)
+            self.tail_newlines = block.count(b'\n', len(content))
+        else:
+            self.tail_newlines += len(newlines)
+
+        self.size += len(block)
+        self.newlines += len(newlines)
+        self.last_byte = block[-1]
+
+    def entry(self) -> str:
+        """Format the .fai line, checking that all lines have the same length"""
+        if not self.content_end:
+            return f"{self.name}\t0\t{self.offset}\t0\t{self.line_width}\n"
+
+        if not self.line_width:
+            # A single line without a newline
+            return (f"{self.name}\t{self.content_end}\t{self.offset}"
+                    f"\t{self.content_end}\t{self.content_end}\n")
+
+        line_width = self.line_width
+        line_bases = line_width - (2 if self.crlf else 1)
+        full_lines = self.newlines - self.tail_newlines
+
+        # Every line but the last must be full, so its newline is aligned
+        if (line_bases <= 0
+                or (self.misaligned is not None and self.misaligned < self.content_end)
+                or full_lines != self.content_end // line_width
+                or self.content_end % line_width > line_bases):
+            raise ValueError(f"Inconsistent line lengths in FASTA record '{self.name}'")
+
+        length = self.content_end - full_lines * (line_width - line_bases)
+        return f"{self.name}\t{length}\t{self.offset}\t{line_bases}\t{line_width}\n"
+
+
+def build_fasta_index(path: str, chunk_size: int = INDEX_CHUNK_SIZE) -> str:
+    """Write a samtools/pyfaidx compatible .fai index for a FASTA file
+
+    The file is read in fixed-size blocks. Headers are located with
+    bytes.find and line structure is checked on the newline positions of
+    each block, so no per-line Python work is done.
+
+    Args:
+        path: Path to an uncompressed FASTA file
+        chunk_size: Bytes per read
+
+    Returns:
+        Path of the written index (path + '.fai')
+
+    Raises:
+        ValueError: If the file is not a FASTA file, has duplicate names or
+            records with inconsistent line lengths
+    """
+    entries: List[str] = []
+    names = set()
+    record: Optional[_IndexRecord] = None
+    file_offset = 0     # File position of buf[0]
+    in_header = True
+
+    def start_record(header: bytes, offset: int) -> _IndexRecord:
+        fields = header.rstrip(b'\r').split(None, 1)
+        if not fields:
+            raise ValueError(f"Empty FASTA header at byte {offset} of {path}")
+        name = fields[0].decode()
+        if name in names:
+            raise ValueError(f"Duplicate FASTA record name '{name}' in {path}")
+        names.add(name)
+        return _IndexRecord(name, offset)
+
+    with open(path, 'rb') as f:
+        buf = f.read(chunk_size)
+        if buf and not buf.startswith(b'>'):
+            raise ValueError(f"Not a FASTA file: {path}")
+
+        eof = not buf
+        while True:
+            pos = 0
+            while pos < len(buf):
+                if in_header:
+                    end = buf.find(b'\n', pos)
+                    if end < 0:
+                        if not eof:
+                            break
+                        end = len(buf)
+                    if record is not None:
+                        entries.append(record.entry())
+                    record = start_record(buf[pos + 1:end], file_offset + min(end + 1, len(buf)))
+                    pos = end + 1
+                    in_header = False
+                elif buf.startswith(b'>', pos):
+                    in_header = True
+                else:
+                    # Hold back the last byte, it may be the newline before a header
+                    end = buf.find(b'\n>', pos)
+                    stop = end + 1 if end >= 0 else len(buf) - (not eof)
+                    if stop <= pos:
+                        break
+                    if record is None:
+                        raise ValueError(f"Sequence before the first header in {path}")
+                    record.consume(buf[pos:stop])
+                    pos = stop
+                    in_header = end >= 0
+
+            if eof:
+                break
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            file_offset += pos
+            buf = buf[pos:] + chunk
+
+    if record is not None:
+        entries.append(record.entry())
+
+    index_path = path + '.fai'
+    with open(index_path, 'w') as index_file:
+        index_file.writelines(entries)
+    return index_path
+
+
+class MmapFasta:
+    """Read-only FASTA reader over a memory-mapped file
+
+    Uses the samtools/pyfaidx .fai index (built if missing or older than
+    the FASTA) to turn a region into a single slice of the mapped file. Lookups need no
+    seek or read calls and no shared file position, so one reader can be
+    used from several threads and inherited by forked workers.
+    """
+
+    def __init__(self, path: str):
+        """Open a FASTA file and its index
+
+        Args:
+            path: Path to an uncompressed FASTA file
+        """
+        self.path = path
+        stat = os.stat(path)
+        # Identifies the file contents this reader was opened on
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+
+        index_path = path + '.fai'
+        if not os.path.exists(index_path) or os.stat(index_path).st_mtime_ns < stat.st_mtime_ns:
+            build_fasta_index(path)
+
+        # name -> (length, offset, line_bases, line_width)
+        self.index: Dict[str, Tuple[int, int, int, int]] = {}
+        with open(index_path, 'rb') as f:
+            for line in f.read().splitlines():
+                if not line:
+                    continue
+                name, length, offset, line_bases, line_width = line.split(b'\t')[:5]
+                self.index[name.decode()] = (
+                    int(length), int(offset), int(line_bases), int(line_width)
+                )
+
+        # The mapping keeps its own file descriptor, so no file handle is held
+        self._data: Union[mmap.mmap, bytes] = b''
+        if stat.st_size:
+            with open(path, 'rb') as f:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def keys(self) -> List[str]:
+        """Sequence names in file order"""
+        return list(self.index)
+
+    def get_sequence(self, name: str, start: int, end: int) -> str:
+        """Get a region of a sequence
+
+        Args:
+            name: Sequence name
+            start: Start coordinate (1-based)
+            end: End coordinate (1-based, inclusive), clipped to the sequence
+
+        Returns:
+            Uppercase sequence
+
+        Raises:
+            KeyError: If the sequence is not in the index
+        """
+        length, offset, line_bases, line_width = self.index[name]
+        first = max(start, 1) - 1
+        last = min(end, length)
+        if last <= first:
+            return ''
+
+        # Byte positions of the first and last requested bases
+        begin = offset + (first // line_bases) * line_width + first % line_bases
+        stop = offset + ((last - 1) // line_bases) * line_width + (last - 1) % line_bases + 1
+        return self._data[begin:stop].translate(_UPPERCASE_TABLE, b'\r\n').decode(
+            'ascii', errors='replace'
+        )
+
+    def close(self) -> None:
+        """Release the mapping; only for readers not shared through _open_fasta"""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+# Most FASTA readers kept open at once
+MAX_OPEN_FASTAS = 4
+
+# Open readers by path, least recently used first
+_open_fastas: 'OrderedDict[str, MmapFasta]' = OrderedDict()
+_open_fastas_lock = threading.Lock()
+
+
+def _open_fasta(path: str) -> MmapFasta:
+    """Open a genome FASTA once per path, shared by all GenomeManager instances
+
+    Opening parses the .fai index, which dominates the cost of a lookup.
+    A reader is reopened when the file has changed since it was opened, and
+    the least recently used reader is dropped when more than MAX_OPEN_FASTAS
+    are open. Dropped readers are not closed, since other managers or
+    threads may still hold them; each mapping is released when its last
+    user lets go of it.
+    """
+    stat = os.stat(path)
+    with _open_fastas_lock:
+        fasta = _open_fastas.pop(path, None)
+        if fasta is None or fasta.signature != (stat.st_mtime_ns, stat.st_size):
+            fasta = MmapFasta(path)
+        _open_fastas[path] = fasta
+
+        while len(_open_fastas) > MAX_OPEN_FASTAS:
+            _open_fastas.popitem(last=False)
+
+    return fasta
+
+
+def _clear_fastas() -> None:
+    """Drop every shared FASTA reader"""
+    with _open_fastas_lock:
+        _open_fastas.clear()
+
+
 class GenomeManager:
     """Manages reference genome files and indexing"""
 
@@ -23,7 +307,7 @@ class GenomeManager:
         self.species = species
         self.genome_dir = Path.home() / ".crispex" / "genomes"
         self.genome_file = None
-        self.fasta = None
+        self.fasta: Optional[MmapFasta] = None
 
     def get_genome_path(self) -> Path:
         """Get path to genome FASTA file
@@ -59,22 +343,22 @@ class GenomeManager:
 
         return genome_path
 
-    def load_genome(self) -> Fasta:
+    def load_genome(self) -> MmapFasta:
         """Load genome FASTA file
 
+        The reader comes from the shared cache on every call, so a genome
+        edited on disk or a reader dropped on eviction is reopened.
+
         Returns:
-            Fasta object for genome access
+            MmapFasta reader for genome access
 
         Raises:
             GenomeNotInstalledError: If genome cannot be loaded
         """
-        if self.fasta is not None:
-            return self.fasta
-
         genome_path = self.get_genome_path()
 
         try:
-            self.fasta = Fasta(str(genome_path))
+            self.fasta = _open_fasta(str(genome_path))
             return self.fasta
 
         except Exception as e:
@@ -82,6 +366,25 @@ class GenomeManager:
                 f"Failed to load genome file: {e}"
             )
 
+    def build_index(self, path: Optional[str] = None) -> str:
+        """Build the .fai index of a genome FASTA file
+
+        Args:
+            path: FASTA file to index (default: the installed genome)
+
+        Returns:
+            Path of the written index
+
+        Raises:
+            GenomeNotInstalledError: If the genome is missing or malformed
+        """
+        path = str(path) if path is not None else str(self.get_genome_path())
+
+        try:
+            return build_fasta_index(path)
+        except (OSError, ValueError) as e:
+            raise GenomeNotInstalledError(f"Failed to index genome file: {e}")
+
     def get_sequence(self, chromosome: str, start: int, end: int) -> str:
         """Get genomic sequence for a region
 
@@ -96,19 +399,46 @@ class GenomeManager:
         Raises:
             GenomeNotInstalledError: If genome not available
         """
-        if self.fasta is None:
-            self.load_genome()
+        fasta = self.load_genome()
 
         try:
-            # pyfaidx uses 0-based indexing, convert from 1-based
-            sequence = self.fasta[chromosome][start-1:end].seq
-            return sequence.upper()
+            return fasta.get_sequence(chromosome, start, end)
 
         except KeyError:
-            raise GenomeNotInstalledError(
-                f"Chromosome '{chromosome}' not found in genome file. "
-                f"Available chromosomes: {list(self.fasta.keys())[:5]}..."
-            )
+            raise self._chromosome_not_found(chromosome)
+
+    def get_sequences(self, regions: List[Tuple[str, int, int]]) -> List[str]:
+        """Get genomic sequences for many regions
+
+        Regions are read grouped by chromosome in ascending start order, so
+        nearby windows are served from pages the OS has already read.
+
+        Args:
+            regions: (chromosome, start, end) tuples, 1-based inclusive
+
+        Returns:
+            DNA sequence strings (uppercase), in the order of regions
+
+        Raises:
+            GenomeNotInstalledError: If genome or a chromosome is not available
+        """
+        get_sequence = self.load_genome().get_sequence
+        sequences = [''] * len(regions)
+        for i in sorted(range(len(regions)), key=lambda i: regions[i][:2]):
+            chromosome, start, end = regions[i]
+            try:
+                sequences[i] = get_sequence(chromosome, start, end)
+            except KeyError:
+                raise self._chromosome_not_found(chromosome)
+
+        return sequences
+
+    def _chromosome_not_found(self, chromosome: str) -> GenomeNotInstalledError:
+        available = self.fasta.keys() if self.fasta is not None else []
+        return GenomeNotInstalledError(
+            f"Chromosome '{chromosome}' not found in genome file. "
+            f"Available chromosomes: {available[:5]}..."
+        )
 
     def is_genome_installed(self) -> bool:
         """Check if genome is installed
@@ -128,10 +458,7 @@ class GenomeManager:
         Returns:
             List of chromosome names
         """
-        if self.fasta is None:
-            self.load_genome()
-
-        return list(self.fasta.keys())
+        return self.load_genome().keys()
 
 
 def ensure_genome_dir() -> Path:
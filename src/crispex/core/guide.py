@@ -1,10 +1,86 @@
 """Guide data structure and basic operations"""
 
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+import sys
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-@dataclass
+from crispex.core.encoding import (
+    decode_sequences, encode_sequences, pack_2bit, pack_sequence, packed_gc_count,
+    packed_has_run
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Length of the PAM-proximal seed region used for off-target prefiltering
+SEED_LENGTH = 10
+
+# Highest mismatch count tracked for off-targets
+MAX_MISMATCHES = 3
+
+# Guides are created per PAM site, so drop the per-instance __dict__ where supported
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class OffTargetCounts(list):
+    """Off-target counts indexed by mismatch count (0 to MAX_MISMATCHES)
+
+    A plain list, so counts are read by index. get() and items() keep the
+    interface of the {mismatches: count} dict it replaces.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_mapping(cls, counts: Mapping[int, int]) -> 'OffTargetCounts':
+        """Build counts from a {mismatches: count} mapping (missing levels are 0)"""
+        return cls(counts.get(mm, 0) for mm in range(MAX_MISMATCHES + 1))
+
+    def get(self, mismatches: int, default: int = 0) -> int:
+        """Count for a mismatch level, or default if it is not tracked"""
+        return self[mismatches] if 0 <= mismatches < len(self) else default
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """(mismatches, count) pairs"""
+        return enumerate(self)
+
+
+def _converting_off_targets(cls: type) -> type:
+    """Convert {mismatches: count} dicts assigned to off_targets
+
+    Replaces the off_targets attribute with a property over its storage
+    (the __slots__ member, or the instance __dict__ without slots), so the
+    counts are an OffTargetCounts whether set in the constructor or later.
+    """
+    slot = cls.__dict__.get('off_targets')
+    if slot is not None:
+        get_counts, set_counts = slot.__get__, slot.__set__
+    else:
+        def get_counts(guide: 'Guide') -> OffTargetCounts:
+            counts: OffTargetCounts = guide.__dict__['off_targets']
+            return counts
+
+        def set_counts(guide: 'Guide', counts: OffTargetCounts) -> None:
+            guide.__dict__['off_targets'] = counts
+
+    def set_off_targets(guide: 'Guide', counts: Union[Mapping[int, int], List[int]]) -> None:
+        if type(counts) is not OffTargetCounts:
+            if isinstance(counts, Mapping):
+                counts = OffTargetCounts.from_mapping(counts)
+            else:
+                counts = OffTargetCounts(counts)
+        set_counts(guide, counts)
+
+    setattr(cls, 'off_targets', property(get_counts, set_off_targets))
+    return cls
+
+
+@_converting_off_targets
+@dataclass(**_SLOTS)
 class Guide:
     """Represents a single sgRNA candidate
 
@@ -16,11 +92,15 @@ class Guide:
         end: Genomic end coordinate (1-based, inclusive)
         strand: '+' or '-'
         efficiency_score: On-target efficiency score (0-100)
-        off_targets: Dictionary mapping mismatch count to number of off-targets
-                    e.g., {0: 1, 1: 2, 2: 8, 3: 34}
+        off_targets: Number of off-targets indexed by mismatch count,
+                    e.g., [1, 2, 8, 34]; a {mismatches: count} dict
+                    is converted when assigned
         gc_content: GC percentage (0-100)
         gene_name: Gene symbol (optional)
         exon: Exon number (optional)
+        packed_seq: Guide sequence packed 2 bits per base (set by pack2bit)
+        packed_source: Sequence that packed_seq was computed from; packed_seq
+                    is recomputed when sequence no longer matches it
     """
     sequence: str
     pam: str
@@ -29,21 +109,62 @@ class Guide:
     end: int
     strand: str
     efficiency_score: float = 0.0
-    off_targets: Dict[int, int] = field(default_factory=lambda: {0: 0, 1: 0, 2: 0, 3: 0})
+    off_targets: OffTargetCounts = field(default_factory=lambda: OffTargetCounts([0, 0, 0, 0]))
     gc_content: float = 0.0
     gene_name: Optional[str] = None
     exon: Optional[int] = None
+    packed_seq: Optional[int] = field(default=None, repr=False, compare=False)
+    packed_source: Optional[str] = field(default=None, repr=False, compare=False)
 
     @property
     def full_sequence(self) -> str:
         """Returns guide sequence + PAM for ordering"""
         return self.sequence + self.pam
 
+    def pack2bit(self) -> int:
+        """Pack the guide sequence into an integer, 2 bits per base
+
+        Uses the encoding from crispex.core.encoding (A=0, C=1, G=2, T=3,
+        base i in bits 2i and 2i+1) and stores the result in packed_seq.
+
+        Returns:
+            Packed sequence
+
+        Raises:
+            ValueError: If the sequence contains bases other than A, C, G, T
+        """
+        self.packed_seq = pack_sequence(self.sequence)
+        self.packed_source = self.sequence
+        return self.packed_seq
+
+    @property
+    def packed(self) -> Optional[int]:
+        """Packed guide sequence, computed on first access
+
+        Reuses packed_seq when it was computed from the current sequence
+        (e.g. by GuideBatch.to_guides).
+
+        Returns:
+            Packed sequence, or None if the sequence contains bases other
+            than A, C, G, T
+        """
+        if self.packed_seq is None or self.packed_source != self.sequence:
+            try:
+                self.pack2bit()
+            except ValueError:
+                return None
+        return self.packed_seq
+
     def calculate_gc_content(self) -> float:
         """Calculate GC content percentage of the guide sequence"""
         if not self.sequence:
             return 0.0
-        gc_count = self.sequence.count('G') + self.sequence.count('C')
+        packed = self.packed
+        if packed is not None:
+            gc_count = packed_gc_count(packed, len(self.sequence))
+        else:
+            # Sequence contains ambiguous or lowercase bases
+            gc_count = self.sequence.count('G') + self.sequence.count('C')
         self.gc_content = (gc_count / len(self.sequence)) * 100
         return self.gc_content
 
@@ -67,15 +188,12 @@ class Guide:
         if self.gc_content < min_gc or self.gc_content > max_gc:
             return False
 
-        # Check for homopolymer runs
-        for base in ['A', 'T', 'G', 'C']:
-            if base * max_homopolymer in self.sequence:
+        # Check for homopolymer and polyT runs
+        sequence = self.sequence
+        for run in _forbidden_runs(max_homopolymer):
+            if run in sequence:
                 return False
 
-        # Check for polyT runs (causes pol III termination)
-        if 'TTTT' in self.sequence:
-            return False
-
         return True
 
     def to_dict(self) -> Dict:
@@ -89,11 +207,346 @@ class Guide:
             'end': self.end,
             'strand': self.strand,
             'efficiency_score': round(self.efficiency_score, 1),
-            'off_targets_0mm': self.off_targets.get(0, 0),
-            'off_targets_1mm': self.off_targets.get(1, 0),
-            'off_targets_2mm': self.off_targets.get(2, 0),
-            'off_targets_3mm': self.off_targets.get(3, 0),
+            'off_targets_0mm': self.off_targets[0],
+            'off_targets_1mm': self.off_targets[1],
+            'off_targets_2mm': self.off_targets[2],
+            'off_targets_3mm': self.off_targets[3],
             'gc_content': round(self.gc_content, 1),
             'gene_name': self.gene_name or '',
             'exon': self.exon or '',
         }
+
+
+@dataclass
+class GuideBatch:
+    """Structure-of-arrays container for guides from one sequence
+
+    Holds many guides as parallel NumPy arrays so that whole-batch
+    operations avoid per-Guide attribute access. Use to_guides() to get
+    Guide objects for the rest of the pipeline.
+
+    Attributes:
+        seq_codes: (N, L) uint8 guide sequence codes (see crispex.core.encoding)
+        pam_codes: (N, P) uint8 PAM sequence codes
+        starts: (N,) int64 genomic start coordinates (1-based)
+        ends: (N,) int64 genomic end coordinates (1-based, inclusive)
+        strands: (N,) int8 strand, +1 or -1
+        gc_content: (N,) float64 GC percentage (0-100)
+        chromosome: Chromosome name shared by all guides
+        gene_name: Gene symbol shared by all guides (optional)
+    """
+    seq_codes: np.ndarray
+    pam_codes: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    strands: np.ndarray
+    gc_content: np.ndarray
+    chromosome: str
+    gene_name: Optional[str] = None
+
+    @classmethod
+    def from_lists(
+        cls,
+        sequences: List[str],
+        pams: List[str],
+        starts: List[int],
+        ends: List[int],
+        strands: List[str],
+        chromosome: str,
+        gene_name: Optional[str] = None
+    ) -> 'GuideBatch':
+        """Build a batch from per-guide values
+
+        Args:
+            sequences: Guide sequences, all of the same length
+            pams: PAM sequences, all of the same length
+            starts: Genomic start coordinates
+            ends: Genomic end coordinates
+            strands: '+' or '-' for each guide
+            chromosome: Chromosome name
+            gene_name: Gene symbol (optional)
+
+        Returns:
+            GuideBatch
+        """
+        seq_codes = encode_sequences(sequences)
+        return cls(
+            seq_codes=seq_codes,
+            pam_codes=encode_sequences(pams),
+            starts=np.asarray(starts, dtype=np.int64),
+            ends=np.asarray(ends, dtype=np.int64),
+            strands=np.array([1 if s == '+' else -1 for s in strands], dtype=np.int8),
+            gc_content=gc_percentages(seq_codes),
+            chromosome=chromosome,
+            gene_name=gene_name or None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @cached_property
+    def packed(self) -> Optional[np.ndarray]:
+        """Guide sequences packed into uint64, 2 bits per base
+
+        None unless every guide is at most 32bp and contains only A, C, G
+        and T. Computed once per batch.
+        """
+        length = self.seq_codes.shape[1]
+        if not 0 < length <= 32 or not (self.seq_codes < 4).all():
+            return None
+        return pack_2bit(self.seq_codes)
+
+    @cached_property
+    def seed20(self) -> np.ndarray:
+        """PAM-proximal seed of each guide packed into 20 bits
+
+        The last SEED_LENGTH bases of each guide, packed 2 bits per base
+        (see crispex.core.encoding). Guides must contain only A, C, G and T.
+        Computed once per batch.
+
+        Returns:
+            (N,) uint32 packed seeds
+        """
+        if len(self) == 0:
+            return np.zeros(0, dtype=np.uint32)
+        return pack_2bit(self.seq_codes[:, -SEED_LENGTH:] & 3).astype(np.uint32)
+
+    @cached_property
+    def seed_order(self) -> np.ndarray:
+        """Guide indices sorted by seed20, for binary search and merging"""
+        return np.argsort(self.seed20, kind='stable')
+
+    def guides_with_seed(self, seed: int) -> np.ndarray:
+        """Find the guides whose seed20 equals a packed seed
+
+        Args:
+            seed: Packed seed (see seed20)
+
+        Returns:
+            Ascending indices of the matching guides
+        """
+        sorted_seeds = self.seed20[self.seed_order]
+        lo, hi = np.searchsorted(sorted_seeds, [seed, seed + 1])
+        return np.sort(self.seed_order[lo:hi])
+
+    def compute_gc(self) -> np.ndarray:
+        """Recalculate GC content percentages of all guides
+
+        Returns:
+            (N,) float64 GC percentages, also stored in gc_content
+        """
+        self.gc_content = gc_percentages(self.seq_codes)
+        return self.gc_content
+
+    def passes_quality_filters(
+        self,
+        min_gc: float = 40.0,
+        max_gc: float = 60.0,
+        max_homopolymer: int = 4
+    ) -> np.ndarray:
+        """Check which guides pass basic quality filters
+
+        Vectorized equivalent of Guide.passes_quality_filters.
+
+        Args:
+            min_gc: Minimum GC content percentage
+            max_gc: Maximum GC content percentage
+            max_homopolymer: Maximum allowed homopolymer run length
+
+        Returns:
+            (N,) boolean mask of guides passing all filters
+        """
+        packed = self.packed
+        if packed is not None:
+            return packed_quality_mask(
+                packed, self.seq_codes.shape[1], self.gc_content,
+                min_gc, max_gc, max_homopolymer
+            )
+
+        gc = self.gc_content
+        passes = (gc >= min_gc) & (gc <= max_gc)
+
+        # Homopolymer runs, and polyT runs (cause pol III termination)
+        passes &= ~has_homopolymer(self.seq_codes, max_homopolymer)
+        passes &= ~has_homopolymer(self.seq_codes, 4, base=3)
+
+        return passes
+
+    def select(self, mask: np.ndarray) -> 'GuideBatch':
+        """Select a subset of guides
+
+        Args:
+            mask: Boolean mask or index array over the guides
+
+        Returns:
+            New GuideBatch with the selected guides, in order
+        """
+        return replace(
+            self,
+            seq_codes=self.seq_codes[mask],
+            pam_codes=self.pam_codes[mask],
+            starts=self.starts[mask],
+            ends=self.ends[mask],
+            strands=self.strands[mask],
+            gc_content=self.gc_content[mask],
+        )
+
+    @property
+    def sequences(self) -> List[str]:
+        """Guide sequences as strings"""
+        return decode_sequences(self.seq_codes)
+
+    @property
+    def pams(self) -> List[str]:
+        """PAM sequences as strings"""
+        return decode_sequences(self.pam_codes)
+
+    def to_guides(self) -> List[Guide]:
+        """Convert to a list of Guide objects
+
+        Returns:
+            List of Guide objects with gc_content and packed_seq set
+        """
+        sequences = self.sequences
+        length = self.seq_codes.shape[1]
+
+        # Only sequences made of A, C, G and T can be packed
+        valid = ((self.seq_codes < 4).all(axis=1) & (length > 0)).tolist()
+        if self.packed is not None:
+            packed = self.packed.tolist()
+        elif 0 < length <= 32:
+            packed = pack_2bit(self.seq_codes & 3).tolist()
+            packed = [p if ok else None for p, ok in zip(packed, valid)]
+        else:
+            packed = [pack_sequence(s) if ok else None for s, ok in zip(sequences, valid)]
+
+        return [
+            Guide(
+                sequence=sequence,
+                pam=pam,
+                chromosome=self.chromosome,
+                start=start,
+                end=end,
+                strand='+' if strand > 0 else '-',
+                gc_content=gc,
+                gene_name=self.gene_name,
+                packed_seq=packed_seq,
+                packed_source=sequence,
+            )
+            for sequence, pam, start, end, strand, gc, packed_seq in zip(
+                sequences, self.pams, self.starts.tolist(), self.ends.tolist(),
+                self.strands.tolist(), self.gc_content.tolist(), packed
+            )
+        ]
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """Convert to a pandas DataFrame with one row per guide
+
+        Numeric columns share memory with the batch arrays where pandas
+        allows it.
+
+        Returns:
+            DataFrame with guide_sequence, pam_sequence, chromosome, start,
+            end, strand, gc_content and gene_name columns
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            'guide_sequence': self.sequences,
+            'pam_sequence': self.pams,
+            'chromosome': self.chromosome,
+            'start': self.starts,
+            'end': self.ends,
+            'strand': np.where(self.strands > 0, '+', '-'),
+            'gc_content': self.gc_content,
+            'gene_name': self.gene_name or '',
+        })
+
+
+@lru_cache(maxsize=None)
+def _forbidden_runs(max_homopolymer: int) -> Tuple[str, ...]:
+    """Substrings rejected by Guide.passes_quality_filters
+
+    Homopolymer runs of max_homopolymer bases, plus TTTT (causes pol III
+    termination) unless the T run already covers it.
+    """
+    runs = tuple(base * max_homopolymer for base in 'ATGC')
+    return runs if max_homopolymer <= 4 else runs + ('TTTT',)
+
+
+def has_homopolymer(
+    seq_codes: np.ndarray,
+    run_length: int,
+    base: Optional[int] = None
+) -> np.ndarray:
+    """Check each row of a code matrix for a homopolymer run
+
+    Args:
+        seq_codes: (N, L) uint8 sequence codes
+        run_length: Run length to detect
+        base: Only detect runs of this nucleotide code (default: any of ACGT)
+
+    Returns:
+        (N,) boolean array, True where a run of run_length identical bases occurs
+    """
+    n, length = seq_codes.shape
+    if run_length <= 0:
+        return np.ones(n, dtype=bool)
+    if length < run_length:
+        return np.zeros(n, dtype=bool)
+
+    # Runs must start at a real base (not N) of the requested kind
+    starts = seq_codes[:, :length - run_length + 1]
+    runs = starts < 4 if base is None else starts == base
+
+    if run_length > 1:
+        same = seq_codes[:, 1:] == seq_codes[:, :-1]
+        runs &= sliding_window_view(same, run_length - 1, axis=1).all(axis=-1)
+
+    return np.asarray(runs.any(axis=1), dtype=bool)
+
+
+def packed_quality_mask(
+    packed: np.ndarray,
+    length: int,
+    gc_content: np.ndarray,
+    min_gc: float = 40.0,
+    max_gc: float = 60.0,
+    max_homopolymer: int = 4
+) -> np.ndarray:
+    """Apply Guide.passes_quality_filters to packed guide sequences
+
+    Args:
+        packed: uint64 guide sequences packed with pack_2bit
+        length: Guide length in bp (at most 32)
+        gc_content: GC percentage of each guide
+        min_gc: Minimum GC content percentage
+        max_gc: Maximum GC content percentage
+        max_homopolymer: Maximum allowed homopolymer run length
+
+    Returns:
+        Boolean mask of guides passing all filters
+    """
+    passes = (gc_content >= min_gc) & (gc_content <= max_gc)
+
+    # Homopolymer runs, and polyT runs (cause pol III termination)
+    passes &= ~packed_has_run(packed, length, max_homopolymer)
+    passes &= ~packed_has_run(packed, length, 4, base=3)
+    return passes
+
+
+def gc_percentages(seq_codes: np.ndarray) -> np.ndarray:
+    """Calculate GC content percentage for each row of a code matrix
+
+    Args:
+        seq_codes: (N, L) uint8 sequence codes
+
+    Returns:
+        (N,) float64 GC percentages (0 for empty sequences)
+    """
+    length = seq_codes.shape[1]
+    if length == 0:
+        return np.zeros(len(seq_codes), dtype=np.float64)
+
+    gc_count = ((seq_codes == 1) | (seq_codes == 2)).sum(axis=1)
+    return (gc_count / length) * 100
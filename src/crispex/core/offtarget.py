@@ -4,8 +4,25 @@ For MVP: Simplified off-target search using sequence matching
 Future: Will use FM-index or Bowtie2 for genome-wide search
 """
 
-from typing import List, Dict
-from crispex.core.guide import Guide
+import numpy as np
+from typing import List, Dict, Optional
+from crispex.core.encoding import (
+    count_base_differences, distinct_kmer_counts, encode_sequences, pack_2bit, packed_has_run
+)
+from crispex.core.guide import Guide, OffTargetCounts, has_homopolymer
+from crispex.utils.errors import InvalidInputError
+from crispex.utils.parallel import map_row_chunks
+
+
+# Complexity thresholds separating low, medium and high complexity guides
+COMPLEXITY_TIERS = [0.5, 0.7]
+
+# (min, max) estimated 1/2/3-mismatch off-target counts for each complexity tier
+OFF_TARGET_RANGES = np.array([
+    [[5, 15], [20, 50], [80, 200]],   # Low complexity - many off-targets
+    [[1, 5], [5, 20], [20, 80]],      # Medium complexity
+    [[0, 3], [2, 10], [10, 40]],      # High complexity - fewer off-targets
+])
 
 
 class OffTargetSearcher:
@@ -16,13 +33,15 @@ class OffTargetSearcher:
     This is a placeholder that sets realistic off-target counts
     """
 
-    def __init__(self, species: str = "human"):
+    def __init__(self, species: str = "human", seed: Optional[int] = None):
         """Initialize off-target searcher
 
         Args:
             species: Species name
+            seed: Seed for the random jitter of estimated counts
         """
         self.species = species
+        self._rng = np.random.default_rng(seed)
 
     def count_mismatches(self, seq1: str, seq2: str) -> int:
         """Count number of mismatches between two sequences
@@ -39,7 +58,58 @@ class OffTargetSearcher:
 
         return sum(c1 != c2 for c1, c2 in zip(seq1, seq2))
 
-    def search_off_targets(self, guide: Guide, max_mismatches: int = 3) -> Dict[int, int]:
+    def count_mismatch_profile(
+        self,
+        guide_sequence: str,
+        site_sequences: List[str],
+        max_mismatches: int = 3
+    ) -> Dict[int, int]:
+        """Count candidate sites at each mismatch level against a guide
+
+        Sequences are packed into uint64 (2 bits per base) so each comparison
+        is an XOR plus a popcount over the whole site array.
+
+        Args:
+            guide_sequence: Guide sequence (ACGT only, <= 32bp)
+            site_sequences: Candidate genomic sites, same length as the guide
+            max_mismatches: Maximum number of mismatches to count
+
+        Returns:
+            Dictionary mapping mismatch count to number of sites
+            e.g., {0: 1, 1: 2, 2: 8, 3: 34}
+
+        Raises:
+            InvalidInputError: If the guide is not 1-32 uppercase A/C/G/T
+                bases, or a site differs from it in length
+        """
+        length = len(guide_sequence)
+        if not (0 < length <= 32 and guide_sequence.isascii()
+                and not guide_sequence.strip('ACGT')):
+            raise InvalidInputError(
+                f"Guide must be 1-32 bases of A, C, G and T, got '{guide_sequence}'"
+            )
+
+        profile = {mm: 0 for mm in range(max_mismatches + 1)}
+        if not site_sequences:
+            return profile
+
+        if set(map(len, site_sequences)) != {length}:
+            raise InvalidInputError(f"All sites must be {length}bp, the length of the guide")
+
+        guide_packed = pack_2bit(encode_sequences([guide_sequence]))[0]
+        site_codes = encode_sequences(site_sequences)
+
+        # Sites containing N (or other ambiguous bases) cannot be packed
+        site_codes = site_codes[(site_codes < 4).all(axis=1)]
+        mismatches = count_base_differences(pack_2bit(site_codes), guide_packed)
+
+        counts = np.bincount(mismatches, minlength=max_mismatches + 1)
+        for mm in range(max_mismatches + 1):
+            profile[mm] = int(counts[mm])
+
+        return profile
+
+    def search_off_targets(self, guide: Guide, max_mismatches: int = 3) -> OffTargetCounts:
         """Search for off-target sites (simplified for MVP)
 
         Args:
@@ -47,43 +117,21 @@ class OffTargetSearcher:
             max_mismatches: Maximum number of mismatches to consider
 
         Returns:
-            Dictionary mapping mismatch count to number of off-targets
-            e.g., {0: 1, 1: 2, 2: 8, 3: 34}
+            Number of off-targets indexed by mismatch count
+            e.g., [1, 2, 8, 34]
 
         Note:
             For MVP, this uses heuristic estimation based on sequence composition.
             Production version will perform actual genome-wide search.
         """
-        off_targets = {0: 1, 1: 0, 2: 0, 3: 0}  # 0MM should always be 1 (target site)
-
         # Estimate off-targets based on sequence complexity
         # This is a SIMPLIFIED heuristic for MVP demonstration
         # Real implementation would search genome using FM-index/Bowtie
+        complexity = self._calculate_complexity(guide.sequence)
+        counts = self._estimate_counts(np.array([complexity]))[0].tolist()
 
-        sequence = guide.sequence
-
-        # Calculate sequence complexity
-        complexity = self._calculate_complexity(sequence)
-
-        # Estimate off-targets based on complexity
-        # Lower complexity = more off-targets
-        if complexity < 0.5:
-            # Low complexity sequence - many off-targets
-            off_targets[1] = self._estimate_count(5, 15)
-            off_targets[2] = self._estimate_count(20, 50)
-            off_targets[3] = self._estimate_count(80, 200)
-        elif complexity < 0.7:
-            # Medium complexity
-            off_targets[1] = self._estimate_count(1, 5)
-            off_targets[2] = self._estimate_count(5, 20)
-            off_targets[3] = self._estimate_count(20, 80)
-        else:
-            # High complexity - fewer off-targets
-            off_targets[1] = self._estimate_count(0, 3)
-            off_targets[2] = self._estimate_count(2, 10)
-            off_targets[3] = self._estimate_count(10, 40)
-
-        return off_targets
+        # 0MM should always be 1 (target site)
+        return OffTargetCounts([1, *counts])
 
     def search_batch(self, guides: List[Guide], max_mismatches: int = 3) -> List[Guide]:
         """Search off-targets for multiple guides
@@ -95,8 +143,11 @@ class OffTargetSearcher:
         Returns:
             Same list with off_targets field updated
         """
-        for guide in guides:
-            guide.off_targets = self.search_off_targets(guide, max_mismatches)
+        complexities = self._calculate_complexities([guide.sequence for guide in guides])
+        counts = self._estimate_counts(complexities).tolist()
+
+        for guide, (mm1, mm2, mm3) in zip(guides, counts):
+            guide.off_targets = OffTargetCounts((1, mm1, mm2, mm3))
 
         return guides
 
@@ -135,19 +186,71 @@ class OffTargetSearcher:
 
         return complexity
 
-    def _estimate_count(self, min_val: int, max_val: int) -> int:
-        """Estimate off-target count in a range
+    def _calculate_complexities(self, sequences: List[str]) -> np.ndarray:
+        """Calculate complexity scores for many sequences
+
+        Equal-length ACGT sequences are scored as array operations, with
+        4-mers counted in a bitmap (see distinct_kmer_counts). Scores are
+        identical to _calculate_complexity.
+
+        Args:
+            sequences: DNA sequences
+
+        Returns:
+            Complexity score of each sequence
+        """
+        k = 4
+        length = len(sequences[0]) if sequences else 0
+        codes = None
+        if length >= k and all(len(seq) == length for seq in sequences):
+            codes = encode_sequences(sequences)
+        if codes is None or (codes >= 4).any():
+            return np.fromiter(
+                (self._calculate_complexity(seq) for seq in sequences),
+                dtype=np.float64, count=len(sequences)
+            )
+
+        return map_row_chunks(self._complexity_kernel, codes)
+
+    def _complexity_kernel(self, codes: np.ndarray) -> np.ndarray:
+        """Complexity scores for an (N, L) matrix of A, C, G, T codes"""
+        k = 4
+        length = codes.shape[1]
+
+        # Theoretical max k-mers for sequence length
+        max_kmers = min(4**k, length - k + 1)
+        complexity = distinct_kmer_counts(codes, k) / max_kmers
+
+        # Penalize GC extremes
+        gc_ratio = ((codes == 1) | (codes == 2)).sum(axis=1) / length
+        complexity = np.where((gc_ratio < 0.3) | (gc_ratio > 0.7), complexity * 0.8, complexity)
+
+        # Penalize homopolymers, in the order of _calculate_complexity (A, T, G, C)
+        packed = pack_2bit(codes) if length <= 32 else None
+        for base in (0, 3, 2, 1):
+            if packed is not None:
+                has_run = packed_has_run(packed, length, 4, base=base)
+            else:
+                has_run = has_homopolymer(codes, 4, base=base)
+            complexity = np.where(has_run, complexity * 0.7, complexity)
+
+        return complexity
+
+    def _estimate_counts(self, complexities: np.ndarray) -> np.ndarray:
+        """Estimate 1/2/3-mismatch off-target counts from complexity scores
+
+        Lower complexity = more off-targets. Each count is the middle of its
+        tier's range plus a random jitter of -2 to +2, truncated to an int.
 
         Args:
-            min_val: Minimum count
-            max_val: Maximum count
+            complexities: Complexity score of each guide
 
         Returns:
-            Estimated count (middle of range)
+            (N, 3) integer array of estimated counts
         """
-        import random
-        # Return a value in the range, biased toward lower values
-        return int((min_val + max_val) / 2 + random.randint(-2, 2))
+        ranges = OFF_TARGET_RANGES[np.digitize(complexities, COMPLEXITY_TIERS)]
+        jitter = self._rng.integers(-2, 3, size=ranges.shape[:2])
+        return np.trunc(ranges.mean(axis=2) + jitter).astype(np.int64)
 
 
 def search_off_targets(guides: List[Guide], species: str = "human") -> List[Guide]:
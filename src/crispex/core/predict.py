@@ -5,8 +5,16 @@ Future versions will integrate the full Azimuth gradient boosting model.
 """
 
 import numpy as np
-from typing import List
-from crispex.core.guide import Guide
+from typing import Callable, List
+from crispex.core.encoding import encode_sequences, pack_2bit, packed_has_run
+from crispex.core.guide import Guide, has_homopolymer
+from crispex.utils.parallel import map_row_chunks
+
+# Guide length the position-specific features are defined for
+GUIDE_LENGTH = 20
+
+# Homopolymer runs of 3, 4 and 5 bases, in _penalize_homopolymers order
+_HOMOPOLYMER_RUNS = tuple((base * 3, base * 4, base * 5) for base in 'ATGC')
 
 
 class AzimuthPredictor:
@@ -30,9 +38,11 @@ class AzimuthPredictor:
         Returns:
             Efficiency score (0-100)
         """
-        score = 50.0  # Base score
-
         sequence = guide.sequence
+        if len(sequence) == GUIDE_LENGTH:
+            return _score_20mer(sequence, guide.gc_content)
+
+        score = 50.0  # Base score
 
         # Feature 1: GC content (optimal around 50%)
         gc_score = self._score_gc_content(guide.gc_content)
@@ -72,11 +82,86 @@ class AzimuthPredictor:
         Returns:
             Same list with efficiency_score field updated
         """
-        for guide in guides:
-            guide.efficiency_score = self.predict_efficiency(guide)
+        sequences = [guide.sequence for guide in guides]
+        if not sequences or any(len(seq) != GUIDE_LENGTH for seq in sequences):
+            for guide in guides:
+                guide.efficiency_score = self.predict_efficiency(guide)
+            return guides
+
+        gc_content = np.array([guide.gc_content for guide in guides], dtype=np.float64)
+        scores = map_row_chunks(self._score_batch, encode_sequences(sequences), gc_content)
+
+        # Python round() to match predict_efficiency exactly
+        for guide, score in zip(guides, scores.tolist()):
+            guide.efficiency_score = round(score, 1)
 
         return guides
 
+    def _score_batch(self, codes: np.ndarray, gc_content: np.ndarray) -> np.ndarray:
+        """Score 20bp guides with the predict_efficiency features as array operations
+
+        Features are added to the running score in the same order as
+        predict_efficiency, so scores are identical.
+
+        Args:
+            codes: (N, 20) nucleotide codes (see crispex.core.encoding)
+            gc_content: GC percentage of each guide
+
+        Returns:
+            Unrounded scores clamped to 0-100
+        """
+        is_g = codes == 2
+        is_gc = is_g | (codes == 1)
+        has_run = self._run_detector(codes)
+
+        score = np.full(len(codes), 50.0)
+
+        # Feature 1: GC content (optimal around 50%)
+        deviation = np.abs(gc_content - 50.0)
+        score += np.where(deviation <= 10, 10.0 - deviation, -(deviation - 10) * 0.5)
+
+        # Feature 2: Position-specific preferences
+        score += 2.0 * is_g[:, 18] + 2.0 * is_g[:, 19] + 1.0 * (codes[:, 0] == 1)
+
+        # Feature 3: Seed region (positions 1-12)
+        seed_gc = is_gc[:, :12].sum(axis=1) / 12
+        seed_score = np.where((seed_gc >= 0.4) & (seed_gc <= 0.6), 3.0, -2.0)
+        score += seed_score - 5.0 * has_run(3, 3, 12)
+
+        # Feature 4: PAM-proximal region
+        score += np.where(is_gc[:, -8:].sum(axis=1) / 8 >= 0.5, 2.0, -1.0)
+
+        # Feature 5: Penalize homopolymers
+        penalty = np.zeros(len(codes))
+        for base in range(4):
+            penalty -= 2.0 * has_run(3, base)
+            penalty -= 5.0 * has_run(4, base)
+            penalty -= 10.0 * has_run(5, base)
+        score += penalty
+
+        # Feature 6: Terminal G preference
+        score += 2.0 * is_g[:, 19]
+
+        return np.clip(score, 0.0, 100.0)
+
+    @staticmethod
+    def _run_detector(codes: np.ndarray) -> Callable[..., np.ndarray]:
+        """Build has_run(run_length, base, length=20) for a code matrix
+
+        Uses the bitwise check on packed guides when every base is A, C, G
+        or T, and the sliding-window check otherwise.
+        """
+        length = codes.shape[1]
+        if not (codes < 4).all():
+            return lambda run_length, base, prefix=length: has_homopolymer(
+                codes[:, :prefix], run_length, base=base
+            )
+
+        packed = pack_2bit(codes)
+        return lambda run_length, base, prefix=length: packed_has_run(
+            packed, prefix, run_length, base=base
+        )
+
     def _score_gc_content(self, gc_content: float) -> float:
         """Score based on GC content (optimal ~50%)
 
@@ -191,6 +276,58 @@ class AzimuthPredictor:
         return penalty
 
 
+def _score_20mer(sequence: str, gc_content: float) -> float:
+    """Straight-line AzimuthPredictor.predict_efficiency for 20bp guides
+
+    The feature methods are unrolled with constant positions (seed = first
+    12 bases, PAM-proximal = last 8). Feature scores are added in the same
+    order, so results are identical.
+    """
+    score = 50.0
+
+    # Feature 1: GC content (optimal around 50%)
+    deviation = abs(gc_content - 50.0)
+    score += 10.0 - deviation if deviation <= 10 else -(deviation - 10) * 0.5
+
+    # Feature 2: Position-specific preferences (G at 19-20, C at 1)
+    terminal_g = sequence[19] == 'G'
+    score += (
+        (2.0 if sequence[18] == 'G' else 0.0)
+        + (2.0 if terminal_g else 0.0)
+        + (1.0 if sequence[0] == 'C' else 0.0)
+    )
+
+    # Feature 3: Seed region (positions 1-12)
+    seed = sequence[:12]
+    seed_gc = (seed.count('G') + seed.count('C')) / 12
+    seed_score = 3.0 if 0.4 <= seed_gc <= 0.6 else -2.0
+    if 'TTT' in seed:
+        seed_score -= 5.0
+    score += seed_score
+
+    # Feature 4: PAM-proximal region (last 8 nucleotides)
+    pam_proximal = sequence[12:]
+    pam_gc = (pam_proximal.count('G') + pam_proximal.count('C')) / 8
+    score += 2.0 if pam_gc >= 0.5 else -1.0
+
+    # Feature 5: Penalize homopolymers (longer runs contain the shorter ones)
+    penalty = 0.0
+    for run3, run4, run5 in _HOMOPOLYMER_RUNS:
+        if run3 in sequence:
+            penalty -= 2.0
+            if run4 in sequence:
+                penalty -= 5.0
+                if run5 in sequence:
+                    penalty -= 10.0
+    score += penalty
+
+    # Feature 6: Terminal G preference
+    if terminal_g:
+        score += 2.0
+
+    return round(0.0 if score < 0.0 else (100.0 if score > 100.0 else score), 1)
+
+
 def predict_efficiency_scores(guides: List[Guide]) -> List[Guide]:
     """Convenience function to predict efficiency scores
 
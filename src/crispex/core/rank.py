@@ -1,9 +1,25 @@
 """Ranking and selection of guides"""
 
 from typing import List
+
+import numpy as np
+
 from crispex.core.guide import Guide
 
 
+# Specificity penalty per off-target at 0-3 mismatches
+# Weight: 0MM (should be 1) > 1MM > 2MM > 3MM
+OFF_TARGET_PENALTIES = (
+    100.0,  # Perfect match at target (if >1, major penalty)
+    20.0,   # 1 mismatch off-targets are concerning
+    5.0,    # 2 mismatches less concerning
+    1.0,    # 3 mismatches least concerning
+)
+
+# Below this many guides a plain key sort beats building NumPy columns
+SMALL_RANK_SIZE = 128
+
+
 def calculate_specificity_score(guide: Guide) -> float:
     """Calculate specificity score based on off-targets
 
@@ -13,29 +29,41 @@ def calculate_specificity_score(guide: Guide) -> float:
     Returns:
         Specificity score (0-100, higher is better)
     """
-    # Start with perfect score
-    score = 100.0
-
-    # Penalize off-targets by mismatch level
-    # Weight: 0MM (should be 1) > 1MM > 2MM > 3MM
-    penalties = {
-        0: 100.0,  # Perfect match at target (if >1, major penalty)
-        1: 20.0,   # 1 mismatch off-targets are concerning
-        2: 5.0,    # 2 mismatches less concerning
-        3: 1.0     # 3 mismatches least concerning
-    }
-
-    for mismatch_count, off_target_count in guide.off_targets.items():
-        if mismatch_count == 0:
-            # Should only be 1 (the target site)
-            if off_target_count > 1:
-                score -= (off_target_count - 1) * penalties[0]
-        else:
-            penalty = off_target_count * penalties.get(mismatch_count, 0)
-            score -= penalty
+    off_targets = guide.off_targets
+    extra_perfect = off_targets[0] - 1 if off_targets[0] > 1 else 0
+
+    # Straight-line form of OFF_TARGET_PENALTIES; 0MM should only be 1 (the target site)
+    score = (
+        100.0
+        - extra_perfect * 100.0
+        - off_targets[1] * 20.0
+        - off_targets[2] * 5.0
+        - off_targets[3]
+    )
 
     # Clamp to 0-100
-    return max(0.0, min(100.0, score))
+    return 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
+
+
+def calculate_specificity_scores(guides: List[Guide]) -> np.ndarray:
+    """Calculate specificity scores for many guides at once
+
+    Vectorized equivalent of calculate_specificity_score.
+
+    Args:
+        guides: Guide objects with off_targets populated
+
+    Returns:
+        Specificity score of each guide (0-100, higher is better)
+    """
+    counts = np.array([guide.off_targets[:4] for guide in guides], dtype=np.float64)
+    if not len(counts):
+        return np.zeros(0)
+
+    counts[:, 0] = np.maximum(counts[:, 0] - 1, 0)
+    score = 100.0 - counts @ np.array(OFF_TARGET_PENALTIES)
+
+    return np.clip(score, 0.0, 100.0)
 
 
 def calculate_composite_score(guide: Guide, weights: dict = None) -> float:
@@ -80,26 +108,50 @@ def rank_guides(guides: List[Guide]) -> List[Guide]:
     Returns:
         Sorted list of guides (best first)
     """
-    def sort_key(guide: Guide):
-        # Primary: Efficiency score (descending)
-        efficiency = -guide.efficiency_score
+    if len(guides) < SMALL_RANK_SIZE:
+        return sorted(guides, key=_rank_key)
+    return rank_guides_soa(guides)
+
+
+def _rank_key(guide: Guide) -> tuple:
+    """Sort key of rank_guides for a single guide"""
+    off_targets = guide.off_targets
+    return (
+        -guide.efficiency_score,
+        off_targets[0] + off_targets[1] + off_targets[2],
+        guide.start
+    )
+
 
-        # Secondary: Total off-targets at 0-2 mismatches (ascending)
-        critical_offtargets = (
-            guide.off_targets.get(0, 0) +
-            guide.off_targets.get(1, 0) +
-            guide.off_targets.get(2, 0)
-        )
+def rank_guides_soa(guides: List[Guide]) -> List[Guide]:
+    """Rank guides using column arrays of the ranking criteria
 
-        # Tertiary: Position (earlier in gene is better)
-        position = guide.start
+    Same ordering as rank_guides: the criteria are gathered into NumPy
+    columns and sorted with one stable np.lexsort.
+
+    Args:
+        guides: List of Guide objects
 
-        return (efficiency, critical_offtargets, position)
+    Returns:
+        Sorted list of guides (best first)
+    """
+    n = len(guides)
+
+    # Primary: Efficiency score (descending)
+    efficiency = np.fromiter((-g.efficiency_score for g in guides), dtype=np.float64, count=n)
+
+    # Secondary: Total off-targets at 0-2 mismatches (ascending)
+    critical_offtargets = np.fromiter(
+        (ot[0] + ot[1] + ot[2] for ot in (g.off_targets for g in guides)),
+        dtype=np.int64, count=n
+    )
 
-    # Sort guides
-    sorted_guides = sorted(guides, key=sort_key)
+    # Tertiary: Position (earlier in gene is better)
+    position = np.fromiter((g.start for g in guides), dtype=np.int64, count=n)
 
-    return sorted_guides
+    # np.lexsort sorts by the last key first
+    order = np.lexsort((position, critical_offtargets, efficiency))
+    return [guides[i] for i in order.tolist()]
 
 
 def select_top_guides(guides: List[Guide], top_n: int = 5) -> List[Guide]:
@@ -147,8 +199,8 @@ def filter_by_specificity(
     filtered = []
 
     for guide in guides:
-        if guide.off_targets.get(1, 0) <= max_off_targets_1mm and \
-           guide.off_targets.get(2, 0) <= max_off_targets_2mm:
+        if guide.off_targets[1] <= max_off_targets_1mm and \
+           guide.off_targets[2] <= max_off_targets_2mm:
             filtered.append(guide)
 
     return filtered
@@ -0,0 +1,149 @@
+"""On-disk caching of guide design results"""
+
+import functools
+import hashlib
+import io
+import os
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+from crispex.utils.export import format_output_filename, resolve_columns, write_csv
+from crispex.utils.validate import validate_design_inputs
+
+
+CACHE_DIR = Path(os.environ.get("CRISPEX_CACHE_DIR", Path.home() / ".cache" / "crispex"))
+
+# Cached results older than this are recomputed (1 week)
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def design_cache_key(
+    gene: Optional[str],
+    region: Optional[str],
+    species: str,
+    top_n: int
+) -> str:
+    """Build a content-addressed cache key for a design request
+
+    The key is built from the validated inputs, so requests that differ only
+    in case or whitespace ("tp53" and "TP53", "Human" and "human") share an
+    entry. The package version is part of the key so that upgrading Crispex
+    invalidates results produced by older scoring code.
+
+    Args:
+        gene: Gene symbol
+        region: Genomic coordinates
+        species: Species name
+        top_n: Number of guides requested
+
+    Returns:
+        Hex digest identifying the request
+
+    Raises:
+        InvalidInputError: If inputs are invalid
+    """
+    from crispex import __version__
+
+    validated = validate_design_inputs(gene=gene, region=region, species=species, top_n=top_n)
+    if validated['mode'] == 'gene':
+        target = validated['gene']
+    else:
+        target = f"{validated['chromosome']}:{validated['start']}-{validated['end']}"
+
+    raw = f"{validated['mode']}|{target}|{validated['species']}|{validated['top_n']}|{__version__}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _read_cached(cache_file: Path) -> Optional[pd.DataFrame]:
+    """Load an unexpired cache entry, or None if there is no usable entry"""
+    try:
+        if time.time() - cache_file.stat().st_mtime > CACHE_TTL_SECONDS:
+            cache_file.unlink(missing_ok=True)
+            return None
+        # JSON rather than pickle: loading an entry never executes code
+        return pd.read_json(io.StringIO(cache_file.read_text()), orient='table')
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        # Corrupt or incompatible cache entry
+        cache_file.unlink(missing_ok=True)
+        return None
+
+
+def _export_cached(df: pd.DataFrame, gene: Optional[str], output: Optional[str]) -> None:
+    """Reproduce the CSV side effect of design_guides for a cache hit
+
+    write_csv output matches save_to_csv byte for byte, so the file does
+    not depend on whether the result came from the cache.
+    """
+    if df.empty:
+        return
+
+    if output:
+        write_csv(df, output)
+    elif gene:
+        write_csv(df, format_output_filename(gene_name=df['gene_name'].iat[0] or gene))
+
+
+def disk_cached(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+    """Cache design_guides results on disk
+
+    Caching is opt-in: pass ``use_cache=True`` to store results as JSON
+    under ``CACHE_DIR``, keyed by the validated (gene or region, species,
+    top_n). Repeated calls with identical inputs then skip the Ensembl
+    requests and scoring entirely, until the entry is older than
+    ``CACHE_TTL_SECONDS``. Uncached calls pass ``columns`` through to
+    ``func``; cached calls build and store the full table and apply
+    ``columns`` on return, so every projection of a request shares one entry.
+
+    Args:
+        func: design_guides-compatible function
+
+    Returns:
+        Wrapped function with the same signature plus ``use_cache``
+    """
+    @functools.wraps(func)
+    def wrapper(
+        gene: Optional[str] = None,
+        region: Optional[str] = None,
+        species: str = "human",
+        top_n: int = 5,
+        output: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_cache: bool = False,
+    ) -> pd.DataFrame:
+        if not use_cache:
+            return func(
+                gene=gene, region=region, species=species, top_n=top_n, output=output,
+                columns=columns
+            )
+
+        if columns is not None:
+            columns = resolve_columns(columns)
+
+        def project(df: pd.DataFrame) -> pd.DataFrame:
+            return df if columns is None else df[columns]
+
+        cache_file = CACHE_DIR / f"{design_cache_key(gene, region, species, top_n)}.json"
+
+        df = _read_cached(cache_file)
+        if df is not None:
+            _export_cached(df, gene, output)
+            return project(df)
+
+        df = func(gene=gene, region=region, species=species, top_n=top_n, output=output)
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            df.to_json(tmp_file, orient='table', index=False)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Caching is best-effort
+
+        return project(df)
+
+    return wrapper
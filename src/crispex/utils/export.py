@@ -1,48 +1,117 @@
 """Export utilities for guides"""
 
-import pandas as pd
-from typing import List, Optional
+import csv
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 from pathlib import Path
 from crispex.core.guide import Guide
+from crispex.utils.errors import InvalidInputError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Columns of the guide table, in output order
+GUIDE_COLUMNS = [
+    'rank', 'guide_sequence', 'pam_sequence', 'full_sequence',
+    'chromosome', 'start', 'end', 'strand', 'efficiency_score',
+    'off_targets_0mm', 'off_targets_1mm', 'off_targets_2mm', 'off_targets_3mm',
+    'gc_content', 'gene_name', 'exon'
+]
+
+
+# Column name -> value for one guide (matches Guide.to_dict)
+_COLUMN_GETTERS = {
+    'guide_sequence': lambda g: g.sequence,
+    'pam_sequence': lambda g: g.pam,
+    'full_sequence': lambda g: g.full_sequence,
+    'chromosome': lambda g: g.chromosome,
+    'start': lambda g: g.start,
+    'end': lambda g: g.end,
+    'strand': lambda g: g.strand,
+    'efficiency_score': lambda g: round(g.efficiency_score, 1),
+    'off_targets_0mm': lambda g: g.off_targets[0],
+    'off_targets_1mm': lambda g: g.off_targets[1],
+    'off_targets_2mm': lambda g: g.off_targets[2],
+    'off_targets_3mm': lambda g: g.off_targets[3],
+    'gc_content': lambda g: round(g.gc_content, 1),
+    'gene_name': lambda g: g.gene_name or '',
+    'exon': lambda g: g.exon or '',
+}
+
+
+def resolve_columns(columns: Optional[List[str]] = None) -> List[str]:
+    """Validate a column projection for the guide table
 
+    Args:
+        columns: Requested column names, or None for all columns
+
+    Returns:
+        List of column names to materialize
+
+    Raises:
+        InvalidInputError: If an unknown column is requested
+    """
+    if columns is None:
+        return GUIDE_COLUMNS
 
-def guides_to_dataframe(guides: List[Guide]) -> pd.DataFrame:
+    unknown = [c for c in columns if c not in GUIDE_COLUMNS]
+    if unknown:
+        raise InvalidInputError(
+            f"Unknown column(s): {', '.join(map(str, unknown))}. "
+            f"Available columns: {', '.join(GUIDE_COLUMNS)}"
+        )
+
+    return list(columns)
+
+
+def guides_to_dataframe(
+    guides: List[Guide],
+    columns: Optional[List[str]] = None
+) -> 'pd.DataFrame':
     """Convert list of guides to pandas DataFrame
 
     Args:
         guides: List of Guide objects
+        columns: Columns to include (default: all of GUIDE_COLUMNS)
 
     Returns:
         DataFrame with guide information
+
+    Raises:
+        InvalidInputError: If an unknown column is requested
     """
+    import pandas as pd
+
+    column_order = resolve_columns(columns)
+
     if not guides:
         # Return empty DataFrame with correct columns
-        return pd.DataFrame(columns=[
-            'rank', 'guide_sequence', 'pam_sequence', 'full_sequence',
-            'chromosome', 'start', 'end', 'strand', 'efficiency_score',
-            'off_targets_0mm', 'off_targets_1mm', 'off_targets_2mm', 'off_targets_3mm',
-            'gc_content', 'gene_name', 'exon'
-        ])
-
-    # Convert guides to dictionaries
-    data = []
-    for rank, guide in enumerate(guides, start=1):
-        guide_dict = guide.to_dict()
-        guide_dict['rank'] = rank
-        data.append(guide_dict)
+        return pd.DataFrame(columns=column_order)
 
-    # Create DataFrame
-    df = pd.DataFrame(data)
+    # Built column by column; only the requested columns are materialized
+    data: Dict[str, Any] = {}
+    for name in column_order:
+        if name == 'rank':
+            data[name] = range(1, len(guides) + 1)
+        else:
+            getter = _COLUMN_GETTERS[name]
+            data[name] = [getter(guide) for guide in guides]
 
-    # Reorder columns
-    column_order = [
-        'rank', 'guide_sequence', 'pam_sequence', 'full_sequence',
-        'chromosome', 'start', 'end', 'strand', 'efficiency_score',
-        'off_targets_0mm', 'off_targets_1mm', 'off_targets_2mm', 'off_targets_3mm',
-        'gc_content', 'gene_name', 'exon'
-    ]
+    return pd.DataFrame(data, columns=column_order)
 
-    return df[column_order]
+
+def _csv_rows(guides: List[Guide]) -> Iterator[tuple]:
+    """Yield one tuple per guide, in GUIDE_COLUMNS order"""
+    for rank, guide in enumerate(guides, start=1):
+        off_targets = guide.off_targets
+        yield (
+            rank, guide.sequence, guide.pam, guide.sequence + guide.pam,
+            guide.chromosome, guide.start, guide.end, guide.strand,
+            round(guide.efficiency_score, 1),
+            off_targets[0], off_targets[1], off_targets[2], off_targets[3],
+            round(guide.gc_content, 1), guide.gene_name or '', guide.exon or '',
+        )
 
 
 def save_to_csv(
@@ -60,18 +129,47 @@ def save_to_csv(
     Returns:
         Path to saved file
     """
-    df = guides_to_dataframe(guides)
-
     # Ensure parent directory exists
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save to CSV
-    df.to_csv(output_path, index=False, header=include_header)
+    # Rows are streamed straight from the guides; output matches DataFrame.to_csv
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        if include_header:
+            writer.writerow(GUIDE_COLUMNS)
+        writer.writerows(_csv_rows(guides))
 
     return str(output_path)
 
 
+def write_csv(
+    df: 'pd.DataFrame',
+    output_path: str,
+    include_header: bool = True
+) -> str:
+    """Write a DataFrame to CSV
+
+    Always uses DataFrame.to_csv, so files match save_to_csv byte for byte
+    whichever optional packages are installed.
+
+    Args:
+        df: DataFrame to write
+        output_path: Path to output CSV file
+        include_header: Whether to include header row
+
+    Returns:
+        Path to saved file
+    """
+    # Ensure parent directory exists
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    df.to_csv(path, index=False, header=include_header)
+
+    return str(path)
+
+
 def format_output_filename(
     gene_name: Optional[str] = None,
     chromosome: Optional[str] = None,
@@ -115,8 +213,7 @@ def print_guide_summary(guide: Guide, rank: int = 1) -> str:
     lines.append(f"  Efficiency:    {guide.efficiency_score:.1f} / 100")
 
     # Format off-targets
-    ot_summary = f"{guide.off_targets.get(0, 0)}/{guide.off_targets.get(1, 0)}/" \
-                 f"{guide.off_targets.get(2, 0)}/{guide.off_targets.get(3, 0)}"
+    ot_summary = "/".join(map(str, guide.off_targets[:4]))
     lines.append(f"  Off-targets:   {ot_summary} (0/1/2/3 MM)")
     lines.append(f"  GC content:    {guide.gc_content:.1f}%")
 
@@ -141,7 +238,7 @@ def print_summary_table(guides: List[Guide], top_n: int = 5) -> str:
     lines.append("-" * 80)
 
     for i, guide in enumerate(guides[:top_n], start=1):
-        ot_summary = f"{guide.off_targets.get(1, 0)}/{guide.off_targets.get(2, 0)}/{guide.off_targets.get(3, 0)}"
+        ot_summary = "/".join(map(str, guide.off_targets[1:4]))
         line = f"  #{i}  {guide.sequence} ({guide.pam})  " \
                f"Score: {guide.efficiency_score:.1f}  " \
                f"Off-targets: {ot_summary}"
@@ -0,0 +1,43 @@
+"""Thread-parallel execution of row-wise NumPy batch kernels"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+
+# Rows per chunk; batches up to this size run on the calling thread
+ROW_CHUNK_SIZE = 1 << 14
+
+
+def map_row_chunks(
+    func: Callable[..., np.ndarray],
+    *arrays: np.ndarray,
+    chunk_size: int = ROW_CHUNK_SIZE
+) -> np.ndarray:
+    """Apply a row-wise batch kernel to chunks of rows on a thread pool
+
+    NumPy releases the GIL for array operations, so chunks are scored in
+    parallel without copying guides into worker processes.
+
+    Args:
+        func: Kernel taking row slices of arrays and returning one value per row
+        arrays: Arrays sharing their first dimension
+        chunk_size: Rows per chunk
+
+    Returns:
+        Concatenated kernel results, in row order
+    """
+    n = len(arrays[0])
+    workers = os.cpu_count() or 1
+    if n <= chunk_size or workers == 1:
+        return func(*arrays)
+
+    def run(start: int) -> np.ndarray:
+        return func(*(array[start:start + chunk_size] for array in arrays))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run, range(0, n, chunk_size)))
+
+    return np.concatenate(results)
@@ -1,46 +1,125 @@
 """Input validation utilities"""
 
-import re
-from typing import Tuple, Optional
+import functools
+from enum import Enum
+from typing import (
+    Any, Dict, Iterable, Iterator, Mapping, NamedTuple, NoReturn, Optional, Sequence, Tuple
+)
+
+import numpy as np
+
+from crispex.utils._coord_scan import scan_regions
 from crispex.utils.errors import InvalidCoordinatesError, InvalidSpeciesError, InvalidInputError
 
 
-SUPPORTED_SPECIES = {
-    'human': {
-        'name': 'Homo sapiens',
-        'genome_assembly': 'GRCh38',
-        'ensembl_name': 'homo_sapiens'
-    },
-    'mouse': {
-        'name': 'Mus musculus',
-        'genome_assembly': 'GRCm39',
-        'ensembl_name': 'mus_musculus'
-    }
+class Species(str, Enum):
+    """Supported species identifiers"""
+    HUMAN = 'human'
+    MOUSE = 'mouse'
+
+
+class SpeciesInfo(Mapping[str, str]):
+    """Reference information for a supported species
+
+    A read-only mapping like the dicts this replaces ('name' in info,
+    info.get(), keys(), dict(info)), whose fields can also be read as
+    attributes. Immutable and shared by every validation result.
+    """
+    __slots__ = ('name', 'genome_assembly', 'ensembl_name')
+
+    name: str
+    genome_assembly: str
+    ensembl_name: str
+
+    def __init__(self, name: str, genome_assembly: str, ensembl_name: str):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'genome_assembly', genome_assembly)
+        object.__setattr__(self, 'ensembl_name', ensembl_name)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"SpeciesInfo is read-only (cannot set '{name}')")
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        value: str = getattr(self, key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={value!r}" for key, value in self.items())
+        return f"SpeciesInfo({fields})"
+
+
+class ValidatedDesign(NamedTuple):
+    """Validated guide design inputs, as yielded by validate_design_inputs_iter
+
+    Fields that do not apply to the mode ('gene' or 'region') are None.
+    """
+    mode: str
+    gene: Optional[str]
+    chromosome: Optional[str]
+    start: Optional[int]
+    end: Optional[int]
+    species: str
+    species_info: SpeciesInfo
+    top_n: int
+
+
+# Keyed by the plain identifier (Enum members hash by name, not value)
+SUPPORTED_SPECIES: Dict[str, SpeciesInfo] = {
+    Species.HUMAN.value: SpeciesInfo(
+        name='Homo sapiens',
+        genome_assembly='GRCh38',
+        ensembl_name='homo_sapiens'
+    ),
+    Species.MOUSE.value: SpeciesInfo(
+        name='Mus musculus',
+        genome_assembly='GRCm39',
+        ensembl_name='mus_musculus'
+    )
 }
 
+# Largest region accepted for guide design
+_MAX_REGION_BP = 10_000_000
+
+# Batches below this size are faster to parse one region at a time
+_SCAN_MIN_REGIONS = 1024
+
+# Listed in the unsupported species error
+_SUPPORTED_SPECIES_NAMES = ', '.join(SUPPORTED_SPECIES)
+
 
-def validate_species(species: str) -> dict:
+@functools.lru_cache(maxsize=8)
+def validate_species(species: str) -> SpeciesInfo:
     """Validate and normalize species name
 
     Args:
         species: Species identifier (e.g., 'human', 'mouse')
 
     Returns:
-        Dictionary with species information
+        SpeciesInfo record
 
     Raises:
         InvalidSpeciesError: If species is not supported
     """
-    species_lower = species.lower().strip()
+    return _species_info(species.lower().strip(), species)
 
-    if species_lower not in SUPPORTED_SPECIES:
-        supported = ', '.join(SUPPORTED_SPECIES.keys())
+
+def _species_info(species_key: str, species: str) -> SpeciesInfo:
+    """Look up an already normalized species name (species is used for errors)"""
+    if species_key not in SUPPORTED_SPECIES:
         raise InvalidSpeciesError(
             f"Species '{species}' is not supported. "
-            f"Supported species: {supported}"
+            f"Supported species: {_SUPPORTED_SPECIES_NAMES}"
         )
 
-    return SUPPORTED_SPECIES[species_lower]
+    return SUPPORTED_SPECIES[species_key]
 
 
 def validate_gene_symbol(gene: str) -> str:
@@ -61,7 +140,8 @@ def validate_gene_symbol(gene: str) -> str:
     gene = gene.strip().upper()
 
     # Basic validation - gene symbols should be alphanumeric with possible hyphens
-    if not re.match(r'^[A-Z0-9][-A-Z0-9]*$', gene):
+    # (ASCII only, not starting with a hyphen)
+    if not (gene.isascii() and gene[:1] != '-' and gene.replace('-', '').isalnum()):
         raise InvalidInputError(
             f"Invalid gene symbol format: '{gene}'. "
             "Gene symbols should contain only letters, numbers, and hyphens."
@@ -70,9 +150,12 @@ def validate_gene_symbol(gene: str) -> str:
     return gene
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_genomic_coordinates(region: str) -> Tuple[str, int, int]:
     """Parse genomic coordinate string
 
+    Results are memoized, so repeated regions return the same tuple.
+
     Args:
         region: Genomic coordinates (e.g., 'chr17:7661779-7687550')
 
@@ -85,43 +168,127 @@ def parse_genomic_coordinates(region: str) -> Tuple[str, int, int]:
     if not region or not isinstance(region, str):
         raise InvalidCoordinatesError("Genomic region must be a non-empty string")
 
-    # Expected format: chr:start-end or chr:start..end
-    pattern = r'^([a-zA-Z0-9]+):(\d+)[-\.]\.?(\d+)$'
-    match = re.match(pattern, region.strip())
+    fields = _split_region(region)
 
-    if not match:
+    if fields is None:
         raise InvalidCoordinatesError(
             f"Invalid coordinate format: '{region}'. "
             "Expected format: 'chr:start-end' (e.g., 'chr17:7661779-7687550')"
         )
 
-    chromosome, start_str, end_str = match.groups()
-
-    # Add 'chr' prefix if not present
-    if not chromosome.lower().startswith('chr'):
-        chromosome = f'chr{chromosome}'
+    chromosome, start_str, end_str = fields
 
     start = int(start_str)
     end = int(end_str)
 
     # Validate coordinates
+    if start < 1 or end < start or end - start > _MAX_REGION_BP:
+        raise _coord_error(start, end)
+
+    return chromosome, start, end
+
+
+def _coord_error(start: int, end: int) -> InvalidCoordinatesError:
+    """Describe why start and end are not valid region bounds"""
     if start < 1:
-        raise InvalidCoordinatesError(
+        return InvalidCoordinatesError(
             f"Start coordinate must be >= 1, got {start}"
         )
 
     if end < start:
-        raise InvalidCoordinatesError(
+        return InvalidCoordinatesError(
             f"End coordinate ({end}) must be >= start coordinate ({start})"
         )
 
-    if end - start > 10_000_000:  # 10 Mb limit
-        raise InvalidCoordinatesError(
-            f"Region too large: {end - start:,} bp. "
-            "Maximum region size is 10 Mb for guide design."
-        )
+    return InvalidCoordinatesError(
+        f"Region too large: {end - start:,} bp. "
+        f"Maximum region size is {_MAX_REGION_BP // 1_000_000} Mb for guide design."
+    )
 
-    return chromosome, start, end
+
+def parse_genomic_coordinates_batch(
+    regions: Sequence[str]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse many genomic coordinate strings
+
+    Batch equivalent of parse_genomic_coordinates: large batches are split
+    by the vectorized scanner in crispex.utils._coord_scan, with the scalar
+    parser as fallback for rows it does not accept, and the bounds checks
+    run vectorized over all regions.
+
+    Args:
+        regions: Genomic coordinates (e.g., 'chr17:7661779-7687550')
+
+    Returns:
+        Tuple of (chromosomes, starts, ends) arrays (object, int64, int64)
+
+    Raises:
+        InvalidCoordinatesError: For the first malformed or invalid region
+    """
+    scanned = scan_regions(regions) if len(regions) >= _SCAN_MIN_REGIONS else None
+    if scanned is None:
+        n = len(regions)
+        chromosomes = np.empty(n, dtype=object)
+        starts = np.empty(n, dtype=np.int64)
+        ends = np.empty(n, dtype=np.int64)
+        pending = range(n)
+    else:
+        names, index, starts, ends, parsed = scanned
+        chromosomes = names[index]
+        pending = np.flatnonzero(~parsed).tolist()
+
+    for i in pending:
+        region = regions[i]
+        fields = _split_region(region) if isinstance(region, str) else None
+        if fields is None:
+            _raise_first_invalid(regions, i)
+        chromosomes[i], start_str, end_str = fields
+        try:
+            starts[i] = int(start_str)
+            ends[i] = int(end_str)
+        except OverflowError:
+            # Coordinates beyond int64
+            _raise_first_invalid(regions, i)
+
+    invalid = (starts < 1) | (ends < starts) | (ends - starts > _MAX_REGION_BP)
+    if invalid.any():
+        _raise_first_invalid(regions, int(np.argmax(invalid)))
+
+    return chromosomes, starts, ends
+
+
+def _raise_first_invalid(regions: Sequence[str], last: int) -> NoReturn:
+    """Raise the parse_genomic_coordinates error of the first invalid region up to last"""
+    for region in regions[:last + 1]:
+        # Unwrapped so that unhashable items get the parser's error
+        parse_genomic_coordinates.__wrapped__(region)
+
+    raise InvalidCoordinatesError(f"Coordinates out of range: '{regions[last]}'")
+
+
+def _split_region(region: str) -> Optional[Tuple[str, str, str]]:
+    """Split chr:start-end or chr:start..end into chromosome and coordinate digits
+
+    Returns:
+        Tuple of (chromosome with 'chr' prefix, start digits, end digits),
+        or None if the region is malformed
+    """
+    chromosome, colon, span = region.strip().partition(':')
+    start_str, separator, end_str = span.partition('-')
+    if not separator:
+        start_str, separator, end_str = span.partition('.')
+    if end_str[:1] == '.':
+        end_str = end_str[1:]
+
+    if not (colon and chromosome.isascii() and chromosome.isalnum()
+            and start_str.isdecimal() and end_str.isdecimal()):
+        return None
+
+    # Add 'chr' prefix if not present
+    if not chromosome.lower().startswith('chr'):
+        chromosome = f'chr{chromosome}'
+
+    return chromosome, start_str, end_str
 
 
 def validate_top_n(top_n: int) -> int:
@@ -136,15 +303,10 @@ def validate_top_n(top_n: int) -> int:
     Raises:
         InvalidInputError: If top_n is invalid
     """
-    if not isinstance(top_n, int):
-        raise InvalidInputError(f"top_n must be an integer, got {type(top_n)}")
-
-    if top_n < 1:
-        raise InvalidInputError(f"top_n must be >= 1, got {top_n}")
-
-    if top_n > 100:
+    # bool is an int subclass but not a count
+    if type(top_n) is not int or not 1 <= top_n <= 100:
         raise InvalidInputError(
-            f"top_n must be <= 100, got {top_n}. "
+            f"top_n must be an integer in [1, 100], got {top_n!r}. "
             "For more guides, consider multiple design runs."
         )
 
@@ -159,6 +321,10 @@ def validate_design_inputs(
 ) -> dict:
     """Validate all inputs for guide design
 
+    Dispatches to validate_gene_design_inputs or
+    validate_region_design_inputs; callers that know their mode can call
+    those directly.
+
     Args:
         gene: Gene symbol
         region: Genomic coordinates
@@ -172,40 +338,150 @@ def validate_design_inputs(
         InvalidInputError: If inputs are invalid
     """
     # Must specify either gene or region, but not both
-    if gene is None and region is None:
+    if gene is not None:
+        if region is not None:
+            raise InvalidInputError(
+                "Cannot specify both --gene and --region. Choose one."
+            )
+        return validate_gene_design_inputs(gene, species, top_n)
+
+    if region is None:
         raise InvalidInputError(
             "Must specify either --gene or --region"
         )
+    return validate_region_design_inputs(region, species, top_n)
 
-    if gene is not None and region is not None:
-        raise InvalidInputError(
-            "Cannot specify both --gene and --region. Choose one."
+
+def validate_design_inputs_iter(records: Iterable[Mapping]) -> Iterator[ValidatedDesign]:
+    """Validate a stream of guide design inputs lazily
+
+    Each record is validated only when the next result is requested, so
+    large batches never hold every validated input in memory at once.
+
+    Args:
+        records: Mappings with the keyword arguments of validate_design_inputs
+            ('gene' or 'region', and optionally 'species' and 'top_n')
+
+    Yields:
+        ValidatedDesign for each record, in input order
+
+    Raises:
+        InvalidInputError: If a record is invalid
+    """
+    for record in records:
+        gene = record.get('gene')
+        region = record.get('region')
+        species = record.get('species', "human")
+        top_n = record.get('top_n', 5)
+
+        if gene is None and region is None:
+            raise InvalidInputError(
+                "Must specify either --gene or --region"
+            )
+
+        if gene is not None and region is not None:
+            raise InvalidInputError(
+                "Cannot specify both --gene and --region. Choose one."
+            )
+
+        if gene is not None:
+            validated = _cached(_validate_gene_design_inputs, gene, species, top_n)
+        else:
+            validated = _cached(_validate_region_design_inputs, region, species, top_n)
+
+        # The cached dict is only read, so no copy is needed
+        yield ValidatedDesign(
+            mode=validated['mode'],
+            gene=validated.get('gene'),
+            chromosome=validated.get('chromosome'),
+            start=validated.get('start'),
+            end=validated.get('end'),
+            species=validated['species'],
+            species_info=validated['species_info'],
+            top_n=validated['top_n']
         )
 
-    # Validate species
-    species_info = validate_species(species)
 
-    # Validate top_n
+def validate_gene_design_inputs(gene: str, species: str = "human", top_n: int = 5) -> dict:
+    """Validate inputs for guide design against a gene
+
+    Args:
+        gene: Gene symbol
+        species: Species name
+        top_n: Number of guides to return
+
+    Returns:
+        Dictionary with validated inputs (mode 'gene')
+
+    Raises:
+        InvalidInputError: If inputs are invalid
+    """
+    return _memoized(_validate_gene_design_inputs, gene, species, top_n)
+
+
+def validate_region_design_inputs(region: str, species: str = "human", top_n: int = 5) -> dict:
+    """Validate inputs for guide design against a genomic region
+
+    Args:
+        region: Genomic coordinates
+        species: Species name
+        top_n: Number of guides to return
+
+    Returns:
+        Dictionary with validated inputs (mode 'region')
+
+    Raises:
+        InvalidInputError: If inputs are invalid
+    """
+    return _memoized(_validate_region_design_inputs, region, species, top_n)
+
+
+def _memoized(validator: 'functools._lru_cache_wrapper[dict]', *args: Any) -> dict:
+    """Call a memoized validator, returning a copy callers may modify"""
+    return dict(_cached(validator, *args))
+
+
+def _cached(validator: 'functools._lru_cache_wrapper[dict]', *args: Any) -> dict:
+    """Call a memoized validator; the result is shared and must not be modified"""
+    try:
+        hash(args)
+    except TypeError:
+        # Unhashable arguments: validate without caching
+        return validator.__wrapped__(*args)
+    return validator(*args)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _validate_gene_design_inputs(gene: str, species: str, top_n: int) -> dict:
+    """Validate gene design inputs, memoized by validate_gene_design_inputs"""
+    species_key = species.lower().strip()
+    species_info = _species_info(species_key, species)
     top_n = validate_top_n(top_n)
 
-    # Validate gene or region
-    if gene:
-        gene = validate_gene_symbol(gene)
-        return {
-            'mode': 'gene',
-            'gene': gene,
-            'species': species.lower(),
-            'species_info': species_info,
-            'top_n': top_n
-        }
-    else:
-        chromosome, start, end = parse_genomic_coordinates(region)
-        return {
-            'mode': 'region',
-            'chromosome': chromosome,
-            'start': start,
-            'end': end,
-            'species': species.lower(),
-            'species_info': species_info,
-            'top_n': top_n
-        }
+    return {
+        'mode': 'gene',
+        'gene': validate_gene_symbol(gene),
+        'species': species_key,
+        'species_info': species_info,
+        'top_n': top_n
+    }
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _validate_region_design_inputs(region: str, species: str, top_n: int) -> dict:
+    """Validate region design inputs, memoized by validate_region_design_inputs"""
+    species_key = species.lower().strip()
+    species_info = _species_info(species_key, species)
+    top_n = validate_top_n(top_n)
+    # Memoized here already, and region may be unhashable on the uncached path
+    chromosome, start, end = parse_genomic_coordinates.__wrapped__(region)
+
+    return {
+        'mode': 'region',
+        'chromosome': chromosome,
+        'start': start,
+        'end': end,
+        'species': species_key,
+        'species_info': species_info,
+        'top_n': top_n
+    }
@@ -0,0 +1,69 @@
+"""Tests for on-disk design result caching"""
+
+import os
+
+import pandas as pd
+from crispex.utils import cache
+
+
+def test_disk_cached_reuses_results(tmp_path, monkeypatch):
+    """Test that identical requests are served from the disk cache"""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    calls = []
+    projections = []
+
+    def fake_design(gene=None, region=None, species="human", top_n=5, output=None,
+                    columns=None):
+        calls.append(gene)
+        projections.append(columns)
+        df = pd.DataFrame({'rank': [1], 'guide_sequence': ["A" * 20], 'gene_name': [gene]})
+        return df if columns is None else df[columns]
+
+    design = cache.disk_cached(fake_design)
+
+    first = design(gene="TP53", top_n=1, output=str(tmp_path / "a.csv"), use_cache=True)
+    second = design(gene="tp53", species="Human", top_n=1, output=str(tmp_path / "b.csv"),
+                    use_cache=True)
+
+    assert calls == ["TP53"]
+    assert first.equals(second)
+    assert (tmp_path / "b.csv").exists()  # Cache hits still export
+
+    # Entries are plain JSON, never pickles
+    entries = list(tmp_path.glob("*.json"))
+    assert len(entries) == 1 and entries[0].read_text().startswith("{")
+
+    # Cached results are projected on return
+    projected = design(gene="TP53", top_n=1, output=str(tmp_path / "p.csv"), columns=["rank"],
+                       use_cache=True)
+    assert list(projected.columns) == ["rank"] and len(calls) == 1
+
+    # Caching is opt-in; uncached calls project while building the table
+    design(gene="TP53", top_n=1, output=str(tmp_path / "c.csv"), columns=["rank"])
+    assert calls == ["TP53", "TP53"]
+    assert projections == [None, ["rank"]]
+
+    # Expired entries are recomputed
+    expired = entries[0].stat().st_mtime - cache.CACHE_TTL_SECONDS - 1
+    os.utime(entries[0], (expired, expired))
+    design(gene="TP53", top_n=1, output=str(tmp_path / "d.csv"), use_cache=True)
+    assert calls == ["TP53", "TP53", "TP53"]
+
+
+def test_disk_cached_hit_writes_same_csv(tmp_path, monkeypatch):
+    """Test that a cache hit exports the same CSV bytes as a cache miss"""
+    import crispex.api
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    sequence = "ACGTACGTACGTACGTACGTAGGCCCGGGAAATTTGGGACGTACGTGACCTGAAGTCCATGG" * 3
+    monkeypatch.setattr(crispex.api, "fetch_gene_sequence", lambda gene, species: {
+        'sequence': sequence, 'chromosome': "chr1", 'start': 1000, 'gene_symbol': gene,
+    })
+    design = cache.disk_cached(crispex.api.design_guides)
+
+    miss, hit = tmp_path / "miss.csv", tmp_path / "hit.csv"
+    design(gene="TP53", top_n=3, output=str(miss), use_cache=True)
+    design(gene="TP53", top_n=3, output=str(hit), use_cache=True)
+
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+    assert hit.read_bytes() == miss.read_bytes()
@@ -1,7 +1,9 @@
 """Tests for guide extraction"""
 
 import pytest
-from crispex.core.extract import find_pam_sites, extract_guide_sequence, extract_guides
+from crispex.core.extract import (
+    find_pam_sites, extract_guide_sequence, extract_guides, filter_guides_by_quality
+)
 
 
 def test_find_pam_sites():
@@ -16,6 +18,20 @@ def test_find_pam_sites():
         assert sequence[pos+1:pos+3] == "GG"
 
 
+def test_find_pam_sites_overlapping():
+    """Test that overlapping PAMs in G runs are all reported"""
+    assert find_pam_sites("AGGG") == [0, 1]
+    assert find_pam_sites("NGGAGG") == [3]  # N is not a valid PAM nucleotide
+    assert find_pam_sites("GG") == []
+
+
+def test_find_pam_sites_sacas9():
+    """Test NNGRRT PAM finding for SaCas9"""
+    sequence = "CCAAGAGTCCTTCCA"
+
+    assert find_pam_sites(sequence, pam_type='SaCas9') == [2]
+
+
 def test_extract_guide_sequence():
     """Test extracting guide sequence"""
     # Sequence with PAM at position 20
@@ -47,3 +63,34 @@ def test_extract_guides():
         assert len(guide.sequence) == 20
         assert len(guide.pam) == 3
         assert guide.chromosome == "chr1"
+
+
+def test_blocked_scan_matches_full_scan():
+    """Test that block-wise scanning finds the same guides across block boundaries"""
+    import random
+    import numpy as np
+    from crispex.core import extract
+    from crispex.core.encoding import BASE_CODES
+
+    rng = random.Random(0)
+    sequence = "".join(rng.choice("ACGGT") for _ in range(2000))
+    buf = extract._sequence_bytes(sequence)
+    codes = BASE_CODES[buf]
+
+    full = extract._find_guide_starts(buf, codes, 'SpCas9', 20)
+    blocked = extract._find_guide_starts_blocked(buf, codes, 'SpCas9', 20, block_size=97)
+
+    assert all(np.array_equal(a, b) for a, b in zip(full, blocked))
+
+
+def test_filter_guides_by_quality_matches_guide_filters():
+    """Test that list filtering matches Guide.passes_quality_filters"""
+    sequence = "ACGTTTTTGGACCCCAGGTACGATCGATCGGGGGCAGGCTAGCTAGCATCGACGTAGG" * 4
+    guides = extract_guides(sequence, chromosome="chr1", start_position=1, apply_filters=False)
+
+    for max_homopolymer in (3, 4, 5):
+        expected = [g for g in guides if g.passes_quality_filters(max_homopolymer=max_homopolymer)]
+        assert filter_guides_by_quality(guides, max_homopolymer=max_homopolymer) == expected
+
+    guides[0].sequence = "N" + guides[0].sequence[1:]
+    assert filter_guides_by_quality(guides) == [g for g in guides if g.passes_quality_filters()]
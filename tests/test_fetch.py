@@ -0,0 +1,140 @@
+"""Tests for Ensembl fetching helpers that do not require network access"""
+
+import os
+import time
+
+import pytest
+from crispex.core import fetch
+
+
+def test_gene_cache_roundtrip(tmp_path, monkeypatch):
+    """Test storing and reading gene coordinates from the local gene cache"""
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+
+    assert fetch._cached_gene_info("TP53", "human") is None
+
+    fetch._store_gene_info([{
+        'id': "ENSG00000141510",
+        'display_name': "TP53",
+        'seq_region_name': "17",
+        'start': 7661779,
+        'end': 7687538,
+        'strand': -1,
+        'description': "tumor protein p53 [Source:HGNC Symbol;Acc:HGNC:11998]",
+    }], "human")
+
+    info = fetch._cached_gene_info("tp53", "human")
+
+    assert info['id'] == "ENSG00000141510"
+    assert info['description'] == "tumor protein p53 [Source:HGNC Symbol;Acc:HGNC:11998]"
+    assert info['seq_region_name'] == "17"
+    assert (info['start'], info['end'], info['strand']) == (7661779, 7687538, -1)
+
+
+def test_gene_cache_expiry_and_clear(tmp_path, monkeypatch):
+    """Test that stale gene caches are ignored, checked on every access, and can be cleared"""
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+    fetch._store_gene_info([{
+        'id': "ENSG00000141510",
+        'display_name': "TP53",
+        'seq_region_name': "17",
+        'start': 7661779,
+        'end': 7687538,
+        'strand': -1,
+    }], "human")
+    path = fetch.gene_cache_path("human")
+    assert f"_v{fetch.GENE_CACHE_VERSION}_" in os.path.basename(path)
+    assert fetch._cached_gene_info("TP53", "human")['description'] == ""
+
+    expired = time.time() - fetch.GENE_CACHE_EXPIRE_AFTER - 1
+    os.utime(path, (expired, expired))
+    assert fetch._cached_gene_info("TP53", "human") is None
+
+    (tmp_path / "gene_cache_mouse.tsv.gz").touch()  # Unversioned cache
+    assert fetch.clear_gene_cache("human") == 1
+    assert fetch.clear_gene_cache() == 1
+    assert not list(tmp_path.glob("gene_cache_*"))
+
+
+def test_http_cache_session(tmp_path, monkeypatch):
+    """Test that Ensembl responses are cached when requests-cache is installed"""
+    requests_cache = pytest.importorskip("requests_cache")
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+
+    fetcher = fetch.EnsemblFetcher(species="human")
+
+    assert isinstance(fetcher.session, requests_cache.CachedSession)
+    assert fetcher.session.headers['User-Agent'].startswith('Crispex')
+
+
+def test_token_bucket_pause():
+    """Test that a paused token bucket blocks callers"""
+    bucket = fetch.TokenBucket(rate=1000, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    bucket.pause(0.05)
+    start = time.monotonic()
+    bucket.acquire()
+
+    assert time.monotonic() - start >= 0.04
+
+
+def test_fetch_gene_sequences_batches_requests(tmp_path, monkeypatch):
+    """Test that several genes are fetched with one lookup and one sequence request"""
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+    calls = []
+
+    def fake_request(self, endpoint, params=None, max_retries=3, payload=None):
+        calls.append(endpoint)
+        if endpoint.startswith("/lookup/symbol"):
+            return {
+                symbol: {
+                    'id': f"ENSG0000000000{i}",
+                    'display_name': symbol,
+                    'seq_region_name': "1",
+                    'start': 100 * (i + 1),
+                    'end': 100 * (i + 1) + 9,
+                    'strand': 1,
+                }
+                for i, symbol in enumerate(payload['symbols'])
+            }
+        return [{'query': region, 'seq': "acgtacgtac"} for region in reversed(payload['regions'])]
+
+    monkeypatch.setattr(fetch.EnsemblFetcher, "_make_request", fake_request)
+
+    results = fetch.fetch_gene_sequences(["TP53", "BRCA1"], species="human")
+
+    assert calls == ["/lookup/symbol/human", "/sequence/region/human"]
+    assert [r['gene_symbol'] for r in results] == ["TP53", "BRCA1"]
+    assert [r['start'] for r in results] == [100, 200]
+    assert results[0]['sequence'] == "ACGTACGTAC"
+
+
+def test_get_sequence_uppercases_stream(tmp_path, monkeypatch):
+    """Test that streamed sequence responses are returned uppercase"""
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            return iter([b"acgtN", b"nGGc"])
+
+    fetcher = fetch.EnsemblFetcher(species="human")
+    monkeypatch.setattr(fetcher.session, "get", lambda *args, **kwargs: FakeResponse())
+
+    assert fetcher.get_sequence("17:1..9") == "ACGTNNGGC"
+
+
+def test_fetchers_share_session(tmp_path, monkeypatch):
+    """Test that fetchers reuse one pooled HTTP session"""
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+
+    first = fetch.EnsemblFetcher(species="human")
+    second = fetch.EnsemblFetcher(species="mouse")
+
+    assert first.session is second.session
+    adapter = first.session.get_adapter(fetch.EnsemblFetcher.BASE_URL)
+    assert adapter._pool_maxsize == fetch.ENSEMBL_MAX_CONNECTIONS
@@ -0,0 +1,109 @@
+"""Tests for reference genome access"""
+
+import os
+
+import pytest
+from crispex.core import genome
+from crispex.utils.errors import GenomeNotInstalledError
+
+
+def _install_genome(tmp_path, monkeypatch):
+    genome_dir = tmp_path / ".crispex" / "genomes"
+    genome_dir.mkdir(parents=True)
+    (genome_dir / "GRCh38.fa").write_text(">chr1\nacgtACGTac\nGGCCTTAA\n>chr2\nNNNNACGT\n")
+    monkeypatch.setattr(genome.Path, "home", lambda: tmp_path)
+    genome._clear_fastas()
+
+
+def test_get_sequence(tmp_path, monkeypatch):
+    """Test uppercase region lookup with 1-based inclusive coordinates"""
+    _install_genome(tmp_path, monkeypatch)
+    manager = genome.GenomeManager("human")
+
+    assert manager.get_sequence("chr1", 1, 4) == "ACGT"
+    assert manager.get_sequence("chr1", 9, 12) == "ACGG"  # Spans a line break
+    assert manager.get_sequence("chr2", 5, 8) == "ACGT"
+    assert manager.get_chromosome_list() == ["chr1", "chr2"]
+
+
+def test_get_sequences_preserves_order(tmp_path, monkeypatch):
+    """Test batched region lookup returns sequences in request order"""
+    _install_genome(tmp_path, monkeypatch)
+    manager = genome.GenomeManager("human")
+
+    regions = [("chr2", 5, 8), ("chr1", 9, 12), ("chr1", 1, 4)]
+
+    assert manager.get_sequences(regions) == ["ACGT", "ACGG", "ACGT"]
+    with pytest.raises(GenomeNotInstalledError):
+        manager.get_sequences([("chr1", 1, 4), ("chrX", 1, 4)])
+
+
+def test_genome_handle_shared(tmp_path, monkeypatch):
+    """Test that genome managers share one open FASTA handle"""
+    _install_genome(tmp_path, monkeypatch)
+
+    first = genome.GenomeManager("human").load_genome()
+    second = genome.GenomeManager("human").load_genome()
+
+    assert first is second
+
+
+def test_mmap_fasta_regions(tmp_path):
+    """Test memory-mapped region lookup, including clipping at the sequence end"""
+    path = tmp_path / "test.fa"
+    path.write_text(">seq1 description\nACGTA\ncgtac\nGG\n")
+
+    fasta = genome.MmapFasta(str(path))
+
+    assert (tmp_path / "test.fa.fai").exists()
+    assert fasta.keys() == ["seq1"]
+    assert fasta.get_sequence("seq1", 4, 8) == "TACGT"
+    assert fasta.get_sequence("seq1", 10, 50) == "CGG"
+    assert fasta.get_sequence("seq1", 20, 30) == ""
+    fasta.close()
+
+
+def test_build_index_matches_faidx_layout(tmp_path):
+    """Test block-read indexing across chunk boundaries, CRLF and empty records"""
+    path = tmp_path / "test.fa"
+    path.write_bytes(b">a desc\nACGTA\ncgtac\nGG\n>b\n>c\tx\r\nACG\r\nTA\r\n")
+
+    for chunk_size in (1, 3, 64):
+        index_path = genome.build_fasta_index(str(path), chunk_size=chunk_size)
+        with open(index_path) as f:
+            assert f.read() == "a\t12\t8\t5\t6\nb\t0\t26\t0\t0\nc\t5\t32\t3\t5\n"
+
+    fasta = genome.MmapFasta(str(path))
+    assert fasta.get_sequence("c", 2, 5) == "CGTA"
+    fasta.close()
+
+    path.write_bytes(b">a\nACGT\nA\nACGT\n")
+    with pytest.raises(ValueError):
+        genome.build_fasta_index(str(path))
+
+
+def test_genome_reopened_after_edit(tmp_path, monkeypatch):
+    """Test that an edited FASTA is reindexed and evicted readers stay usable"""
+    _install_genome(tmp_path, monkeypatch)
+    manager = genome.GenomeManager("human")
+    first = manager.load_genome()
+    assert manager.get_sequence("chr2", 1, 4) == "NNNN"
+
+    path = tmp_path / ".crispex" / "genomes" / "GRCh38.fa"
+    path.write_text(">chr2\nTTTTACGT\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert manager.get_sequence("chr2", 1, 4) == "TTTT"
+    assert manager.get_chromosome_list() == ["chr2"]
+    assert manager.fasta is not first
+
+    # A reader held by another thread keeps working after eviction
+    monkeypatch.setattr(genome, "MAX_OPEN_FASTAS", 1)
+    get_sequence = manager.load_genome().get_sequence
+    other = tmp_path / "other.fa"
+    other.write_text(">x\nACGT\n")
+    genome._open_fasta(str(other))
+    assert get_sequence("chr2", 5, 8) == "ACGT"
+    assert manager.get_sequence("chr2", 5, 8) == "ACGT"
+    genome._clear_fastas()
@@ -1,7 +1,8 @@
 """Tests for Guide dataclass and operations"""
 
+import numpy as np
 import pytest
-from crispex.core.guide import Guide
+from crispex.core.guide import Guide, GuideBatch, OffTargetCounts
 
 
 def test_guide_creation():
@@ -83,3 +84,120 @@ def test_guide_to_dict():
     assert guide_dict['efficiency_score'] == 81.2
     assert guide_dict['off_targets_1mm'] == 2
     assert guide_dict['gene_name'] == "TP53"
+
+
+def test_off_target_counts():
+    """Test that off-target dicts are stored as counts indexed by mismatches"""
+    guide = Guide(sequence="A" * 20, pam="TGG", chromosome="chr1", start=1, end=20,
+                  strand="+", off_targets={0: 1, 2: 8})
+
+    assert isinstance(guide.off_targets, OffTargetCounts)
+    assert guide.off_targets == [1, 0, 8, 0]
+    assert guide.off_targets.get(2) == 8
+    assert guide.off_targets.get(5, -1) == -1
+    assert dict(guide.off_targets.items()) == {0: 1, 1: 0, 2: 8, 3: 0}
+
+    # Dicts assigned after construction are converted too
+    guide.off_targets = {0: 1, 1: 2}
+    assert isinstance(guide.off_targets, OffTargetCounts)
+    assert guide.to_dict()['off_targets_3mm'] == 0
+
+
+def test_pack2bit():
+    """Test 2-bit packing of guide sequences"""
+    guide = Guide(sequence="ACGT", pam="NGG", chromosome="chr1", start=1, end=4, strand="+")
+
+    assert guide.pack2bit() == 0b11100100  # T G C A, base 0 in the lowest bits
+    assert guide.packed_seq == 0b11100100
+
+    guide.sequence = "ACNT"
+    with pytest.raises(ValueError):
+        guide.pack2bit()
+
+
+def test_packed_property_is_cached():
+    """Test that the packed sequence is computed once and reused"""
+    guide = Guide(sequence="GGCC", pam="NGG", chromosome="chr1", start=1, end=4, strand="+")
+
+    assert guide.packed_seq is None
+    assert guide.calculate_gc_content() == 100.0
+    assert guide.packed_seq == guide.packed == 0b01011010
+
+    # Reassigning the sequence invalidates the packed value
+    guide.sequence = "AATT"
+    assert guide.packed == 0b11110000
+    assert guide.calculate_gc_content() == 0.0
+
+    ambiguous = Guide(sequence="GGNC", pam="NGG", chromosome="chr1", start=1, end=4, strand="+")
+    assert ambiguous.packed is None
+    assert ambiguous.calculate_gc_content() == 75.0
+
+
+def test_guide_batch_roundtrip():
+    """Test converting a GuideBatch to Guide objects and a DataFrame"""
+    batch = GuideBatch.from_lists(
+        sequences=["GGGGCCCCAAAATTTTACGT", "ACGTACGTACGTACGTACGT"],
+        pams=["AGG", "TGG"],
+        starts=[100, 200],
+        ends=[119, 219],
+        strands=["+", "-"],
+        chromosome="chr1",
+        gene_name="TP53",
+    )
+
+    guides = batch.to_guides()
+
+    assert len(batch) == 2
+    assert [g.sequence for g in guides] == batch.sequences
+    assert [g.strand for g in guides] == ["+", "-"]
+    assert guides[0].gc_content == 50.0
+    assert guides[1].packed_seq == guides[1].pack2bit()
+
+    df = batch.to_dataframe()
+    assert df['start'].tolist() == [100, 200]
+    assert (df['gene_name'] == "TP53").all()
+
+
+def test_guide_batch_quality_filters():
+    """Test that batch quality filters match the per-guide filters"""
+    sequences = [
+        "GGAAGACTCCAGTGGTAATC",  # Passes
+        "GGAAGACTTTTGTGGTAATC",  # polyT
+        "GGGGGGGGGGGGGGGGGGGG",  # High GC, homopolymer
+        "ACGTACGTACGTACGTACGT",  # Passes
+    ]
+    batch = GuideBatch.from_lists(
+        sequences, ["AGG"] * 4, [1] * 4, [20] * 4, ["+"] * 4, chromosome="chr1"
+    )
+
+    expected = [guide.passes_quality_filters() for guide in batch.to_guides()]
+
+    assert batch.passes_quality_filters().tolist() == expected == [True, False, False, True]
+    assert batch.select(batch.passes_quality_filters()).sequences == [sequences[0], sequences[3]]
+
+
+def test_guide_batch_seed_index():
+    """Test packed seed lookup on a guide batch"""
+    sequences = ["AAAAAAAAAACCCCCCCCCC", "TTTTTTTTTTCCCCCCCCCC", "ACGTACGTACGTACGTACGT"]
+    batch = GuideBatch.from_lists(
+        sequences, ["AGG"] * 3, [1] * 3, [20] * 3, ["+"] * 3, chromosome="chr1"
+    )
+
+    assert batch.seed20.dtype == np.uint32
+    assert batch.seed20[0] == batch.seed20[1] == int("01" * 10, 2)  # CCCCCCCCCC
+    assert batch.guides_with_seed(int(batch.seed20[0])).tolist() == [0, 1]
+    assert batch.guides_with_seed(int(batch.seed20[2])).tolist() == [2]
+    assert batch.guides_with_seed(0).tolist() == []
+
+
+def test_guide_batch_packed_homopolymer_fallback():
+    """Test that batches with ambiguous bases skip the packed homopolymer screen"""
+    sequences = ["GGAAGACTCCAGTGGTAATC", "GGCAGCCTCNAAAAGTGCTC"]
+    batch = GuideBatch.from_lists(
+        sequences, ["AGG"] * 2, [1] * 2, [20] * 2, ["+"] * 2, chromosome="chr1"
+    )
+
+    assert batch.packed is None
+    assert batch.select(np.array([True, False])).packed is not None
+    assert batch.passes_quality_filters(max_homopolymer=5).tolist() == [True, True]
+    assert batch.passes_quality_filters(max_homopolymer=4).tolist() == [True, False]
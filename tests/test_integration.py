@@ -4,8 +4,12 @@ import pytest
 from crispex.core.extract import extract_guides
 from crispex.core.predict import predict_efficiency_scores
 from crispex.core.offtarget import search_off_targets
-from crispex.core.rank import rank_guides, select_top_guides
-from crispex.utils.export import guides_to_dataframe
+from crispex.core.rank import (
+    calculate_specificity_score, calculate_specificity_scores, rank_guides, rank_guides_soa,
+    select_top_guides
+)
+from crispex.utils.export import guides_to_dataframe, save_to_csv, write_csv
+from crispex.utils.errors import InvalidInputError
 
 
 def test_full_guide_design_pipeline():
@@ -101,6 +105,37 @@ def test_export_empty_guides():
     assert 'guide_sequence' in df.columns  # Should have correct columns
 
 
+def test_export_column_projection():
+    """Test that only requested columns are materialized"""
+    sequence = "ATCGATCGATCGATCGATCGAGGATCGATCGATCGATCGATCGTGG" * 10
+    guides = extract_guides(sequence, chromosome="chr1", start_position=1000)
+
+    df = guides_to_dataframe(guides, columns=['guide_sequence', 'rank'])
+    assert list(df.columns) == ['guide_sequence', 'rank']
+    assert df['rank'].tolist() == list(range(1, len(guides) + 1))
+
+    with pytest.raises(InvalidInputError):
+        guides_to_dataframe(guides, columns=['not_a_column'])
+
+
+def test_save_to_csv_matches_dataframe(tmp_path):
+    """Test that streamed CSV export matches the DataFrame export"""
+    sequence = "ATCGATCGATCGATCGATCGAGGATCGATCGATCGATCGATCGTGG" * 10
+    guides = extract_guides(sequence, chromosome="chr1", start_position=1000, gene_name="TEST")
+    guides[0].exon = 2
+    guides[0].efficiency_score = 71.0
+
+    path = save_to_csv(guides, str(tmp_path / "out" / "guides.csv"))
+    expected = tmp_path / "expected.csv"
+    guides_to_dataframe(guides).to_csv(expected, index=False)
+    written = write_csv(guides_to_dataframe(guides), str(tmp_path / "written.csv"))
+
+    with open(path, newline='') as f, open(expected, newline='') as g:
+        assert f.read() == g.read()
+    with open(path, 'rb') as f, open(written, 'rb') as g:
+        assert f.read() == g.read()
+
+
 def test_ranking_consistency():
     """Test that ranking is consistent and deterministic"""
     from crispex.core.guide import Guide
@@ -123,3 +158,62 @@ def test_ranking_consistency():
     # Ranking should be stable
     ranked_again = rank_guides(guides)
     assert [g.efficiency_score for g in ranked] == [g.efficiency_score for g in ranked_again]
+
+
+def test_ranking_tie_breaks():
+    """Test that ties on efficiency fall back to off-targets, then position"""
+    from crispex.core.guide import Guide
+
+    def guide(start, efficiency, off_targets_1mm):
+        return Guide(sequence="A"*20, pam="TGG", chromosome="chr1", start=start, end=start + 19,
+                     strand="+", efficiency_score=efficiency,
+                     off_targets={0: 1, 1: off_targets_1mm, 2: 0, 3: 0})
+
+    guides = [guide(300, 70.0, 1), guide(200, 70.0, 1), guide(100, 70.0, 3), guide(400, 75.0, 9)]
+
+    assert [g.start for g in rank_guides(guides)] == [400, 200, 300, 100]
+    assert [g.start for g in rank_guides_soa(guides)] == [400, 200, 300, 100]
+
+
+def test_specificity_scores():
+    """Test scalar and batched specificity scoring"""
+    from crispex.core.guide import Guide
+
+    guides = [
+        Guide(sequence="A"*20, pam="TGG", chromosome="chr1", start=1, end=20, strand="+",
+              off_targets=off_targets)
+        for off_targets in ({0: 1}, {0: 1, 1: 2, 2: 3, 3: 4}, {0: 2}, {0: 1, 1: 6})
+    ]
+
+    scores = [calculate_specificity_score(guide) for guide in guides]
+
+    assert scores == [100.0, 41.0, 0.0, 0.0]
+    assert calculate_specificity_scores(guides).tolist() == scores
+
+
+def test_design_guides_batch(monkeypatch):
+    """Test batched design across several genes without network access"""
+    import crispex.api
+    from crispex.api import design_guides_batch
+
+    sequence = "ACGTACGTACGTACGTACGTAGGCCCGGGAAATTTGGGACGTACGTGACCTGAAGTCCATGG" * 3
+
+    def fake_fetch(gene_symbols, species="human"):
+        return [
+            {
+                'sequence': sequence,
+                'chromosome': "chr1",
+                'start': 1000,
+                'gene_symbol': gene_symbol,
+            }
+            for gene_symbol in gene_symbols
+        ]
+
+    monkeypatch.setattr(crispex.api, "fetch_gene_sequences", fake_fetch)
+
+    results = design_guides_batch(["tp53", "BRCA1"], species="human", top_n=3)
+
+    assert list(results) == ["TP53", "BRCA1"]
+    for gene, df in results.items():
+        assert len(df) <= 3
+        assert (df['gene_name'] == gene).all()
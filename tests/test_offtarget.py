@@ -0,0 +1,66 @@
+"""Tests for off-target detection"""
+
+import random
+
+import pytest
+from crispex.core.guide import Guide
+from crispex.core.offtarget import OffTargetSearcher
+from crispex.utils.errors import InvalidInputError
+
+
+def test_count_mismatch_profile():
+    """Test packed mismatch counting against the string implementation"""
+    searcher = OffTargetSearcher()
+    rng = random.Random(0)
+    guide = "GGAAGACTCCAGTGGTAATC"
+
+    sites = [guide]
+    for _ in range(200):
+        site = list(guide)
+        for pos in rng.sample(range(20), rng.randint(1, 5)):
+            site[pos] = rng.choice("ACGT")
+        sites.append("".join(site))
+
+    expected = {mm: 0 for mm in range(4)}
+    for site in sites:
+        mm = searcher.count_mismatches(guide, site)
+        if mm <= 3:
+            expected[mm] += 1
+
+    assert searcher.count_mismatch_profile(guide, sites) == expected
+
+    # Ambiguous guides and sites of another length are rejected, not miscounted
+    with pytest.raises(InvalidInputError):
+        searcher.count_mismatch_profile("GGAAGACTCCNGTGGTAATC", sites)
+    with pytest.raises(InvalidInputError):
+        searcher.count_mismatch_profile(guide, sites + [guide + "A"])
+
+
+def test_search_batch_estimates():
+    """Test seeded off-target estimates fall in each complexity tier's range"""
+    sequences = ["GGAAGACTCCAGTGGTAATC", "AAAAAAAAAAAAAAAAAAAA"]
+    guides = [Guide(seq, "AGG", "chr1", 1, 20, "+") for seq in sequences]
+
+    first = OffTargetSearcher(seed=7).search_batch(guides)
+    first_counts = [list(guide.off_targets) for guide in first]
+    second = OffTargetSearcher(seed=7).search_batch(guides)
+
+    assert [guide.off_targets for guide in second] == first_counts
+    assert first_counts[0][0] == first_counts[1][0] == 1
+    assert 0 <= first_counts[0][1] <= 3 and 23 <= first_counts[0][3] <= 27  # High complexity
+    assert 8 <= first_counts[1][1] <= 12 and 138 <= first_counts[1][3] <= 142  # Low complexity
+
+
+def test_batch_complexity_matches_single_guide():
+    """Test vectorized complexity scores against the per-sequence scorer"""
+    searcher = OffTargetSearcher()
+    rng = random.Random(1)
+    sequences = ["AAAAAAAAAAAAAAAAAAAA", "GGAAGACTCCAGTGGTAATC", "GCGCGCGCGCGCGCGCGCGC"]
+    sequences += ["".join(rng.choice("ACGT") for _ in range(20)) for _ in range(100)]
+
+    expected = [searcher._calculate_complexity(seq) for seq in sequences]
+
+    assert searcher._calculate_complexities(sequences).tolist() == expected
+    assert searcher._calculate_complexities(sequences + ["ACGTN" * 4]).tolist() == (
+        expected + [searcher._calculate_complexity("ACGTN" * 4)]
+    )
@@ -0,0 +1,15 @@
+"""Tests for thread-parallel batch kernels"""
+
+import numpy as np
+from crispex.utils import parallel
+
+
+def test_map_row_chunks_preserves_row_order(monkeypatch):
+    """Test that chunked results are concatenated in row order"""
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 4)
+    values = np.arange(1000)
+    weights = np.arange(1000) % 7
+
+    result = parallel.map_row_chunks(lambda v, w: v * w, values, weights, chunk_size=64)
+
+    assert result.tolist() == (values * weights).tolist()
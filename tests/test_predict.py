@@ -0,0 +1,49 @@
+"""Tests for on-target efficiency prediction"""
+
+from crispex.core.guide import Guide
+from crispex.core.predict import AzimuthPredictor
+
+
+def _guide(sequence):
+    return Guide(sequence=sequence, pam="AGG", chromosome="chr1", start=1,
+                 end=len(sequence), strand="+")
+
+
+def test_predict_batch_matches_single_guide_scores():
+    """Test that batch scoring matches predict_efficiency for every guide"""
+    sequences = [
+        "GGAAGACTCCAGTGGTAATC",
+        "CTTTGGGGGAAAACCCCTGG",  # Seed polyT, homopolymers, terminal G
+        "ACGTACGTACGTACGTACGT",
+        "GGAAGACTCNAGTGGTAATC",  # Ambiguous base
+        "GCGCGCGCGCGCGCGCGCGCGG",  # 22bp
+    ]
+    predictor = AzimuthPredictor()
+
+    expected = [predictor.predict_efficiency(_guide(seq)) for seq in sequences[:4]]
+    scored = predictor.predict_batch([_guide(seq) for seq in sequences[:4]])
+
+    assert [guide.efficiency_score for guide in scored] == expected
+
+    mixed = predictor.predict_batch([_guide(seq) for seq in sequences])
+    assert mixed[-1].efficiency_score == predictor.predict_efficiency(_guide(sequences[-1]))
+
+
+def test_unrolled_20mer_score_matches_feature_methods():
+    """Test the straight-line 20bp scorer against the individual feature scores"""
+    predictor = AzimuthPredictor()
+
+    for sequence in ["GGAAGACTCCAGTGGTAATC", "CTTTGGGGGAAAACCCCTGG", "TTTTTTTTTTTTTTTTTTTT"]:
+        guide = _guide(sequence)
+        guide.calculate_gc_content()
+
+        score = 50.0
+        score += predictor._score_gc_content(guide.gc_content)
+        score += predictor._score_position_preferences(sequence)
+        score += predictor._score_seed_region(sequence[:12])
+        score += predictor._score_pam_proximal(sequence[-8:])
+        score += predictor._penalize_homopolymers(sequence)
+        if sequence[19] == 'G':
+            score += 2.0
+
+        assert predictor.predict_efficiency(guide) == round(max(0.0, min(100.0, score)), 1)
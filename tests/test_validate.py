@@ -1,11 +1,18 @@
 """Tests for input validation"""
 
 import pytest
+from crispex.utils import validate
 from crispex.utils.validate import (
+    Species,
     validate_species,
     validate_gene_symbol,
     parse_genomic_coordinates,
-    validate_top_n
+    parse_genomic_coordinates_batch,
+    validate_top_n,
+    validate_design_inputs,
+    validate_gene_design_inputs,
+    validate_region_design_inputs,
+    validate_design_inputs_iter
 )
 from crispex.utils.errors import InvalidSpeciesError, InvalidInputError, InvalidCoordinatesError
 
@@ -19,18 +26,45 @@ def test_validate_species():
     result = validate_species("mouse")
     assert result['name'] == 'Mus musculus'
 
+    # Species records are shared and read-only
+    with pytest.raises(TypeError):
+        result['name'] = 'Rattus norvegicus'
+
+    # Records are read-only mappings whose fields are also attributes
+    with pytest.raises(AttributeError):
+        result.name = 'Rattus norvegicus'
+    assert 'genome_assembly' in result and result.get('assembly') is None
+    assert dict(result) == {
+        'name': 'Mus musculus', 'genome_assembly': 'GRCm39', 'ensembl_name': 'mus_musculus'
+    }
+
+    # Species can be given as enum members
+    assert validate_species(Species.MOUSE).genome_assembly == 'GRCm39'
+    assert validate_species(" Human ") is validate_species("human")
+
     # Invalid species
     with pytest.raises(InvalidSpeciesError):
         validate_species("elephant")
 
 
+def test_validate_design_inputs_normalizes_species():
+    """Test that the species name is returned normalized"""
+    validated = validate_design_inputs(gene="tp53", species=" Mouse ")
+
+    assert validated['species'] == "mouse"
+    assert validated['species_info']['genome_assembly'] == 'GRCm39'
+
+
 def test_validate_gene_symbol():
     """Test gene symbol validation"""
     assert validate_gene_symbol("TP53") == "TP53"
     assert validate_gene_symbol("brca1") == "BRCA1"  # Should uppercase
 
-    with pytest.raises(InvalidInputError):
-        validate_gene_symbol("")
+    assert validate_gene_symbol(" hla-drb1 ") == "HLA-DRB1"
+
+    for invalid in ["", "-TP53", "TP_53", "TP 53", "ÉGFR"]:
+        with pytest.raises(InvalidInputError):
+            validate_gene_symbol(invalid)
 
 
 def test_parse_genomic_coordinates():
@@ -45,15 +79,73 @@ def test_parse_genomic_coordinates():
     chr, start, end = parse_genomic_coordinates("17:1000-2000")
     assert chr == "chr17"
 
+    # Alternative separators
+    assert parse_genomic_coordinates(" X:10..20 ") == ("chrX", 10, 20)
+    assert parse_genomic_coordinates("chr1:10.20") == ("chr1", 10, 20)
+
     # Invalid format
-    with pytest.raises(InvalidCoordinatesError):
-        parse_genomic_coordinates("invalid")
+    for invalid in ["invalid", "chr1:10", "chr1:10--20", "chr_1:10-20", "chr1:1e3-2000"]:
+        with pytest.raises(InvalidCoordinatesError):
+            parse_genomic_coordinates(invalid)
 
     # End before start
     with pytest.raises(InvalidCoordinatesError):
         parse_genomic_coordinates("chr17:1000-500")
 
 
+def test_parse_genomic_coordinates_cache():
+    """Test that repeated regions are served from the parse cache"""
+    parse_genomic_coordinates.cache_clear()
+
+    first = parse_genomic_coordinates("chr17:7661779-7687550")
+    assert parse_genomic_coordinates("chr17:7661779-7687550") is first
+    assert parse_genomic_coordinates.cache_info().hits == 1
+
+    # Errors are not cached
+    for _ in range(2):
+        with pytest.raises(InvalidCoordinatesError):
+            parse_genomic_coordinates("chr17:1000-500")
+    assert parse_genomic_coordinates.cache_info().currsize == 1
+    parse_genomic_coordinates.cache_clear()
+
+
+def test_parse_genomic_coordinates_batch():
+    """Test batch coordinate parsing against the single-region parser"""
+    regions = ["chr17:7661779-7687550", "17:1000..2000", "X:5-5"]
+
+    chromosomes, starts, ends = parse_genomic_coordinates_batch(regions)
+
+    assert list(zip(chromosomes, starts.tolist(), ends.tolist())) == [
+        parse_genomic_coordinates(region) for region in regions
+    ]
+
+    # The first invalid region is reported, whether malformed or out of bounds
+    with pytest.raises(InvalidCoordinatesError, match="must be >= start"):
+        parse_genomic_coordinates_batch(["chr1:1-2", "chr1:300-200", "invalid"])
+    with pytest.raises(InvalidCoordinatesError, match="Invalid coordinate format"):
+        parse_genomic_coordinates_batch(["chr1:1-2", "invalid", "chr1:300-200"])
+
+
+def test_parse_genomic_coordinates_batch_scanner(monkeypatch):
+    """Test that the vectorized scanner matches the single-region parser"""
+    monkeypatch.setattr(validate, "_SCAN_MIN_REGIONS", 0)
+    regions = [
+        "chr17:7661779-7687550", " 17:1000..2000\t", "X:5-.5", "chrUnplaced1:10-20",
+        "1:\u0661-2", "Chr2:0001-002",
+    ]
+
+    chromosomes, starts, ends = parse_genomic_coordinates_batch(regions)
+
+    assert list(zip(chromosomes, starts.tolist(), ends.tolist())) == [
+        parse_genomic_coordinates(region) for region in regions
+    ]
+
+    with pytest.raises(InvalidCoordinatesError, match="Invalid coordinate format"):
+        parse_genomic_coordinates_batch(["chr1:1-2", "chr1:1-2\0", "chr1:300-200"])
+    with pytest.raises(InvalidCoordinatesError, match="must be >= start"):
+        parse_genomic_coordinates_batch(["chr1:1-2", "chr1:300-200", "chr1:1.5-2"])
+
+
 def test_validate_top_n():
     """Test top_n validation"""
     assert validate_top_n(5) == 5
@@ -65,3 +157,72 @@ def test_validate_top_n():
 
     with pytest.raises(InvalidInputError):
         validate_top_n(101)
+
+    for invalid in [True, 5.0, "5"]:
+        with pytest.raises(InvalidInputError):
+            validate_top_n(invalid)
+
+
+def test_validate_design_inputs_cache_returns_copies():
+    """Test that memoized validation results cannot be modified through callers"""
+    first = validate_design_inputs(region="chr1:100-200", top_n=3)
+    first['top_n'] = 50
+
+    second = validate_design_inputs(region="chr1:100-200", top_n=3)
+
+    assert second['top_n'] == 3
+    assert second == {**first, 'top_n': 3}
+    with pytest.raises(InvalidInputError):
+        validate_design_inputs(gene=["TP53"])
+    with pytest.raises(InvalidInputError):
+        validate_design_inputs(region=["chr1:100-200"])
+
+
+def test_validator_errors_are_not_retried(monkeypatch):
+    """Test that a TypeError raised while validating is not mistaken for unhashable input"""
+    calls = []
+
+    def failing_top_n(top_n):
+        calls.append(top_n)
+        raise TypeError("failing validator")
+
+    monkeypatch.setattr(validate, "validate_top_n", failing_top_n)
+    validate._validate_gene_design_inputs.cache_clear()
+
+    with pytest.raises(TypeError, match="failing validator"):
+        validate_gene_design_inputs("TP53", "human", 7)
+    assert calls == [7]
+    validate._validate_gene_design_inputs.cache_clear()
+
+
+def test_mode_specific_design_inputs():
+    """Test that the mode-specific validators match the dispatching validator"""
+    assert validate_gene_design_inputs("tp53") == validate_design_inputs(gene="tp53")
+    assert (validate_region_design_inputs("17:100..200", "mouse", 10)
+            == validate_design_inputs(region="17:100..200", species="mouse", top_n=10))
+
+    with pytest.raises(InvalidInputError, match="Gene symbol"):
+        validate_design_inputs(gene="")
+    with pytest.raises(InvalidInputError, match="either --gene or --region"):
+        validate_design_inputs()
+
+
+def test_validate_design_inputs_iter():
+    """Test that batch records are validated lazily and in order"""
+    records = iter([
+        {'gene': "tp53"},
+        {'region': "chr17:100-200", 'species': "Mouse", 'top_n': 3},
+        {},
+    ])
+    results = validate_design_inputs_iter(records)
+
+    first = next(results)
+    assert first.mode == 'gene' and first.gene == "TP53"
+    assert first.chromosome is None and first.top_n == 5
+
+    second = next(results)
+    assert (second.chromosome, second.start, second.end) == ("chr17", 100, 200)
+    assert second.species == "mouse" and second.species_info.genome_assembly == "GRCm39"
+
+    with pytest.raises(InvalidInputError, match="either --gene or --region"):
+        next(results)
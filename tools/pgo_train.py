@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Training workload for profile-guided builds of the input validators
+
+Calls each validator in crispex.utils.validate repeatedly with the input
+shapes seen in practice, so a PGO-instrumented CPython (or a profiler such
+as `python -X perf`) records representative, monomorphic call sites.
+Memoized validators are called through __wrapped__ so every call does the
+full validation work.
+
+Usage:
+    python tools/pgo_train.py [iterations]
+"""
+
+import sys
+import time
+
+from crispex.utils import validate
+from crispex.utils.errors import InvalidInputError
+
+ITERATIONS = 100_000
+
+GENES = ["TP53", "brca1", "HLA-A", " egfr "]
+REGIONS = ["chr17:7661779-7687538", "17:100..200", "chrX:1000-2000"]
+SPECIES = ["human", "Mouse", " HUMAN "]
+INVALID_REGIONS = ["chr1:0-5", "chr1:200-100", "not a region"]
+
+
+def train(iterations: int) -> None:
+    """Run every validator iterations times"""
+    species_info = validate.validate_species.__wrapped__
+    parse_region = validate.parse_genomic_coordinates.__wrapped__
+    gene_inputs = validate._validate_gene_design_inputs.__wrapped__
+    region_inputs = validate._validate_region_design_inputs.__wrapped__
+
+    workloads = [
+        ("validate_species", lambda i: species_info(SPECIES[i % len(SPECIES)])),
+        ("validate_gene_symbol", lambda i: validate.validate_gene_symbol(GENES[i % len(GENES)])),
+        ("parse_genomic_coordinates", lambda i: parse_region(REGIONS[i % len(REGIONS)])),
+        ("validate_top_n", lambda i: validate.validate_top_n(i % 100 + 1)),
+        ("validate_design_inputs (gene)", lambda i: gene_inputs(
+            GENES[i % len(GENES)], SPECIES[i % len(SPECIES)], 5)),
+        ("validate_design_inputs (region)", lambda i: region_inputs(
+            REGIONS[i % len(REGIONS)], SPECIES[i % len(SPECIES)], 5)),
+    ]
+
+    for name, workload in workloads:
+        start = time.perf_counter()
+        for i in range(iterations):
+            workload(i)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<36} {elapsed / iterations * 1e6:8.3f} us/call")
+
+    # Error paths are part of the profile too, at a lower rate
+    error_iterations = iterations // 10
+    start = time.perf_counter()
+    for i in range(error_iterations):
+        try:
+            parse_region(INVALID_REGIONS[i % len(INVALID_REGIONS)])
+        except InvalidInputError:
+            pass
+    elapsed = time.perf_counter() - start
+    name = "parse_genomic_coordinates (invalid)"
+    print(f"{name:<36} {elapsed / error_iterations * 1e6:8.3f} us/call")
+
+
+if __name__ == "__main__":
+    train(int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS)